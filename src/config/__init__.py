@@ -25,6 +25,21 @@ class Settings(BaseSettings):
     AWS_SECRET_KEY: str
     AWS_REGION: str
     BUCKET_NAME: str
+    PLACE_CATALOG_TTL_SECONDS: int = 600
+    PLACE_DISTANCE_TABLE_PATH: str = "data/place_distances.bin"
+    ROUTE_EXECUTOR_KIND: str = "thread"  # thread | process
+    ROUTE_EXECUTOR_WORKERS: int = 4
+    ROUTE_EXECUTOR_MAX_PENDING: int = 32
+    ROUTE_EXECUTOR_TIMEOUT_SECONDS: float = 10
+    ROUTE_CACHE_MAX_ENTRIES: int = 1024  # 0이면 캐시 사용 안 함
+    ROUTE_CACHE_TTL_SECONDS: int = 600
+    ROUTE_CACHE_VARIANTS: int = 8  # seed 없는 요청에 돌려가며 줄 일정 수
+    PLACE_CLUSTER_COUNT: int = 24
+    ROUTE_CLUSTER_SAMPLING: bool = True  # 관광지를 가까운 클러스터 안에서 뽑음
+    REVIEW_COUNT_TTL_SECONDS: int = 60  # 리뷰 전체 개수를 백그라운드에서 다시 세는 주기
+    COMMENT_COUNT_RECONCILE_HOURS: int = 6  # 리뷰의 comment_count를 실제 댓글 수와 맞추는 주기
+    REVIEW_CACHE_MAX_ENTRIES: int = 1024  # 0이면 리뷰 상세 캐시 사용 안 함
+    REVIEW_CACHE_TTL_SECONDS: int = 300
 
     class Config:
         env_file = ".env.dev"
@@ -5,6 +5,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer
 
+from src.config import settings
 from src.reviews.repo.review_repo import ReviewRepo
 from src.reviews.router.comment_router import comment_router
 from src.reviews.router.image_router import image_router
@@ -12,6 +13,9 @@ from src.reviews.router.review_router import review_router
 from src.reviews.router.websocket_router import websocket_router
 from src.reviews.services.image_utils import start_scheduler, stop_scheduler
 from src.travel.router.travel_router import router as travel_router
+from src.travel.services.distance_table import distance_tables
+from src.travel.services.place_catalog import place_catalog
+from src.travel.services.route_executor import route_executor
 from src.user.router.router import router
 
 
@@ -23,10 +27,24 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     review_repo = ReviewRepo()  # ReviewRepo 인스턴스 생성
     start_scheduler(review_repo)  # 스케줄러 시작
 
+    # 미리 계산한 거리 표 로드 (없으면 요청마다 거리를 계산)
+    try:
+        distance_tables.load(settings.PLACE_DISTANCE_TABLE_PATH)
+    except Exception as e:
+        print(f"Failed to load distance table: {e}")
+
+    # 장소 캐시 미리 로드 (실패하면 첫 요청에서 다시 시도)
+    try:
+        snapshot = await place_catalog.reload()
+        route_executor.start(snapshot)
+    except Exception as e:
+        print(f"Failed to load place catalog: {e}")
+
     yield  # lifespan의 중간 작업 실행
 
     # 종료 이벤트
     stop_scheduler()  # 스케줄러 종료
+    route_executor.shutdown()  # 경로 생성 풀 종료
     print("Lifespan ended")  # 디버깅용
 
 
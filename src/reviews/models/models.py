@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Any, List, Optional
 
 from sqlalchemy import Column, DateTime
 from sqlalchemy import Enum as SqlEnum
-from sqlalchemy import Text, UniqueConstraint, func
+from sqlalchemy import Index, Text, UniqueConstraint, func
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -54,6 +54,14 @@ if TYPE_CHECKING:
 
 class Review(SQLModel, table=True):
     __tablename__ = "reviews"
+    # 피드 정렬 컬럼별 (정렬 값, id) 인덱스. 커서 페이지네이션이 이 위치에서 바로 이어서 읽음
+    __table_args__ = (
+        Index("ix_reviews_comment_count_id", "comment_count", "id"),
+        Index("ix_reviews_created_at_id", "created_at", "id"),
+        Index("ix_reviews_like_count_id", "like_count", "id"),
+        Index("ix_reviews_rating_id", "rating", "id"),
+        Index("ix_reviews_title_id", "title", "id"),
+    )
 
     id: int = Field(default=None, primary_key=True)
     user_id: str = Field(foreign_key="users.id", nullable=False)
@@ -61,7 +69,10 @@ class Review(SQLModel, table=True):
     title: str = Field(max_length=255, nullable=False)
     rating: float = Field(nullable=False)  # 범위 제약은 애플리케이션 레벨에서 처리
     content: str = Field(default=None, sa_column=Column(Text, nullable=False))  # Pydantic 기본값
-    like_count: int = Field(default=0, nullable=True)
+    # NULL이면 (like_count, id) 비교에서 빠지므로 항상 값이 있어야 함
+    like_count: int = Field(default=0, nullable=False, sa_column_kwargs={"server_default": "0"})
+    # 댓글을 작성/삭제할 때 같은 트랜잭션에서 함께 갱신 (CommentRepo)
+    comment_count: int = Field(default=0, nullable=False, sa_column_kwargs={"server_default": "0"})
     thumbnail: Optional[str] = Field(nullable=True)
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(KST),
@@ -76,12 +87,13 @@ class Review(SQLModel, table=True):
     )
 
     # 관계 정의
+    # 컬렉션은 기본으로 읽지 않음. 필요한 API에서만 selectinload 등으로 명시해서 읽음 (그 외 접근은 에러)
     images: List["ReviewImage"] = Relationship(
-        back_populates="review", sa_relationship_kwargs={"lazy": "joined", "cascade": "all, delete-orphan"}
+        back_populates="review", sa_relationship_kwargs={"lazy": "raise", "cascade": "all, delete-orphan"}
     )
-    likes: List["Like"] = Relationship(back_populates="review", sa_relationship_kwargs={"lazy": "joined"})
+    likes: List["Like"] = Relationship(back_populates="review", sa_relationship_kwargs={"lazy": "raise"})
     comments: List["Comment"] = Relationship(
-        back_populates="review", sa_relationship_kwargs={"lazy": "joined", "cascade": "all, delete-orphan"}
+        back_populates="review", sa_relationship_kwargs={"lazy": "raise", "cascade": "all, delete-orphan"}
     )
     user: Optional["User"] = Relationship(back_populates="review", sa_relationship_kwargs={"lazy": "select"})
     travel_route: Optional["TravelRoute"] = Relationship(back_populates="reviews")
@@ -1,7 +1,7 @@
 from typing import List, Optional
 
 from fastapi import Depends, HTTPException
-from sqlalchemy import Integer, cast, delete, select
+from sqlalchemy import Integer, cast, delete, exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src import Like  # type: ignore
@@ -20,6 +20,13 @@ class LikeRepo:
         like = await self.session.execute(select(Like).where(Like.review_id == review_id, Like.user_id == user_id))
         return like.scalars().one_or_none()
 
+    async def exists(self, review_id: int, user_id: str) -> bool:
+        # (user_id, review_id) 유니크 인덱스로 한 행만 확인
+        result = await self.session.execute(
+            select(exists().where(Like.review_id == review_id, Like.user_id == user_id))
+        )
+        return bool(result.scalar())
+
     async def get_by_review_id(self, review_id: int) -> list[Like]:
         async with self.session as session:
             likes = await session.execute(select(Like).where(Like.review_id == review_id))
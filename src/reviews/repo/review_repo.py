@@ -2,12 +2,13 @@ from datetime import datetime
 from typing import List, Optional, Sequence
 
 from fastapi import Depends, HTTPException
-from sqlalchemy import Integer, and_, cast, select
+from sqlalchemy import Integer, and_, cast, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src import TravelRoute  # type: ignore
 from src.config.database.connection_async import get_async_session
 from src.reviews.models.models import Comment, ImageSourceType, Review, ReviewImage
+from src.reviews.services.review_cache import review_cache
 
 
 class ReviewRepo:
@@ -18,6 +19,7 @@ class ReviewRepo:
         self.session.add(review)
         await self.session.commit()
         await self.session.refresh(review)
+        await review_cache.invalidate(review.id)
         return review
 
     async def get_review_by_id(self, review_id: int) -> Optional[Review]:
@@ -48,6 +50,12 @@ class ReviewRepo:
     async def delete_review(self, review: Review) -> None:
         await self.session.delete(review)
         await self.session.commit()
+        await review_cache.invalidate(review.id)
+
+    async def invalidate_user_reviews(self, user_id: str) -> None:
+        # 캐시한 리뷰 상세에 작성자 닉네임이 들어 있으므로 닉네임을 바꾸면 호출
+        result = await self.session.execute(select(Review.id).where(Review.user_id == user_id))  # type: ignore
+        await review_cache.invalidate_many(result.scalars().all())
 
     async def get_review_like_count(self, like_count: int) -> Optional[Review]:
         result = await self.session.execute(select(Review).filter_by(like_count=like_count))
@@ -59,6 +67,7 @@ class ReviewRepo:
             review.like_count += 1
             await self.session.commit()
             await self.session.refresh(review)
+            await review_cache.invalidate(review_id)
         return review
 
     async def delete_review_like(self, review_id: int) -> Optional[Review]:
@@ -67,6 +76,7 @@ class ReviewRepo:
             review.like_count -= 1
             await self.session.commit()
             await self.session.refresh(review)
+            await review_cache.invalidate(review_id)
         return review
 
     # 이미지 저장
@@ -117,6 +127,22 @@ class ReviewRepo:
         # 결과 반환
         return [row[0] for row in result.all()]
 
+    async def reconcile_comment_counts(self) -> int:
+        """
+        comment_count가 실제 댓글 수와 다른 리뷰를 고치고, 고친 리뷰 수를 반환합니다.
+        """
+        actual = func.coalesce(
+            select(func.count(Comment.id)).where(Comment.review_id == Review.id).scalar_subquery(), 0  # type: ignore
+        )
+        result = await self.session.execute(
+            update(Review)
+            .where(Review.comment_count != actual)  # type: ignore
+            .values(comment_count=actual)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        return result.rowcount
+
     async def get_travel_route_by_id(self, travel_route_id: int) -> Optional[TravelRoute]:
         """
         travel_route_id에 해당하는 TravelRoute를 조회합니다.
@@ -133,9 +159,24 @@ class CommentRepo:
         self.session = session
 
     async def create_comment(self, comment: Comment) -> Optional[Comment]:
+        # 댓글 저장과 리뷰의 댓글 수 증가를 한 트랜잭션으로 처리
+        self.session.add(comment)
+        await self.session.execute(
+            update(Review)
+            .where(Review.id == comment.review_id)  # type: ignore
+            .values(comment_count=Review.comment_count + 1)
+        )
+        await self.session.commit()
+        await self.session.refresh(comment)
+        await review_cache.invalidate(comment.review_id)
+        return comment
+
+    async def update_comment(self, comment: Comment) -> Optional[Comment]:
+        # 내용만 바뀌므로 댓글 수는 그대로
         self.session.add(comment)
         await self.session.commit()
         await self.session.refresh(comment)
+        await review_cache.invalidate(comment.review_id)
         return comment
 
     async def get_comment_by_id(self, comment_id: int) -> Optional[Comment]:
@@ -155,7 +196,13 @@ class CommentRepo:
         if comment:
             print(comment_id)
             await self.session.delete(comment)
+            await self.session.execute(
+                update(Review)
+                .where(Review.id == comment.review_id)  # type: ignore
+                .values(comment_count=func.greatest(Review.comment_count - 1, 0))
+            )
             await self.session.commit()
+            await review_cache.invalidate(comment.review_id)
 
 
 # 상태 관리 클래스
@@ -150,7 +150,7 @@ async def update_comment(
     comment.content = body.content
     comment.updated_at = datetime.now()
 
-    await comment_repo.create_comment(comment=comment)
+    await comment_repo.update_comment(comment=comment)
     return UpdateCommentResponse(
         comment_id=comment.id,
         nickname=user.nickname,
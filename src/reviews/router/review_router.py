@@ -3,7 +3,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
-from sqlalchemy import Integer, String, cast, func
+from sqlalchemy import Integer, String, cast, literal, tuple_
 from sqlalchemy.orm import joinedload
 from sqlalchemy.sql import select
 
@@ -19,15 +19,21 @@ from src.reviews.dtos.response import (
 )
 from src.reviews.models.models import (
     KST,
-    Comment,
     ImageSourceType,
     Like,
     Review,
     ReviewImage,
 )
+from src.reviews.repo.like_repo import LikeRepo
 from src.reviews.repo.review_repo import ReviewRepo
 from src.reviews.services.image_utils import handle_image_urls, s3_client
-from src.reviews.services.review_utils import validate_order_by
+from src.reviews.services.review_cache import review_cache
+from src.reviews.services.review_count import review_counter
+from src.reviews.services.review_utils import (
+    decode_review_cursor,
+    encode_review_cursor,
+    validate_order_by,
+)
 from src.travel.models.enums import RegionEnum, ThemeEnum
 from src.user.models.models import User
 from src.user.repo.repository import UserRepository
@@ -113,6 +119,7 @@ async def create_review(
     saved_review = await review_repo.save_review(new_review)
     if saved_review is None:
         raise HTTPException(status_code=404, detail="Saved review not found")
+    review_counter.adjust(1)
 
     # # 이미지를 리뷰에 연결하기 위한 추가 로직
     # if review_images:
@@ -181,7 +188,20 @@ async def get_review_handler(
     user_id: Optional[str] = Depends(authenticate_optional),
     review_repo: ReviewRepo = Depends(),
 ) -> GetReviewResponse:
+    # 리뷰 내용은 캐시에서 읽고, 사용자마다 다른 좋아요 여부만 따로 확인
+    response = await review_cache.get_or_load(review_id, lambda: load_review_response(review_id, review_repo))
+
+    # 현재 사용자가 좋아요 했는지 확인 (좋아요 목록을 읽지 않고 한 행만 확인)
+    liked_by_user = False
+    if user_id:  # 로그인한 사용자에 대해서만 확인
+        liked_by_user = await LikeRepo(review_repo.session).exists(review_id=review_id, user_id=user_id)
+    return response.model_copy(update={"liked_by_user": liked_by_user})
+
 
+async def load_review_response(review_id: int, review_repo: ReviewRepo) -> GetReviewResponse:
+    """
+    리뷰, 작성자, 여행 경로와 장소 이름을 읽어 응답을 만듭니다. (liked_by_user는 False)
+    """
     query = (
         select(Review)
         .where(cast(Review.id, Integer) == review_id)
@@ -222,10 +242,6 @@ async def get_review_handler(
     if review.travel_route is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Travel route not found")
 
-    # 현재 사용자가 좋아요 했는지 확인
-    liked_by_user = False
-    if user_id:  # 로그인한 사용자에 대해서만 확인
-        liked_by_user = any(like.user_id == user_id for like in review.likes)
     place_names = []
     for i in review.travel_route.travel_route_places:
         place_names.append(i.place.name)
@@ -238,8 +254,7 @@ async def get_review_handler(
         title=review.title,
         rating=review.rating,
         content=review.content,
-        like_count=len(review.likes),  # 좋아요 수
-        liked_by_user=liked_by_user,  # 현재 사용자가 좋아요 했는지 여부
+        like_count=review.like_count or 0,  # 좋아요 수 (좋아요/취소할 때 함께 갱신되는 값)
         regions=regions,
         travel_route=place_names,
         themes=themes,
@@ -265,7 +280,12 @@ async def get_all_review_handler(
     order_by: str = Query("created_at", description="정렬 기준 (created_at, title, comment_count, like_count)"),
     order: str = Query("desc", description="정렬 방향 (asc or desc)"),
     review_repo: ReviewRepo = Depends(),
+    cursor: Optional[str] = None,
 ) -> Dict[str, Any]:
+    """
+    page로 조회하거나, 이전 응답의 next_cursor를 넘기면 그 다음부터 조회합니다.
+    커서로 조회하면 OFFSET 없이 (정렬 컬럼, id) 인덱스 위치에서 바로 이어서 읽으므로 깊은 페이지도 느려지지 않습니다.
+    """
     # 리뷰와 좋아요 개수 계산 서브 쿼리
     # like_count_subquery = (
     #     select(cast(Review.id, Integer), func.count("*").label("like_count"))
@@ -273,40 +293,27 @@ async def get_all_review_handler(
     #     .group_by(cast(Review.id, Integer))
     #     .subquery()
     # )
-    # 댓글 개수 계산 서브 쿼리
-    comment_count_subquery = (
-        select(
-            cast(Review.id, Integer).label("review_id"), func.count(Comment.id).label("comment_count")  # type: ignore
-        )
-        .outerjoin(Comment, Comment.review_id == Review.id)  # type: ignore
-        .group_by(cast(Review.id, Integer))
-        .subquery()
-    )
-
-    # 리뷰와 좋아요 개수를 조인
-    query = (
-        select(
-            Review.id.label("review_id"),  # type: ignore
-            Review.user_id.label("user_id"),  # type: ignore
-            Review.title.label("title"),  # type: ignore
-            Review.rating.label("rating"),  # type: ignore
-            User.nickname.label("nickname"),  # type: ignore
-            Review.created_at.label("created_at"),  # type: ignore
-            Review.like_count.label("like_count"),  # type: ignore
-            func.coalesce(comment_count_subquery.c.comment_count, 0).label("comment_count"),  # COALESCE 처리
-            Review.thumbnail.label("thumbnail"),  # type: ignore
-        )
-        .join(User, User.id == Review.user_id)  # type: ignore
-        .outerjoin(comment_count_subquery, cast(Review.id, Integer) == comment_count_subquery.c.review_id)
-        # .outerjoin(like_count_subquery, cast(Review.id, Integer) == like_count_subquery.c.id)
+    # 리뷰와 작성자 닉네임을 조인 (좋아요/댓글 수는 리뷰에 저장된 값 사용)
+    query = select(
+        Review.id.label("review_id"),  # type: ignore
+        Review.user_id.label("user_id"),  # type: ignore
+        Review.title.label("title"),  # type: ignore
+        Review.rating.label("rating"),  # type: ignore
+        User.nickname.label("nickname"),  # type: ignore
+        Review.created_at.label("created_at"),  # type: ignore
+        Review.like_count.label("like_count"),  # type: ignore
+        Review.comment_count.label("comment_count"),  # type: ignore
+        Review.thumbnail.label("thumbnail"),  # type: ignore
+    ).join(
+        User, User.id == Review.user_id  # type: ignore
     )
 
-    # 정렬 컬럼 및 방향 설정
+    # 정렬 컬럼 및 방향 설정 (값이 같으면 id 순)
     valid_order_by_columns = ["created_at", "title", "like_count", "comment_count", "rating"]
     if order_by == "like_count":
         order_column = Review.like_count
     elif order_by == "comment_count":
-        order_column = comment_count_subquery.c.comment_count  # type:ignore
+        order_column = Review.comment_count
     elif order_by == "rating":
         order_column = Review.rating  # type: ignore
     elif order_by in valid_order_by_columns:
@@ -314,20 +321,29 @@ async def get_all_review_handler(
     else:
         raise HTTPException(status_code=400, detail=f"Invalid order_by field: {order_by}")
 
-    if order.lower() == "asc":
-        query = query.order_by(order_column.asc())  # type:ignore
+    ascending = order.lower() == "asc"
+    if ascending:
+        query = query.order_by(order_column.asc(), Review.id.asc())  # type:ignore
     else:
-        query = query.order_by(order_column.desc())  # type:ignore
+        query = query.order_by(order_column.desc(), Review.id.desc())  # type:ignore
 
-    # 총 리뷰 개수 계산
-    total_reviews_result = await review_repo.session.execute(select(func.count()).select_from(Review))
-    total_reviews = total_reviews_result.unique().scalar_one_or_none() or 0
+    # 총 리뷰 개수는 캐시한 값 사용 (요청마다 전체를 세지 않음)
+    total_reviews = await review_counter.get(review_repo.session)
 
-    # 페이지네이션 처리
-    offset = (page - 1) * size
-    paginated_query = query.offset(offset).limit(size)
-    result = await review_repo.session.execute(paginated_query)
+    # 페이지네이션 처리 (다음 페이지가 있는지 보려고 하나 더 읽음)
+    if cursor:
+        value, review_id = decode_review_cursor(cursor, order_by, order)
+        position, boundary = tuple_(order_column, Review.id), tuple_(literal(value), literal(review_id))  # type: ignore
+        query = query.where(position > boundary if ascending else position < boundary)
+    else:
+        query = query.offset((page - 1) * size)
+    result = await review_repo.session.execute(query.limit(size + 1))
     reviews = result.unique().mappings().all()
+    next_cursor = None
+    if len(reviews) > size:
+        reviews = reviews[:size]
+        last = reviews[-1]
+        next_cursor = encode_review_cursor(order_by, order, last[order_by], last["review_id"])
     # 리뷰 데이터 구성
     review_data = [
         {
@@ -344,10 +360,11 @@ async def get_all_review_handler(
         for review in reviews
     ]
     return {
-        "page": page,
+        "page": None if cursor else page,
         "size": size,
         "total_pages": (total_reviews + size - 1) // size,
         "total_reviews": total_reviews,
+        "next_cursor": next_cursor,
         "reviews": review_data,
     }
 
@@ -409,6 +426,7 @@ async def update_review_handler(
     for url in uploaded_urls:
         # 업로드된 이미지가 URL로 제공되면 ReviewImage 객체로 처리
         review_image = ReviewImage(
+            review_id=review.id,
             filepath=url,
             source_type=ImageSourceType.LINK,  # 업로드된 이미지의 경우 링크로 저장
             user_id=user_id,
@@ -430,8 +448,8 @@ async def update_review_handler(
                 detail=f"Failed to delete image: {str(e)}",
             )
 
-    # 리뷰에 업로드된 이미지 연결
-    review.images.extend(review_images)
+    # 리뷰에 업로드된 이미지 연결 (기존 이미지 목록은 읽지 않음)
+    review_repo.session.add_all(review_images)
 
     # 리뷰 저장
     await review_repo.save_review(review)
@@ -482,5 +500,6 @@ async def delete_review_handler(
         await review_repo.delete_image(image.id)
 
     await review_repo.delete_review(review)
+    review_counter.adjust(-1)
 
     return {"message": "Review deleted"}
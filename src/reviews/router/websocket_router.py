@@ -17,6 +17,7 @@ from src import Comment, Like, Review  # type:ignore
 from src.config.database.connection_async import get_async_session
 from src.reviews.repo.like_repo import LikeRepo
 from src.reviews.repo.review_repo import CommentRepo, ReviewRepo
+from src.reviews.services.review_cache import review_cache
 from src.user.services.authentication import websocket_authenticate
 
 websocket_router = APIRouter()
@@ -90,6 +91,7 @@ async def like_websocket_endpoint(
                             )
                             await async_session.refresh(review)
                             await async_session.commit()
+                            await review_cache.invalidate(int(data.get("review_id")))
                             data["like_count"] = review.like_count  # type:ignore
                         except Exception as e:
                             print(e)
@@ -109,6 +111,7 @@ async def like_websocket_endpoint(
                                 )
                                 await async_session.refresh(review)
                                 await async_session.commit()
+                                await review_cache.invalidate(int(data.get("review_id")))
                                 data["like_count"] = review.like_count  # type:ignore
                             except Exception as e:
                                 print(e)
@@ -130,7 +133,7 @@ async def like_websocket_endpoint(
                     elif data.get("method") == "PATCH":
                         comment = await comment_repo.get_comment_by_id(comment_id=int(data.get("comment_id")))
                         comment.content = data.get("content")
-                        await comment_repo.create_comment(comment)
+                        await comment_repo.update_comment(comment)
                     elif data.get("method") == "DELETE":
                         await comment_repo.delete_comment(int(data.get("comment_id")))
                         data["review_id"] = review_id
@@ -16,6 +16,7 @@ from sqlalchemy import select
 
 from src import KST
 from src.config import settings
+from src.config.database.connection_async import AsyncSessionFactory
 from src.reviews.dtos.response import ReviewImageResponse
 from src.reviews.models.models import ImageSourceType, Review, ReviewImage
 from src.reviews.repo import review_repo
@@ -275,6 +276,16 @@ async def cleanup_temporary_images(image_repo: ReviewRepo) -> None:
             print(f"Failed to cleanup image {image.id}: {e}")
 
 
+async def reconcile_comment_counts() -> None:
+    """
+    리뷰의 comment_count를 실제 댓글 수와 맞춤 (갱신이 빠졌거나 DB를 직접 수정한 경우 대비)
+    """
+    async with AsyncSessionFactory() as session:
+        fixed = await ReviewRepo(session).reconcile_comment_counts()
+    if fixed:
+        print(f"Reconciled comment_count of {fixed} reviews")
+
+
 def start_scheduler(image_repo: ReviewRepo) -> None:
     """
     스케줄러 시작 함수
@@ -290,6 +301,7 @@ def start_scheduler(image_repo: ReviewRepo) -> None:
         hours=1,
         kwargs={"image_repo": image_repo},
     )
+    scheduler.add_job(reconcile_comment_counts, "interval", hours=settings.COMMENT_COUNT_RECONCILE_HOURS)
     scheduler.start()
     print("Scheduler started")
 
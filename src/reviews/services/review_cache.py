@@ -0,0 +1,116 @@
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Iterable, Protocol
+
+from src.config import settings
+from src.reviews.dtos.response import GetReviewResponse
+
+
+class ReviewCacheBackend(Protocol):
+    """
+    리뷰 상세 캐시 저장소. 기본은 프로세스 안의 LRU이고, 외부 캐시(Redis 등)를 쓰려면
+    같은 메서드를 가진 어댑터를 만들어 ReviewCache에 넘깁니다. (직렬화는 어댑터가 담당)
+    """
+
+    async def get(self, review_id: int) -> GetReviewResponse | None: ...
+
+    async def set(self, review_id: int, response: GetReviewResponse) -> None: ...
+
+    async def delete(self, review_id: int) -> None: ...
+
+
+class LRUReviewCacheBackend:
+    """
+    프로세스 안의 LRU + TTL 저장소. 여러 워커를 띄우면 워커마다 따로 가집니다.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[int, tuple[float, GetReviewResponse]] = OrderedDict()
+        self.evictions = 0
+        self.expirations = 0
+
+    async def get(self, review_id: int) -> GetReviewResponse | None:
+        entry = self._entries.get(review_id)
+        if entry is None:
+            return None
+        created_at, response = entry
+        if time.monotonic() - created_at >= self.ttl_seconds:
+            del self._entries[review_id]
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(review_id)
+        return response
+
+    async def set(self, review_id: int, response: GetReviewResponse) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[review_id] = (time.monotonic(), response)
+        self._entries.move_to_end(review_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def delete(self, review_id: int) -> None:
+        self._entries.pop(review_id, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ReviewCache:
+    """
+    리뷰 상세 응답(GetReviewResponse)의 read-through 캐시.
+    - 사용자마다 다른 liked_by_user는 빼고 저장하고, 요청마다 따로 채웁니다.
+    - 리뷰/댓글/좋아요를 바꾸는 곳에서 invalidate()를 호출합니다.
+    - 작성자 닉네임도 함께 저장하므로 닉네임을 바꾸면 그 사용자의 리뷰를 invalidate_many()로 지웁니다.
+    """
+
+    def __init__(self, backend: ReviewCacheBackend) -> None:
+        self.backend = backend
+        # 읽는 도중 무효화가 있었으면 오래된 값일 수 있으므로 저장하지 않음
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    async def get_or_load(self, review_id: int, load: Callable[[], Awaitable[GetReviewResponse]]) -> GetReviewResponse:
+        cached = await self.backend.get(review_id)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        generation = self._generation
+        response = await load()
+        if self._generation == generation:
+            await self.backend.set(review_id, response.model_copy(update={"liked_by_user": False}))
+        return response
+
+    async def invalidate(self, review_id: int) -> None:
+        self._generation += 1
+        self.invalidations += 1
+        await self.backend.delete(review_id)
+
+    async def invalidate_many(self, review_ids: Iterable[int]) -> None:
+        self._generation += 1
+        for review_id in review_ids:
+            self.invalidations += 1
+            await self.backend.delete(review_id)
+
+    def stats(self) -> dict[str, int | float]:
+        requests = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / requests if requests else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+
+review_cache = ReviewCache(
+    LRUReviewCacheBackend(
+        max_entries=settings.REVIEW_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.REVIEW_CACHE_TTL_SECONDS,
+    )
+)
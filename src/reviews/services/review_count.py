@@ -0,0 +1,66 @@
+import asyncio
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import settings
+from src.config.database.connection_async import AsyncSessionFactory
+from src.reviews.models.models import Review
+
+
+class ReviewCounter:
+    """
+    리뷰 목록의 전체 개수 캐시.
+    - 처음 한 번만 요청 세션으로 COUNT(*)를 실행하고, 이후에는 캐시한 값을 바로 돌려줍니다.
+    - TTL이 지나면 값은 그대로 돌려주고 백그라운드에서 다시 셉니다.
+    - 리뷰를 작성/삭제하면 adjust()로 바로 반영하므로 다시 세기 전에도 크게 어긋나지 않습니다.
+    """
+
+    def __init__(
+        self, ttl_seconds: float, session_factory: async_sessionmaker[AsyncSession] = AsyncSessionFactory
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.session_factory = session_factory
+        self._count: int | None = None
+        self._counted_at = 0.0
+        self._refresh_task: asyncio.Task[int] | None = None
+        self.refreshes = 0
+
+    async def get(self, session: AsyncSession) -> int:
+        if self._count is None:
+            return await self._count_with(session)
+        if time.monotonic() - self._counted_at >= self.ttl_seconds and self._refresh_task is None:
+            # 요청은 기다리지 않고 캐시한 값을 씀
+            self._refresh_task = asyncio.create_task(self.refresh())
+            self._refresh_task.add_done_callback(self._refresh_done)
+        return self._count
+
+    async def refresh(self) -> int:
+        async with self.session_factory() as session:
+            return await self._count_with(session)
+
+    def _refresh_done(self, task: asyncio.Task[int]) -> None:
+        self._refresh_task = None
+        if not task.cancelled() and task.exception() is not None:
+            print(f"Failed to refresh review count: {task.exception()}")
+
+    async def _count_with(self, session: AsyncSession) -> int:
+        result = await session.execute(select(func.count()).select_from(Review))
+        self._count = result.scalar_one()
+        self._counted_at = time.monotonic()
+        self.refreshes += 1
+        return self._count
+
+    def adjust(self, delta: int) -> None:
+        if self._count is not None:
+            self._count = max(0, self._count + delta)
+
+    def invalidate(self) -> None:
+        """
+        다음 get()에서 요청 세션으로 다시 셉니다.
+        """
+        self._count = None
+
+
+review_counter = ReviewCounter(ttl_seconds=settings.REVIEW_COUNT_TTL_SECONDS)
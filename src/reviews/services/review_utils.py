@@ -1,3 +1,5 @@
+import base64
+import json
 import shutil
 from datetime import datetime
 from pathlib import Path
@@ -15,3 +17,48 @@ def validate_order_by(order_by: str, valid_columns: Set[str]) -> Any:
     if order_by not in valid_columns:
         raise HTTPException(status_code=400, detail=f"Invalid order_by value: {order_by}")
     return getattr(Review, order_by)
+
+
+def encode_review_cursor(order_by: str, order: str, value: Any, review_id: int) -> str:
+    """
+    리뷰 목록 키셋 페이지네이션 위치(정렬 컬럼 값, id)를 클라이언트에 넘길 문자열로 만듭니다.
+    정렬 기준도 함께 넣어서 다른 정렬로 만든 커서는 거부합니다.
+    """
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps([order_by, order, value, review_id], ensure_ascii=False)
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+# 정렬 컬럼별 커서 값의 JSON 타입. 다른 타입이 DB 비교까지 가면 500이 되므로 미리 거부
+CURSOR_VALUE_TYPES: dict[str, tuple[type, ...]] = {
+    "created_at": (str,),
+    "title": (str,),
+    "like_count": (int,),
+    "comment_count": (int,),
+    "rating": (int, float),
+}
+
+
+def decode_review_cursor(cursor: str, order_by: str, order: str) -> tuple[Any, int]:
+    try:
+        cursor_order_by, cursor_order, value, review_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if (cursor_order_by, cursor_order) != (order_by, order) or not _is_cursor_int(review_id):
+            raise ValueError(cursor)
+        value_types = CURSOR_VALUE_TYPES.get(order_by)
+        if value_types is None or isinstance(value, bool) or not isinstance(value, value_types):
+            raise ValueError(cursor)
+        if value_types == (int,) and not _is_cursor_int(value):
+            raise ValueError(cursor)
+        if order_by == "created_at":
+            value = datetime.fromisoformat(value)
+        elif order_by == "rating":
+            value = float(value)
+        return value, review_id
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _is_cursor_int(value: Any) -> bool:
+    # JSON의 true/false도 파이썬에서는 int이므로 제외. integer 컬럼 범위를 넘는 값도 거부
+    return isinstance(value, int) and not isinstance(value, bool) and -(2**31) <= value < 2**31
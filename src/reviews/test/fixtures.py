@@ -1,10 +1,14 @@
 from datetime import datetime, timedelta, timezone
-from typing import AsyncGenerator, Generator, Optional
+from typing import Any, AsyncGenerator, Generator, Optional
 
+import pytest
 import pytest_asyncio
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src import Review  # type: ignore
+from src.reviews.services.review_cache import LRUReviewCacheBackend, review_cache
+from src.reviews.services.review_count import review_counter
 from src.travel.models.travel_route_place import TravelRoute
 from src.user.models.models import User
 
@@ -63,4 +67,41 @@ async def setup_review(
     return await async_session.get(Review, 1)
 
 
+class StatementCounter:
+    """
+    실행된 SQL 문 수와 DB가 돌려준 행 수를 셉니다. (API별 쿼리 수 검증용)
+    """
+
+    def __init__(self) -> None:
+        self.statements = 0
+        self.rows = 0
+
+    def reset(self) -> None:
+        self.statements = 0
+        self.rows = 0
+
+    def __call__(
+        self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        self.statements += 1
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.rows += max(cursor.rowcount, 0)
+
+
+@pytest.fixture(autouse=True)
+def reset_review_caches(monkeypatch: pytest.MonkeyPatch) -> None:
+    # 테스트마다 DB를 새로 만들므로 이전 테스트에서 캐시한 리뷰 개수와 리뷰 상세를 버림
+    review_counter.invalidate()
+    monkeypatch.setattr(review_cache, "backend", LRUReviewCacheBackend(max_entries=128, ttl_seconds=60))
+
+
+@pytest.fixture(scope="function")
+def statement_counter(async_session: AsyncSession) -> Generator[StatementCounter, None, None]:
+    counter = StatementCounter()
+    engine = async_session.bind.sync_engine
+    event.listen(engine, "after_cursor_execute", counter)
+    yield counter
+    event.remove(engine, "after_cursor_execute", counter)
+
+
 KST = timezone(timedelta(hours=9))
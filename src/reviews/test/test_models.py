@@ -2,7 +2,9 @@ from typing import cast
 
 import pytest
 from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.reviews.models.models import Comment, Like, Review, ReviewImage
 from src.travel.models.travel_route_place import TravelRoute
@@ -59,8 +61,14 @@ async def test_image_relationship(
     async_session.add_all([review_image_upload, review_image_link])
     await async_session.commit()
 
+    # 로더를 지정하지 않으면 이미지를 읽지 않음
+    with pytest.raises(InvalidRequestError):
+        len(review.images)
+
     # 데이터 검증
-    result = await async_session.execute(select(Review).filter_by(title="Test Review"))
+    result = await async_session.execute(
+        select(Review).filter_by(title="Test Review").options(selectinload(Review.images))  # type: ignore
+    )
     retrieved_review = result.scalars().first()
 
     assert retrieved_review is not None
@@ -5,7 +5,8 @@ from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import select
 
-from src.reviews.models.models import Comment, Review, ReviewImage
+from src.reviews.models.models import Comment, Like, Review, ReviewImage
+from src.reviews.repo.like_repo import LikeRepo
 from src.reviews.repo.review_repo import CommentRepo, ReviewRepo
 from src.travel.models.travel_route_place import TravelRoute
 from src.user.models.models import User
@@ -129,6 +130,19 @@ async def test_delete_like(async_session: AsyncSession, sample_review: list[Revi
     assert updated_like.like_count == like - 1
 
 
+@pytest.mark.asyncio
+async def test_like_exists(async_session: AsyncSession, sample_review: list[Review]) -> None:
+    async_session.add_all(sample_review)
+    await async_session.commit()
+    async_session.add(Like(user_id=sample_review[0].user_id, review_id=sample_review[0].id))
+    await async_session.commit()
+
+    repo = LikeRepo(session=async_session)
+    assert await repo.exists(review_id=sample_review[0].id, user_id=sample_review[0].user_id)
+    assert not await repo.exists(review_id=sample_review[1].id, user_id=sample_review[0].user_id)
+    assert not await repo.exists(review_id=sample_review[0].id, user_id="unknown")
+
+
 @pytest.mark.asyncio
 async def test_save_image(async_session: AsyncSession, sample_review: list[Review]) -> None:
     async_session.add_all(sample_review)
@@ -285,4 +299,38 @@ async def test_delete_comment(async_session: AsyncSession, sample_review: list[R
     assert deleted_comment is None
 
 
+@pytest.mark.asyncio
+async def test_comment_count(async_session: AsyncSession, sample_review: list[Review]) -> None:
+    async_session.add_all(sample_review)
+    await async_session.commit()
+    review_id = sample_review[0].id
+
+    async def comment_count() -> int:
+        result = await async_session.execute(select(Review.comment_count).where(Review.id == review_id))
+        return result.scalar_one()
+
+    # 댓글 작성/삭제와 함께 리뷰의 댓글 수가 바뀜
+    repo = CommentRepo(session=async_session)
+    comments = [
+        await repo.create_comment(Comment(user_id=sample_review[0].user_id, review_id=review_id, content=f"{i}"))
+        for i in range(3)
+    ]
+    assert await comment_count() == 3
+    comment = comments[0]
+    assert comment is not None
+    comment.content = "edited"
+    await repo.update_comment(comment)
+    assert await comment_count() == 3
+    await repo.delete_comment(comment.id)
+    assert await comment_count() == 2
+
+    # 어긋난 값은 정기 작업에서 바로잡음
+    async_session.add(Comment(user_id=sample_review[0].user_id, review_id=review_id, content="direct"))
+    await async_session.commit()
+    review_repo = ReviewRepo(session=async_session)
+    assert await review_repo.reconcile_comment_counts() == 1
+    assert await comment_count() == 3
+    assert await review_repo.reconcile_comment_counts() == 0
+
+
 #
@@ -0,0 +1,160 @@
+from datetime import date, datetime
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.reviews.dtos.request import ReviewUpdateRequest
+from src.reviews.dtos.response import GetReviewResponse
+from src.reviews.models.models import Comment, Review
+from src.reviews.repo.review_repo import CommentRepo, ReviewRepo
+from src.reviews.router.review_router import get_review_handler, update_review_handler
+from src.reviews.services.review_cache import (
+    LRUReviewCacheBackend,
+    ReviewCache,
+    review_cache,
+)
+from src.user.dtos.request import UpdateUserRequest
+from src.user.models.models import User
+from src.user.repo.repository import UserRepository
+from src.user.router.router import update_user_handler
+
+
+def make_response(review_id: int, liked_by_user: bool = False) -> GetReviewResponse:
+    return GetReviewResponse(
+        review_id=review_id,
+        user_id="1",
+        nickname="test",
+        travel_route_id=1,
+        title=f"Review {review_id}",
+        rating=4.0,
+        content="content",
+        like_count=0,
+        liked_by_user=liked_by_user,
+        regions=[],
+        travel_route=[],
+        themes=[],
+        thumbnail=None,
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_lru_backend() -> None:
+    backend = LRUReviewCacheBackend(max_entries=2, ttl_seconds=60)
+    for review_id in (1, 2):
+        await backend.set(review_id, make_response(review_id))
+    assert await backend.get(1) is not None  # 1번을 최근에 사용
+    await backend.set(3, make_response(3))
+    assert await backend.get(2) is None and len(backend) == 2 and backend.evictions == 1
+
+    await backend.delete(1)
+    assert await backend.get(1) is None
+
+    # TTL이 지나면 없는 것으로 봄
+    with patch("src.reviews.services.review_cache.time.monotonic", return_value=1e12):
+        assert await backend.get(3) is None
+    assert backend.expirations == 1
+
+    disabled = LRUReviewCacheBackend(max_entries=0, ttl_seconds=60)
+    await disabled.set(1, make_response(1))
+    assert await disabled.get(1) is None
+
+
+@pytest.mark.asyncio
+async def test_read_through() -> None:
+    cache = ReviewCache(LRUReviewCacheBackend(max_entries=8, ttl_seconds=60))
+    loads = []
+
+    async def load() -> GetReviewResponse:
+        loads.append(1)
+        return make_response(1, liked_by_user=True)
+
+    assert (await cache.get_or_load(1, load)).liked_by_user
+    # 사용자별 값은 저장하지 않음
+    cached = await cache.get_or_load(1, load)
+    assert len(loads) == 1 and not cached.liked_by_user
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    await cache.invalidate(1)
+    await cache.get_or_load(1, load)
+    assert len(loads) == 2
+
+    # 읽는 도중 무효화되면 저장하지 않음
+    async def load_during_write() -> GetReviewResponse:
+        await cache.invalidate(2)
+        return make_response(2)
+
+    await cache.get_or_load(2, load_during_write)
+    assert await cache.backend.get(2) is None
+
+
+@pytest.mark.asyncio
+async def test_write_paths_invalidate(async_session: AsyncSession, setup_review: Review, setup_data: User) -> None:
+    review_repo = ReviewRepo(async_session)
+
+    async def cached_title() -> str | None:
+        response = await review_cache.backend.get(setup_review.id)
+        return response.title if response else None
+
+    async def get_review() -> GetReviewResponse:
+        return await get_review_handler(review_id=setup_review.id, user_id=None, review_repo=review_repo)
+
+    assert (await get_review()).title == "Test review"
+    assert await cached_title() == "Test review"
+
+    # 리뷰 수정
+    await update_review_handler(
+        review_id=setup_review.id,
+        body=ReviewUpdateRequest(title="Updated", content="Updated", rating=5.0, thumbnail="thumbnail"),
+        review_repo=review_repo,
+        uploaded_urls=[],
+        deleted_images=[],
+        user_id=setup_data.id,
+        user_repo=UserRepository(async_session),
+    )
+    assert await cached_title() is None
+    assert (await get_review()).title == "Updated"
+
+    # 좋아요
+    await review_repo.add_review_like(setup_review.id)
+    assert await cached_title() is None
+    assert (await get_review()).like_count == 1
+
+    # 댓글
+    comment_repo = CommentRepo(async_session)
+    comment = await comment_repo.create_comment(Comment(user_id=setup_data.id, review_id=setup_review.id, content="hi"))
+    assert comment is not None and await cached_title() is None
+    await get_review()
+    await comment_repo.delete_comment(comment.id)
+    assert await cached_title() is None
+
+    # 삭제
+    await get_review()
+    await review_repo.delete_review(setup_review)
+    assert await cached_title() is None
+
+
+@pytest.mark.asyncio
+async def test_nickname_update_invalidates(async_session: AsyncSession, setup_review: Review, setup_data: User) -> None:
+    review_repo = ReviewRepo(async_session)
+    user_repo = UserRepository(async_session)
+
+    async def get_review() -> GetReviewResponse:
+        return await get_review_handler(review_id=setup_review.id, user_id=None, review_repo=review_repo)
+
+    before = (await get_review()).nickname
+    assert await review_cache.backend.get(setup_review.id) is not None
+
+    # 닉네임이 아닌 값만 바꾸면 캐시를 그대로 둠
+    await update_user_handler(
+        user_id=setup_data.id, update_data=UpdateUserRequest(new_birthday=date(2000, 1, 1)), user_repo=user_repo
+    )
+    assert await review_cache.backend.get(setup_review.id) is not None
+
+    await update_user_handler(
+        user_id=setup_data.id, update_data=UpdateUserRequest(new_nickname=f"{before}-new"), user_repo=user_repo
+    )
+    assert await review_cache.backend.get(setup_review.id) is None
+    assert (await get_review()).nickname == f"{before}-new"
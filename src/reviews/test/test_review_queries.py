@@ -0,0 +1,153 @@
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.reviews.dtos.request import CommentRequest, ReviewUpdateRequest
+from src.reviews.models.models import (
+    Comment,
+    ImageSourceType,
+    Like,
+    Review,
+    ReviewImage,
+)
+from src.reviews.repo.review_repo import CommentRepo, ReviewRepo
+from src.reviews.router.comment_router import create_comment
+from src.reviews.router.review_router import (
+    get_all_review_handler,
+    get_review_handler,
+    update_review_handler,
+)
+from src.reviews.test.fixtures import StatementCounter
+from src.travel.models.travel_route_place import TravelRoute
+from src.user.models.models import User
+from src.user.repo.repository import UserRepository
+
+"""
+API별 쿼리 수 / 읽는 행 수 테스트
+좋아요, 댓글, 이미지가 많은 리뷰에서도 필요한 것만 읽는지 확인 (예전에는 이미지 x 좋아요 x 댓글 행을 읽음)
+"""
+
+LIKES, COMMENTS, IMAGES = 30, 20, 5
+
+
+@pytest_asyncio.fixture(scope="function")
+async def popular_review(async_session: AsyncSession, setup_data: User, setup_travelroute: TravelRoute) -> Review:
+    users = [
+        User(id=str(i), email=f"user{i}@example.com", password="test", nickname=f"user{i}") for i in range(2, LIKES + 2)
+    ]
+    async_session.add_all(users)
+    review = Review(
+        id=1,
+        user_id=setup_data.id,
+        travel_route_id=setup_travelroute.id,
+        title="Popular review",
+        rating=5.0,
+        content="content",
+        like_count=LIKES,
+        comment_count=COMMENTS,
+    )
+    async_session.add(review)
+    await async_session.commit()
+    async_session.add_all([Like(user_id=user.id, review_id=review.id) for user in users])
+    async_session.add_all(
+        [Comment(user_id=users[i % LIKES].id, review_id=review.id, content=f"comment {i}") for i in range(COMMENTS)]
+    )
+    async_session.add_all(
+        [
+            ReviewImage(
+                user_id=setup_data.id,
+                review_id=review.id,
+                filepath=f"https://example.com/{i}.jpg",
+                source_type=ImageSourceType.LINK,
+            )
+            for i in range(IMAGES)
+        ]
+    )
+    await async_session.commit()
+    # 테스트 데이터를 넣으면서 세션에 올라간 객체를 버리고 DB에서 다시 읽게 함
+    async_session.expunge_all()
+    return review
+
+
+@pytest.mark.asyncio
+async def test_get_review_queries(
+    async_session: AsyncSession, popular_review: Review, statement_counter: StatementCounter
+) -> None:
+    review_repo = ReviewRepo(async_session)
+    statement_counter.reset()
+    response = await get_review_handler(review_id=popular_review.id, user_id="2", review_repo=review_repo)
+    assert response.like_count == LIKES and response.liked_by_user
+    # 리뷰(+작성자, 여행 경로) 1번, 좋아요 여부 EXISTS 1번 (좋아요 수와 상관없음)
+    assert (statement_counter.statements, statement_counter.rows) == (2, 2)
+
+    # 두 번째부터는 캐시한 내용에 좋아요 여부만 확인
+    statement_counter.reset()
+    response = await get_review_handler(review_id=popular_review.id, user_id="3", review_repo=review_repo)
+    assert response.like_count == LIKES and response.liked_by_user
+    assert (statement_counter.statements, statement_counter.rows) == (1, 1)
+    statement_counter.reset()
+    response = await get_review_handler(review_id=popular_review.id, user_id=None, review_repo=review_repo)
+    assert response.like_count == LIKES and not response.liked_by_user
+    assert statement_counter.statements == 0
+
+
+@pytest.mark.asyncio
+async def test_get_all_review_queries(
+    async_session: AsyncSession, popular_review: Review, statement_counter: StatementCounter
+) -> None:
+    review_repo = ReviewRepo(async_session)
+    await get_all_review_handler(page=1, size=10, order_by="comment_count", order="desc", review_repo=review_repo)
+    statement_counter.reset()
+    response = await get_all_review_handler(
+        page=1, size=10, order_by="comment_count", order="desc", review_repo=review_repo
+    )
+    assert response["reviews"][0]["comment_count"] == COMMENTS
+    # 전체 개수는 캐시, 목록은 리뷰당 한 행
+    assert (statement_counter.statements, statement_counter.rows) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_get_review_by_id_queries(
+    async_session: AsyncSession, popular_review: Review, statement_counter: StatementCounter
+) -> None:
+    # WebSocket 좋아요 이벤트마다 실행됨
+    statement_counter.reset()
+    review = await ReviewRepo(async_session).get_review_by_id(popular_review.id)
+    assert review is not None and review.like_count == LIKES
+    assert (statement_counter.statements, statement_counter.rows) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_update_review_queries(
+    async_session: AsyncSession, popular_review: Review, statement_counter: StatementCounter
+) -> None:
+    statement_counter.reset()
+    await update_review_handler(
+        review_id=popular_review.id,
+        body=ReviewUpdateRequest(title="Updated", content="Updated", rating=4.0, thumbnail="thumbnail"),
+        review_repo=ReviewRepo(async_session),
+        uploaded_urls=["https://example.com/new.jpg"],
+        deleted_images=[],
+        user_id=popular_review.user_id,
+        user_repo=UserRepository(async_session),
+    )
+    # 사용자, 리뷰 조회 / 리뷰 수정, 이미지 추가 / 저장 후 리뷰 다시 읽기 (기존 이미지는 읽지 않음)
+    assert (statement_counter.statements, statement_counter.rows) == (5, 3)
+
+
+@pytest.mark.asyncio
+async def test_create_comment_queries(
+    async_session: AsyncSession, popular_review: Review, statement_counter: StatementCounter
+) -> None:
+    statement_counter.reset()
+    await create_comment(
+        review_id=popular_review.id,
+        body=CommentRequest(content="new comment"),
+        user_id="2",
+        user_repo=UserRepository(async_session),
+        comment_repo=CommentRepo(async_session),
+    )
+    # 사용자, 리뷰 조회 / 댓글 추가, 댓글 수 증가 / 저장 후 댓글 다시 읽기
+    assert (statement_counter.statements, statement_counter.rows) == (5, 3)
@@ -18,6 +18,8 @@ from src.reviews.router.review_router import (
     get_review_handler,
     update_review_handler,
 )
+from src.reviews.services.review_count import review_counter
+from src.reviews.services.review_utils import encode_review_cursor
 from src.reviews.test.fixtures import KST
 from src.travel.models.travel_route_place import TravelRoute
 from src.user.models.models import User
@@ -162,6 +164,8 @@ async def test_get_all_review_handler(
 
     # 레포지토리 인스턴스 생성
     review_repo = ReviewRepo(async_session)
+    # 댓글을 직접 넣었으므로 리뷰의 댓글 수를 맞춤
+    assert await review_repo.reconcile_comment_counts() == 15
 
     # 테스트 파라미터 설정
     page = 1
@@ -233,6 +237,169 @@ async def test_get_all_review_handler(
     assert len(response_page_4["reviews"]) == 0  # 데이터 없음
 
 
+@pytest.mark.asyncio
+async def test_get_all_review_handler_cursor(
+    async_session: AsyncSession,
+    setup_data: User,
+    setup_travelroute: TravelRoute,
+) -> None:
+    user = setup_data
+    now = datetime.now(KST)
+    # 정렬 값이 겹치는 리뷰들 (같은 값이면 id 순)
+    reviews = [
+        Review(
+            id=i,
+            user_id=user.id,
+            travel_route_id=setup_travelroute.id,
+            title=f"Review {i % 4}",
+            rating=float(i % 3) + 3.0,
+            like_count=i % 5,
+            content="This is a test review",
+            created_at=now - timedelta(minutes=i // 2),
+            updated_at=now,
+        )
+        for i in range(1, 14)
+    ]
+    async_session.add_all(reviews)
+    async_session.add_all(
+        [Comment(user_id=user.id, review_id=i, content="comment") for i in range(1, 14) for _ in range(i % 3)]
+    )
+    await async_session.commit()
+    review_repo = ReviewRepo(async_session)
+    await review_repo.reconcile_comment_counts()
+    review_counter.invalidate()  # 이전 테스트에서 캐시한 개수를 버림
+
+    for order_by in ["created_at", "title", "like_count", "comment_count", "rating"]:
+        for order in ["asc", "desc"]:
+            expected = await get_all_review_handler(
+                page=1, size=100, order_by=order_by, order=order, review_repo=review_repo
+            )
+            assert expected["next_cursor"] is None
+            review_ids: list[int] = []
+            response = await get_all_review_handler(
+                page=1, size=4, order_by=order_by, order=order, review_repo=review_repo
+            )
+            while True:
+                review_ids += [review["review_id"] for review in response["reviews"]]
+                if response["next_cursor"] is None:
+                    break
+                response = await get_all_review_handler(
+                    page=1,
+                    size=4,
+                    order_by=order_by,
+                    order=order,
+                    review_repo=review_repo,
+                    cursor=response["next_cursor"],
+                )
+                assert response["page"] is None and response["total_reviews"] == 13
+            assert review_ids == [review["review_id"] for review in expected["reviews"]]
+
+    # 다른 정렬로 만든 커서나 잘못된 커서는 거부
+    cursor = (await get_all_review_handler(page=1, size=4, order_by="title", order="asc", review_repo=review_repo))[
+        "next_cursor"
+    ]
+    for order_by, bad_cursor in [("rating", cursor), ("title", "not-a-cursor")]:
+        with pytest.raises(HTTPException) as exc_info:
+            await get_all_review_handler(
+                page=1, size=4, order_by=order_by, order="asc", review_repo=review_repo, cursor=bad_cursor
+            )
+        assert exc_info.value.status_code == 400
+
+    # 전체 개수는 캐시한 값을 쓰고, 백그라운드에서 다시 셈
+    async_session.add(
+        Review(id=100, user_id=user.id, travel_route_id=setup_travelroute.id, title="New", rating=5.0, content="new")
+    )
+    await async_session.commit()
+    response = await get_all_review_handler(page=1, size=4, order_by="title", order="asc", review_repo=review_repo)
+    assert response["total_reviews"] == 13
+    refreshes = review_counter.refreshes
+    assert await review_counter.get(async_session) == 13
+    assert review_counter.refreshes == refreshes
+    review_counter.adjust(1)
+    assert await review_counter.get(async_session) == 14
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "order_by, value, review_id",
+    [
+        ("like_count", "many", 1),
+        ("comment_count", 1.5, 1),
+        ("comment_count", 2**40, 1),
+        ("rating", "high", 1),
+        ("rating", True, 1),
+        ("title", 3, 1),
+        ("created_at", 1700000000, 1),
+        ("created_at", "yesterday", 1),
+        ("title", "Review", "1"),
+        ("title", "Review", None),
+    ],
+)
+async def test_get_all_review_handler_tampered_cursor(
+    async_session: AsyncSession, order_by: str, value: object, review_id: object
+) -> None:
+    # 정렬 컬럼과 타입이 맞지 않는 커서는 DB까지 가지 않고 400
+    cursor = encode_review_cursor(order_by, "asc", value, review_id)  # type: ignore
+    with pytest.raises(HTTPException) as exc_info:
+        await get_all_review_handler(
+            page=1, size=4, order_by=order_by, order="asc", review_repo=ReviewRepo(async_session), cursor=cursor
+        )
+    assert exc_info.value.status_code == 400 and exc_info.value.detail == "Invalid cursor"
+
+
+@pytest.mark.asyncio
+async def test_get_all_review_handler_cursor_without_like_count(
+    async_session: AsyncSession,
+    setup_data: User,
+    setup_travelroute: TravelRoute,
+) -> None:
+    # like_count 없이 저장된 리뷰도 0으로 채워져 좋아요 순 커서 페이지에서 빠지지 않음
+    await async_session.execute(
+        insert(Review),
+        [
+            {
+                "id": i,
+                "user_id": setup_data.id,
+                "travel_route_id": setup_travelroute.id,
+                "title": f"Review {i}",
+                "rating": 4.0,
+                "content": "This is a test review",
+            }
+            for i in range(1, 8)
+        ],
+    )
+    await async_session.commit()
+    review_repo = ReviewRepo(async_session)
+    for order in ["asc", "desc"]:
+        review_ids: list[int] = []
+        cursor = None
+        while True:
+            response = await get_all_review_handler(
+                page=1, size=3, order_by="like_count", order=order, review_repo=review_repo, cursor=cursor
+            )
+            review_ids += [review["review_id"] for review in response["reviews"]]
+            assert all(review["like_count"] == 0 for review in response["reviews"])
+            cursor = response["next_cursor"]
+            if cursor is None:
+                break
+        assert review_ids == sorted(range(1, 8), reverse=order == "desc")
+
+    # like_count에 NULL은 저장할 수 없음
+    with pytest.raises(IntegrityError):
+        await async_session.execute(
+            insert(Review).values(
+                id=100,
+                user_id=setup_data.id,
+                travel_route_id=setup_travelroute.id,
+                title="Null",
+                rating=4.0,
+                content="null",
+                like_count=None,
+            )
+        )
+    await async_session.rollback()
+
+
 """
 # 리뷰 수정 테스트
 """
@@ -1,3 +1,5 @@
+from datetime import time
+
 from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 
 from src.travel.models.enums import RegionEnum, ThemeEnum
@@ -9,6 +11,10 @@ class Schedule(BaseModel):
     lunch: bool
     afternoon: int
     dinner: bool
+    # start_time을 주면 이동/체류 시간과 영업시간을 계산해서 end_time(기본 21:00)까지 끝나는 일정만 만듭니다.
+    # 이때 morning + afternoon은 최대 장소 수이고, 점심 전/후 장소 수는 시간에 맞춰 정해집니다.
+    start_time: time | None = None
+    end_time: time | None = None
 
 
 class PlaceInfo(BaseModel):
@@ -20,12 +26,19 @@ class PlaceInfo(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class VisitTime(BaseModel):
+    place_id: int
+    arrival: time
+    departure: time
+
+
 class ScheduleInfo(BaseModel):
     breakfast: PlaceInfo | None = None
     morning: list[PlaceInfo] | None = None
     lunch: PlaceInfo | None = None
     afternoon: list[PlaceInfo] | None = None
     dinner: PlaceInfo | None = None
+    timeline: list[VisitTime] | None = None  # start_time을 준 일정만. 방문 순서대로 도착/출발 시각
 
 
 class TravelRouteConfig(BaseModel):
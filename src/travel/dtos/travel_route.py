@@ -1,25 +1,58 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from src.travel.dtos.base_travel_route import ScheduleInfo, TravelRouteConfig
 
+# 같은 config, seed, 장소 데이터면 항상 같은 일정을 만듭니다. seed를 주지 않으면 서버가 정해서 응답에 담아줍니다.
+SEED_MAX = 2**32 - 1
+# 여러 날 일정의 최대 일수 (제주 여행은 보통 2~4일)
+MAX_TRAVEL_DAYS = 4
+
 
 class GenerateTravelRouteRequest(BaseModel):
     config: TravelRouteConfig
+    seed: int | None = Field(default=None, ge=0, le=SEED_MAX)
 
 
 class GenerateTravelRouteResponse(BaseModel):
     schedule: ScheduleInfo
     config: TravelRouteConfig
+    seed: int
+
+
+class GenerateTravelRouteBatchRequest(BaseModel):
+    config: TravelRouteConfig
+    count: int = Field(default=3, ge=1, le=10)
+    seed: int | None = Field(default=None, ge=0, le=SEED_MAX)
+
+
+class GenerateTravelRouteBatchResponse(BaseModel):
+    schedules: list[ScheduleInfo]
+    config: TravelRouteConfig
+    seed: int
+
+
+class GenerateMultiDayTravelRouteRequest(BaseModel):
+    config: TravelRouteConfig
+    days: int = Field(default=2, ge=1, le=MAX_TRAVEL_DAYS)
+    seed: int | None = Field(default=None, ge=0, le=SEED_MAX)
+
+
+class GenerateMultiDayTravelRouteResponse(BaseModel):
+    schedules: list[ScheduleInfo]  # 날짜 순서. 날짜끼리 같은 장소(식당 포함)가 나오지 않음
+    config: TravelRouteConfig
+    seed: int
 
 
 class ReGenerateTravelRouteRequest(BaseModel):
     schedule: ScheduleInfo
     config: TravelRouteConfig
+    seed: int | None = Field(default=None, ge=0, le=SEED_MAX)
 
 
 class ReGenerateTravelRouteResponse(BaseModel):
     schedule: ScheduleInfo
     config: TravelRouteConfig
+    seed: int
 
 
 class SaveTravelRouteRequest(BaseModel):
@@ -48,8 +81,9 @@ class GetTravelRouteListResponse(BaseModel):
 
 
 class GetTravelRouteListPaginationResponse(BaseModel):
-    page: int
+    page: int | None  # 커서로 조회하면 None
     size: int
-    total_pages: int
-    total_travel_routes: int
+    total_pages: int | None  # 커서로 조회할 때는 include_total=true 일 때만 계산
+    total_travel_routes: int | None
     travel_list: list[GetTravelRouteListResponse]
+    next_cursor: str | None = None
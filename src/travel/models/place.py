@@ -1,3 +1,4 @@
+from datetime import time
 from typing import Optional
 
 from sqlmodel import Field, Relationship, SQLModel
@@ -14,6 +15,12 @@ class Place(BaseDatetime, table=True):
     region: RegionEnum
     latitude: float
     longitude: float
+    # 가까운 장소끼리 묶은 클러스터 번호 (place_clusters.recluster_places로 계산, 추가/이동 시 가까운 클러스터로 배정)
+    cluster_id: Optional[int] = Field(default=None, index=True)
+    # 일정 시간 계산에 쓰는 체류 시간(분)과 영업시간. 없으면 테마별 기본값 사용 (services/itinerary.py)
+    dwell_minutes: Optional[int] = Field(default=None, gt=0)
+    opens_at: Optional[time] = None
+    closes_at: Optional[time] = None
     travel_route_places: list["TravelRoutePlace"] = Relationship(  # type: ignore
         back_populates="place", sa_relationship_kwargs={"cascade": "all, delete-orphan"}
     )
@@ -25,3 +32,6 @@ class PlaceUpdate(SQLModel):
     region: RegionEnum | None = None
     latitude: float | None = None
     longitude: float | None = None
+    dwell_minutes: int | None = Field(default=None, gt=0)
+    opens_at: time | None = None
+    closes_at: time | None = None
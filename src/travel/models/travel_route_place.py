@@ -1,7 +1,7 @@
 from datetime import datetime, time
 from typing import Annotated, List, Optional
 
-from sqlalchemy import JSON, Column, DateTime, ForeignKey, String
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Index, String
 from sqlmodel import Field, Relationship, SQLModel
 
 from src.reviews.models.models import Review
@@ -12,6 +12,8 @@ from src.user.models.models import User
 
 class TravelRoute(BaseDatetime, table=True):
     __tablename__ = "travelroute"
+    # 사용자별 경로 목록을 최신순으로 페이지 조회할 때 사용
+    __table_args__ = (Index("ix_travelroute_user_id_created_at_id", "user_id", "created_at", "id"),)
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str
     user_id: str = Field(..., foreign_key="users.id")
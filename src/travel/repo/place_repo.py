@@ -1,25 +1,95 @@
+from typing import Any, Sequence
+
+import numpy as np
 from fastapi import Depends, HTTPException
-from sqlalchemy import select
+from sqlalchemy import Boolean, func, literal_column, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config.database.connection_async import get_async_session
 from src.travel.models.place import Place, PlaceUpdate
+from src.travel.services.place_catalog import place_catalog
+from src.travel.services.place_clusters import nearest_cluster
 
 
 class PlaceRepository:
     def __init__(self, async_session: AsyncSession = Depends(get_async_session)):
         self.async_session = async_session
 
+    async def get_cluster_centroids(self) -> list[tuple[int, float, float]]:
+        """
+        클러스터별 (번호, 평균 위도, 평균 경도)를 반환합니다.
+        """
+        result = await self.async_session.execute(
+            select(Place.cluster_id, func.avg(Place.latitude), func.avg(Place.longitude))  # type: ignore
+            .where(Place.cluster_id.is_not(None))  # type: ignore
+            .group_by(Place.cluster_id)
+            .order_by(Place.cluster_id)
+        )
+        return [(int(cluster_id), float(lat), float(lon)) for cluster_id, lat, lon in result.all()]
+
+    async def _nearest_cluster_ids(self, coordinates: Sequence[tuple[float, float]]) -> list[int | None]:
+        # 새로 추가되거나 위치가 바뀐 장소는 전체를 다시 나누지 않고 가장 가까운 클러스터에 배정
+        centroids = await self.get_cluster_centroids()
+        if not centroids or not coordinates:
+            return [None] * len(coordinates)
+        labels = nearest_cluster(
+            np.array([lat for lat, _ in coordinates]),
+            np.array([lon for _, lon in coordinates]),
+            np.array([lat for _, lat, _ in centroids]),
+            np.array([lon for _, _, lon in centroids]),
+        )
+        return [centroids[label][0] for label in labels]
+
+    async def _assign_clusters(self, place_list: Sequence[Place]) -> None:
+        cluster_ids = await self._nearest_cluster_ids([(place.latitude, place.longitude) for place in place_list])
+        for place, cluster_id in zip(place_list, cluster_ids):
+            place.cluster_id = cluster_id
+
     async def save(self, place: Place) -> Place:
+        await self._assign_clusters([place])
         self.async_session.add(place)
         await self.async_session.commit()
+        place_catalog.invalidate()
         return place
 
     async def save_bulk(self, place_list: list[Place]) -> list[Place]:
+        await self._assign_clusters(place_list)
         self.async_session.add_all(place_list)
         await self.async_session.commit()
+        place_catalog.invalidate()
         return place_list
 
+    async def upsert_bulk(self, rows: list[dict[str, Any]]) -> tuple[int, int]:
+        """
+        INSERT ... ON CONFLICT (name) DO UPDATE 한 번으로 여러 장소를 저장합니다.
+        이름이 같은 장소가 이미 있으면 테마/지역/위치를 갱신합니다. (추가된 수, 갱신된 수)를 반환합니다.
+        rows 안에 이름이 겹치면 안 됩니다.
+        """
+        if not rows:
+            return 0, 0
+        cluster_ids = await self._nearest_cluster_ids([(row["latitude"], row["longitude"]) for row in rows])
+        rows = [{**row, "cluster_id": cluster_id} for row, cluster_id in zip(rows, cluster_ids)]
+        statement = insert(Place).values(rows)
+        upsert = statement.on_conflict_do_update(
+            index_elements=[Place.name],
+            set_={
+                "theme": statement.excluded.theme,
+                "region": statement.excluded.region,
+                "latitude": statement.excluded.latitude,
+                "longitude": statement.excluded.longitude,
+                "cluster_id": statement.excluded.cluster_id,
+                "updated_at": statement.excluded.updated_at,
+            },
+        )
+        # 새로 추가된 행이면 xmax가 0
+        result = await self.async_session.execute(upsert.returning(literal_column("xmax = 0", Boolean)))
+        inserted_flags = list(result.scalars().all())
+        await self.async_session.commit()
+        place_catalog.invalidate()
+        inserted = sum(1 for flag in inserted_flags if flag)
+        return inserted, len(inserted_flags) - inserted
+
     async def update(self, place: PlaceUpdate, place_id: int) -> Place:
         result = await self.async_session.get(Place, place_id)
         if not result:
@@ -27,13 +97,35 @@ class PlaceRepository:
 
         place_data = place.model_dump(exclude_unset=True)
         result.sqlmodel_update(place_data)
+        if "latitude" in place_data or "longitude" in place_data:
+            await self._assign_clusters([result])
         await self.async_session.commit()
+        place_catalog.invalidate()
         return result
 
     async def get_place_list(self) -> list[Place]:
         result = await self.async_session.execute(select(Place))
         return list(result.scalars().all())
 
+    async def get_coordinates(self) -> list[tuple[int, float, float]]:
+        # 클러스터 계산용. 전체 장소의 (id, 위도, 경도)만 조회
+        result = await self.async_session.execute(
+            select(Place.id, Place.latitude, Place.longitude).order_by(Place.id)  # type: ignore
+        )
+        return [(int(place_id), float(lat), float(lon)) for place_id, lat, lon in result.all()]
+
+    async def update_clusters(self, cluster_ids: dict[int, int]) -> None:
+        """
+        {장소 id: 클러스터 번호}를 한 번의 executemany UPDATE로 저장합니다.
+        """
+        if cluster_ids:
+            await self.async_session.execute(
+                update(Place),
+                [{"id": place_id, "cluster_id": cluster_id} for place_id, cluster_id in cluster_ids.items()],
+            )
+        await self.async_session.commit()
+        place_catalog.invalidate()
+
     async def get_by_theme_and_region(self, theme: str, region: str) -> Place:
         place = await self.async_session.execute(select(Place).filter_by(theme=theme, region=region))
         place = place.scalars().first()  # type: ignore
@@ -47,10 +139,20 @@ class PlaceRepository:
             raise HTTPException(status_code=404, detail="Item not found")
         return place
 
+    async def get_by_ids(self, place_ids: list[int]) -> list[Place]:
+        """
+        여러 장소를 WHERE id IN (...) 쿼리 한 번으로 조회합니다. 없는 id는 결과에서 빠집니다.
+        """
+        if not place_ids:
+            return []
+        result = await self.async_session.execute(select(Place).where(Place.id.in_(place_ids)))  # type: ignore
+        return list(result.scalars().all())
+
     async def delete(self, place_id: int) -> bool:
         result = await self.async_session.get(Place, place_id)
         if not result:
             raise HTTPException(status_code=404, detail="Item not found")
         await self.async_session.delete(result)
         await self.async_session.commit()
+        place_catalog.invalidate()
         return True
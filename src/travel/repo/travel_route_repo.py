@@ -1,5 +1,7 @@
+from datetime import datetime
+
 from fastapi import Depends, HTTPException
-from sqlalchemy import select
+from sqlalchemy import Select, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -21,6 +23,19 @@ class TravelRouteRepository:
         await self.async_session.commit()
         return travel_route_list
 
+    async def save_with_places(self, travel_route: TravelRoute, place_ids: list[int]) -> TravelRoute:
+        """
+        경로와 경로의 장소들을 한 트랜잭션(커밋 한 번)으로 저장합니다.
+        장소 행들은 여러 행 INSERT ... RETURNING 한 번으로 들어갑니다.
+        """
+        travel_route.travel_route_places = [
+            TravelRoutePlace(place_id=place_id, priority=priority)
+            for priority, place_id in enumerate(place_ids, start=1)
+        ]
+        self.async_session.add(travel_route)
+        await self.async_session.commit()
+        return travel_route
+
     async def get_by_id(self, travel_route_id: int) -> TravelRoute | None:
         travel = await self.async_session.execute(
             select(TravelRoute)
@@ -45,6 +60,42 @@ class TravelRouteRepository:
             raise HTTPException(status_code=404, detail="Item not found")
         return list(travel.scalars().all())
 
+    def _list_by_user_query(self, user_id: str) -> Select[tuple[TravelRoute]]:
+        return (
+            select(TravelRoute)
+            .options(selectinload(TravelRoute.travel_route_places).selectinload(TravelRoutePlace.place), selectinload(TravelRoute.reviews))  # type: ignore
+            .where(TravelRoute.user_id == user_id)  # type: ignore
+            .order_by(TravelRoute.created_at.desc(), TravelRoute.id.desc())  # type: ignore
+        )
+
+    async def count_by_user(self, user_id: str) -> int:
+        result = await self.async_session.execute(
+            select(func.count()).select_from(TravelRoute).where(TravelRoute.user_id == user_id)  # type: ignore
+        )
+        return result.scalar_one()
+
+    async def get_travel_route_page_by_user(self, user_id: str, page: int, size: int) -> tuple[list[TravelRoute], int]:
+        """
+        LIMIT/OFFSET으로 한 페이지만 조회하고, 전체 개수는 COUNT 쿼리로 따로 구합니다.
+        """
+        result = await self.async_session.execute(
+            self._list_by_user_query(user_id).limit(size).offset(size * (page - 1))
+        )
+        return list(result.scalars().all()), await self.count_by_user(user_id)
+
+    async def get_travel_route_list_by_user_after(
+        self, user_id: str, size: int, cursor: tuple[datetime, int] | None = None
+    ) -> list[TravelRoute]:
+        """
+        (created_at, id) 기준 키셋 페이지네이션. cursor 다음(더 오래된) 경로를 size개 조회합니다.
+        OFFSET이 없어서 몇 번째 페이지든 인덱스로 바로 찾아갑니다.
+        """
+        query = self._list_by_user_query(user_id)
+        if cursor is not None:
+            query = query.where(tuple_(TravelRoute.created_at, TravelRoute.id) < tuple_(*cursor))  # type: ignore
+        result = await self.async_session.execute(query.limit(size))
+        return list(result.scalars().all())
+
     async def delete(self, travel_route_id: int) -> bool:
         result = await self.async_session.get(TravelRoute, travel_route_id)
         if not result:
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+import math
+from typing import Any
 
-from src import TravelRoute, TravelRoutePlace  # type: ignore
-from src.config.database.connection_async import get_async_session
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile
+
+from src import TravelRoute  # type: ignore
 from src.travel.dtos.base_travel_route import (
     PlaceInfo,
     Schedule,
@@ -9,6 +12,10 @@ from src.travel.dtos.base_travel_route import (
     TravelRouteConfig,
 )
 from src.travel.dtos.travel_route import (
+    GenerateMultiDayTravelRouteRequest,
+    GenerateMultiDayTravelRouteResponse,
+    GenerateTravelRouteBatchRequest,
+    GenerateTravelRouteBatchResponse,
     GenerateTravelRouteRequest,
     GenerateTravelRouteResponse,
     GetTravelRouteListPaginationResponse,
@@ -19,110 +26,162 @@ from src.travel.dtos.travel_route import (
     SaveTravelRouteRequest,
     SaveTravelRouteResponse,
 )
+from src.travel.models.enums import ThemeEnum
 from src.travel.models.place import Place
 from src.travel.repo.place_repo import PlaceRepository
-from src.travel.repo.travel_route_place_repo import TravelRoutePlaceRepository
 from src.travel.repo.travel_route_repo import TravelRouteRepository
+from src.travel.services.cursor import decode_cursor, encode_cursor
 from src.travel.services.generate_place_list import (
-    complete_place_list,
-    re_complete_place_list,
+    generate_schedule,
+    generate_schedules,
+    new_seed,
+    regenerate_schedule,
+    schedule_key,
+)
+from src.travel.services.multi_day import eligible_count, generate_day_schedule
+from src.travel.services.place_catalog import place_catalog
+from src.travel.services.place_importer import (
+    PlaceImportError,
+    import_places,
+    refresh_place_indexes,
+    theme_from_filename,
 )
+from src.travel.services.route_cache import route_cache
+from src.travel.services.route_executor import route_executor
+from src.user.repo.repository import UserRepository
 from src.user.services.authentication import authenticate
 
 router = APIRouter(prefix="/api/v1/travelroute", tags=["Travel"])
 
 
-# @router.get("/init")
-# async def save_init(place_repo: PlaceRepository = Depends()) -> dict[str, str]:
-#     place_list = []
-#     place_list.append(Place(name="군산오름", theme="자연", region="안덕면", latitude=33.253217, longitude=126.370693))
-#     place_list.append(
-#         Place(name="서귀포 자연휴양림", theme="자연", region="서귀포시", latitude=33.311453, longitude=126.458861)
-#     )
-#     place_list.append(
-#         Place(name="제주카트클럽", theme="액티비티", region="한림읍", latitude=33.347790, longitude=126.255974)
-#     )
-#     # 제주카트클럽 근처 식당(3km이내)
-#     place_list.append(
-#         Place(name="저지신토불이식당", theme="식당", region="한경면", latitude=33.342593, longitude=126.255824)
-#     )
-#     place_list.append(
-#         Place(name="더애월 저지점", theme="식당", region="한경면", latitude=33.337698, longitude=126.266830)
-#     )
-#     # 서귀포 자연휴양림 근처 식당(3km이내)
-#     place_list.append(
-#         Place(name="엘에이치큐프로", theme="식당", region="서귀포시", latitude=33.306827, longitude=126.432709)
-#     )
-#     place_list.append(Place(name="엘에이", theme="식당", region="서귀포시", latitude=33.308827, longitude=126.432709))
-#     place_list.append(Place(name="큐프로", theme="식당", region="서귀포시", latitude=33.310827, longitude=126.432709))
-#     # 군산오름 근처 식당(3km이내)
-#     place_list.append(Place(name="민영식당", theme="식당", region="서귀포시", latitude=33.246113, longitude=126.388198))
-#     place_list.append(
-#         Place(name="색달식당 중문본점", theme="식당", region="서귀포시", latitude=33.241829, longitude=126.386383)
-#     )
-#     await place_repo.save_bulk(place_list)
-#     return {"massage": "ddd"}
+async def require_admin(user_id: str = Depends(authenticate), user_repo: UserRepository = Depends()) -> str:
+    # 관리자 전용 엔드포인트에서 사용. 관리자가 아니면 403
+    user = await user_repo.get_user_by_id(user_id)
+    if not user or not user.is_superuser:
+        raise HTTPException(status_code=403, detail="Admin permission required")
+    return user_id
+
+
+@router.post("/places/import", dependencies=[Depends(require_admin)])
+async def import_places_from_xlsx(
+    file: UploadFile,
+    theme: ThemeEnum | None = None,
+    place_repo: PlaceRepository = Depends(),
+) -> dict[str, Any]:
+    """
+    관리자 전용. xlsx 파일(name, address 또는 region, latitude, longitude 열)의 장소를 불러옵니다.
+    theme을 주지 않으면 파일 이름(자연.xlsx 등)을 테마로 사용합니다.
+    """
+    try:
+        report = await import_places(file.file, place_repo, theme or theme_from_filename(file.filename))
+    except PlaceImportError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # 새 장소로 장소 캐시와 인덱스(거리 표 포함)를 다시 만듦
+    await refresh_place_indexes()
+    return report.to_dict()
+
+
+@router.get("/catalog/stats", dependencies=[Depends(require_admin)])
+async def get_place_catalog_stats() -> dict[str, int | float | str | None]:
+    return place_catalog.stats()
+
+
+@router.get("/executor/stats", dependencies=[Depends(require_admin)])
+async def get_route_executor_stats() -> dict[str, int | float | str | None]:
+    return route_executor.stats()
+
+
+@router.get("/cache/stats", dependencies=[Depends(require_admin)])
+async def get_route_cache_stats() -> dict[str, int | float]:
+    return route_cache.stats()
 
 
 @router.post("", response_model=GenerateTravelRouteResponse)
 async def generator_travel_route(data: GenerateTravelRouteRequest) -> GenerateTravelRouteResponse:
-    # 전역변수로 미리 로드
-    all_place_list = None
-    async for session in get_async_session():
-        place_repository_in = PlaceRepository(session)
-        all_place_list = await place_repository_in.get_place_list()
-    all_eating_place_list = []
-    if all_place_list:
-        for place in all_place_list:
-            if place.theme == "식당":
-                all_place_list.remove(place)
-                all_eating_place_list.append(place)
+    # 전역 장소 캐시에서 로드 (요청마다 DB를 읽지 않음)
+    catalog = await place_catalog.get()
+    config = data.config
+
+    async def generate(seed: int) -> ScheduleInfo:
+        # 경로 계산은 CPU 작업이라 이벤트 루프를 막지 않도록 풀에서 실행
+        return await route_executor.run(catalog, generate_schedule, config, seed)
+
+    # 자주 요청되는 config는 캐시에 모아둔 일정 중에서 반환
+    seed, schedule = await route_cache.get(catalog.version, config, data.seed, generate)
+    return GenerateTravelRouteResponse(config=config, schedule=schedule, seed=seed)
+
+
+@router.post("/batch", response_model=GenerateTravelRouteBatchResponse)
+async def generator_travel_route_batch(data: GenerateTravelRouteBatchRequest) -> GenerateTravelRouteBatchResponse:
+    catalog = await place_catalog.get()
+    config = data.config
+    seed = data.seed if data.seed is not None else new_seed()
+    # 후보들을 여러 작업으로 나눠 풀에서 동시에 생성 (작업마다 seed에서 이어지는 시드 사용)
+    job_count = min(data.count, route_executor.max_workers)
+    per_job = math.ceil(data.count / job_count)
+    results = await asyncio.gather(
+        *(route_executor.run(catalog, generate_schedules, config, per_job, seed + i) for i in range(job_count))
+    )
+    schedules: dict[tuple[int, ...], ScheduleInfo] = {}
+    for result in results:
+        for schedule in result:
+            schedules.setdefault(schedule_key(schedule), schedule)
+    if len(schedules) < data.count:
+        # 작업끼리 겹친 후보가 있으면 한 번 더 채움 (장소가 적으면 count보다 적게 반환될 수 있음)
+        for schedule in await route_executor.run(catalog, generate_schedules, config, data.count, seed + job_count):
+            schedules.setdefault(schedule_key(schedule), schedule)
+    return GenerateTravelRouteBatchResponse(config=config, schedules=list(schedules.values())[: data.count], seed=seed)
+
+
+@router.post("/days", response_model=GenerateMultiDayTravelRouteResponse)
+async def generator_multi_day_travel_route(
+    data: GenerateMultiDayTravelRouteRequest,
+) -> GenerateMultiDayTravelRouteResponse:
+    """
+    days일 동안의 일정을 한 번에 만듭니다. 선택한 지역/테마의 장소를 서쪽부터 날짜별 구역으로 나눠서
+    날짜끼리 같은 장소(식당 포함)가 나오지 않고, 날짜별 일정은 풀에서 동시에 만듭니다.
+    """
+    catalog = await place_catalog.get()
     config = data.config
-    schedule = complete_place_list(
-        all_eating_place_list=all_eating_place_list,
-        all_place_list=all_place_list,  # type: ignore
-        regions=config.regions,
-        themes=config.themes,
-        schedule=config.schedule,
+    schedule = config.schedule
+    if eligible_count(catalog, config) < data.days * (schedule.morning + schedule.afternoon):
+        raise HTTPException(status_code=400, detail="Not enough places for the requested days")
+    seed = data.seed if data.seed is not None else new_seed()
+    schedules = await asyncio.gather(
+        *(route_executor.run(catalog, generate_day_schedule, config, data.days, day, seed) for day in range(data.days))
     )
-    return GenerateTravelRouteResponse(config=config, schedule=schedule)
+    return GenerateMultiDayTravelRouteResponse(config=config, schedules=list(schedules), seed=seed)
 
 
 @router.patch("", response_model=ReGenerateTravelRouteResponse)
 async def re_generator_travel_route(
     data: ReGenerateTravelRouteRequest, place_repo: PlaceRepository = Depends()
 ) -> ReGenerateTravelRouteResponse:
-    # 전역변수로 미리 로드
-    all_place_list = None
-    async for session in get_async_session():
-        place_repository_in = PlaceRepository(session)
-        all_place_list = await place_repository_in.get_place_list()
-    all_eating_place_list = []
-    if all_place_list:
-        for place in all_place_list:
-            if place.theme == "식당":
-                all_place_list.remove(place)
-                all_eating_place_list.append(place)
+    # 전역 장소 캐시에서 로드 (요청마다 DB를 읽지 않음)
+    catalog = await place_catalog.get()
     config = data.config
     schedule_info = data.schedule
-    pined_place_list = []
+    pined_place_ids = []
     for i in ["breakfast", "morning", "lunch", "afternoon", "dinner"]:
         if i in ["breakfast", "lunch", "dinner"]:
             if getattr(schedule_info, i):
-                pined_place_list.append(await place_repo.get_by_id(getattr(schedule_info, i).place_id))
+                pined_place_ids.append(getattr(schedule_info, i).place_id)
         else:
             if getattr(schedule_info, i):
                 for place_info in getattr(schedule_info, i):
-                    pined_place_list.append(await place_repo.get_by_id(place_info.place_id))
-    schedule = re_complete_place_list(
-        all_eating_place_list=all_eating_place_list,
-        all_place_list=all_place_list,  # type:ignore
-        regions=config.regions,
-        themes=config.themes,
-        schedule=config.schedule,
-        pined_place_list=pined_place_list,
-    )
-    return ReGenerateTravelRouteResponse(config=config, schedule=schedule)
+                    pined_place_ids.append(place_info.place_id)
+    # 고정한 장소는 캐시에서 찾고, 캐시에 없는 장소(방금 추가된 장소 등)만 한 번에 DB에서 조회
+    missing_ids = list({place_id for place_id in pined_place_ids if place_id not in catalog.by_id})
+    fetched = {place.id: place for place in await place_repo.get_by_ids(missing_ids)} if missing_ids else {}
+    pined_place_list = []
+    for place_id in pined_place_ids:
+        place = catalog.by_id.get(place_id) or fetched.get(place_id)
+        if place is None:
+            raise HTTPException(status_code=404, detail="Item not found")
+        pined_place_list.append(place)
+    seed = data.seed if data.seed is not None else new_seed()
+    schedule = await route_executor.run(catalog, regenerate_schedule, config, pined_place_list, seed)
+    return ReGenerateTravelRouteResponse(config=config, schedule=schedule, seed=seed)
 
 
 @router.post("/save", response_model=SaveTravelRouteResponse)
@@ -130,39 +189,33 @@ async def save_travel_route(
     data: SaveTravelRouteRequest,
     user_id: str = Depends(authenticate),
     travel_route_repo: TravelRouteRepository = Depends(),
-    travel_route_place_repo: TravelRoutePlaceRepository = Depends(),
 ) -> SaveTravelRouteResponse:
+    # 시간을 계산한 일정(start_time)은 오전/오후 장소 수가 config와 다를 수 있으므로 실제 일정의 개수로 저장
+    schedule = data.schedule
     travel_route = TravelRoute(
         user_id=user_id,
         title=data.title,
         regions=data.config.regions,
         themes=data.config.themes,
-        breakfast=data.config.schedule.breakfast,
-        morning=data.config.schedule.morning,
-        lunch=data.config.schedule.lunch,
-        afternoon=data.config.schedule.afternoon,
-        dinner=data.config.schedule.dinner,
+        breakfast=schedule.breakfast is not None,
+        morning=len(schedule.morning or []),
+        lunch=schedule.lunch is not None,
+        afternoon=len(schedule.afternoon or []),
+        dinner=schedule.dinner is not None,
     )
-    travel_route = await travel_route_repo.save(travel_route)
-    index = 1
+    # 방문 순서(priority)대로 장소 id를 모아서 경로와 함께 한 번에 저장
+    place_ids = []
     for i in ["breakfast", "morning", "lunch", "afternoon", "dinner"]:
         if i in ["breakfast", "lunch", "dinner"]:
             place_info = getattr(data.schedule, i)
             if place_info:
-                travel_route1 = TravelRoutePlace(
-                    travel_route_id=travel_route.id, place_id=place_info.place_id, priority=index
-                )
-                await travel_route_place_repo.save(travel_route1)
-                index += 1
+                place_ids.append(place_info.place_id)
         else:
             place_infos = getattr(data.schedule, i)
             if place_infos:
                 for place_info in place_infos:
-                    travel_route2 = TravelRoutePlace(
-                        travel_route_id=travel_route.id, place_id=place_info.place_id, priority=index
-                    )
-                    await travel_route_place_repo.save(travel_route2)
-                    index += 1
+                    place_ids.append(place_info.place_id)
+    travel_route = await travel_route_repo.save_with_places(travel_route, place_ids)
 
     return SaveTravelRouteResponse(travel_route_id=travel_route.id)  # type: ignore
 
@@ -214,17 +267,48 @@ async def generate_dto(travel_route: TravelRoute, user_id: str) -> GetTravelRout
 
 @router.get("", response_model=GetTravelRouteListPaginationResponse)
 async def get_travel_routes(
-    page: int, size: int, user_id: str = Depends(authenticate), travel_route_repo: TravelRouteRepository = Depends()
+    size: int = Query(ge=1),
+    page: int = Query(default=1, ge=1),
+    cursor: str | None = None,
+    include_total: bool = False,
+    user_id: str = Depends(authenticate),
+    travel_route_repo: TravelRouteRepository = Depends(),
 ) -> GetTravelRouteListPaginationResponse:
-    travel_route_list = await travel_route_repo.get_tarvel_route_list_by_user(user_id)
+    """
+    - page: LIMIT/OFFSET 조회 (전체 개수 포함)
+    - cursor: 이전 응답의 next_cursor 다음부터 조회 (키셋 방식, 오래된 페이지도 빠름)
+    """
+    total_travelroutes = None
+    total_pages = None
+    if cursor is None:
+        travel_route_list, total_travelroutes = await travel_route_repo.get_travel_route_page_by_user(
+            user_id, page, size
+        )
+        has_next = page * size < total_travelroutes
+    else:
+        # 다음 페이지가 있는지 알기 위해 하나 더 조회
+        travel_route_list = await travel_route_repo.get_travel_route_list_by_user_after(
+            user_id, size + 1, decode_cursor(cursor)
+        )
+        has_next = len(travel_route_list) > size
+        travel_route_list = travel_route_list[:size]
+        if include_total:
+            total_travelroutes = await travel_route_repo.count_by_user(user_id)
+    if total_travelroutes is not None:
+        total_pages = (total_travelroutes - 1) // size + 1
     response_list = []
     for travel_route in travel_route_list:
         response_list.append(await generate_dto(travel_route=travel_route, user_id=user_id))
-    total_travelroutes = len(response_list)
-    total_pages = (total_travelroutes - 1) // size + 1
-    response_list = response_list[size * (page - 1) : size * page]  # 나중에 query시 LIMIT 적용으로 바꾸기
+    next_cursor = None
+    if has_next and travel_route_list:
+        next_cursor = encode_cursor(travel_route_list[-1].created_at, travel_route_list[-1].id)  # type: ignore
     return GetTravelRouteListPaginationResponse(
-        page=page, size=size, total_pages=total_pages, total_travel_routes=total_travelroutes, travel_list=response_list
+        page=page if cursor is None else None,
+        size=size,
+        total_pages=total_pages,
+        total_travel_routes=total_travelroutes,
+        travel_list=response_list,
+        next_cursor=next_cursor,
     )
 
 
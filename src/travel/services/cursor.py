@@ -0,0 +1,19 @@
+import base64
+from datetime import datetime
+
+from fastapi import HTTPException
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    """
+    키셋 페이지네이션 위치(created_at, id)를 클라이언트에 넘길 문자열로 만듭니다.
+    """
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        created_at, id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
@@ -0,0 +1,191 @@
+import argparse
+import asyncio
+import os
+import struct
+import tempfile
+import time
+from typing import Sequence
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import settings
+from src.config.database.connection_async import AsyncSessionFactory
+from src.travel.models.place import Place
+from src.travel.services.shortest_path_sort import haversine_matrix, place_coordinates
+
+# 파일 구조: 헤더(64바이트) + 장소 id(int64 * n, 오름차순) + 거리 행렬(float32 * n * n, km)
+MAGIC = b"DRMDIST\0"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sII16s")
+HEADER_SIZE = 64
+# 버전이 맞지 않을 때 파일이 다시 만들어졌는지 확인하는 최소 간격
+RECHECK_SECONDS = 30.0
+
+
+class DistanceTableError(ValueError):
+    pass
+
+
+class DistanceTable:
+    """
+    전체 장소 사이의 거리를 미리 계산해둔 표.
+    파일을 memmap으로 열기 때문에 여러 워커가 같은 페이지 캐시를 공유하고, 로드할 때 복사가 없습니다.
+    """
+
+    def __init__(self, ids: np.ndarray, matrix: np.ndarray, version: str) -> None:
+        self.ids = ids
+        self.matrix = matrix
+        self.version = version
+        self.index = {int(place_id): row for row, place_id in enumerate(ids)}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def build(cls, places: Sequence[Place], version: str) -> "DistanceTable":
+        ordered = sorted(places, key=lambda place: place.id or 0)
+        ids = np.fromiter((place.id or 0 for place in ordered), dtype=np.int64, count=len(ordered))
+        matrix = haversine_matrix(*place_coordinates(ordered)).astype(np.float32)
+        return cls(ids, matrix, version)
+
+    def save(self, path: str) -> None:
+        """
+        임시 파일에 쓴 뒤 교체하므로, 실행 중인 워커는 항상 완성된 파일만 보게 됩니다.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                header = HEADER.pack(MAGIC, FORMAT_VERSION, len(self.ids), self.version.encode().ljust(16, b"\0"))
+                f.write(header.ljust(HEADER_SIZE, b"\0"))
+                f.write(np.ascontiguousarray(self.ids, dtype="<i8").tobytes())
+                f.write(np.ascontiguousarray(self.matrix, dtype="<f4").tobytes())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> "DistanceTable":
+        with open(path, "rb") as f:
+            header = f.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            raise DistanceTableError(f"{path}: 파일이 너무 짧습니다.")
+        magic, format_version, n, version = HEADER.unpack_from(header)
+        if magic != MAGIC:
+            raise DistanceTableError(f"{path}: 거리 표 파일이 아닙니다.")
+        if format_version != FORMAT_VERSION:
+            raise DistanceTableError(f"{path}: 지원하지 않는 형식 버전입니다. ({format_version})")
+        if os.path.getsize(path) != HEADER_SIZE + n * 8 + n * n * 4:
+            raise DistanceTableError(f"{path}: 파일 크기가 맞지 않습니다.")
+        if n == 0:
+            return cls(np.zeros(0, dtype=np.int64), np.zeros((0, 0), dtype=np.float32), version.rstrip(b"\0").decode())
+        ids = np.memmap(path, dtype="<i8", mode="r", offset=HEADER_SIZE, shape=(n,))
+        matrix = np.memmap(path, dtype="<f4", mode="r", offset=HEADER_SIZE + n * 8, shape=(n, n))
+        return cls(ids, matrix, version.rstrip(b"\0").decode())
+
+    def sub_matrix(self, places: Sequence[Place]) -> np.ndarray:
+        """
+        주어진 장소 순서대로 거리 행렬을 잘라냅니다. 표에 없는 장소가 있으면 바로 계산합니다.
+        """
+        rows = [self.index.get(place.id or 0) for place in places]
+        if any(row is None for row in rows):
+            return haversine_matrix(*place_coordinates(places))
+        return self.matrix[np.ix_(rows, rows)].astype(np.float64)  # type: ignore
+
+
+def distance_matrix(places: Sequence[Place], table: DistanceTable | None = None) -> np.ndarray:
+    if table is None:
+        return haversine_matrix(*place_coordinates(places))
+    return table.sub_matrix(places)
+
+
+class DistanceTableStore:
+    """
+    워커 시작 시 로드한 거리 표를 보관합니다.
+    카탈로그의 좌표 버전과 표의 버전이 다르면(장소가 추가/삭제되거나 옮겨진 뒤 아직 다시 만들지 않았으면) 사용하지 않습니다.
+    버전이 다르면 다른 프로세스가 파일을 다시 만들었을 수 있으므로, recheck_seconds에 한 번 파일이 바뀌었는지 확인하고 다시 엽니다.
+    """
+
+    def __init__(self, recheck_seconds: float = RECHECK_SECONDS) -> None:
+        self.table: DistanceTable | None = None
+        self.path: str | None = None
+        self.recheck_seconds = recheck_seconds
+        self.reloads = 0
+        # 지금 열어둔 파일의 (수정 시각, 크기). 같으면 다시 열지 않음
+        self._file_key: tuple[int, int] | None = None
+        self._checked_at = 0.0
+
+    def load(self, path: str) -> DistanceTable | None:
+        self.path = path
+        self._checked_at = time.monotonic()
+        if not os.path.exists(path):
+            self.table = None
+            self._file_key = None
+            return None
+        stat = os.stat(path)
+        self.table = DistanceTable.load(path)
+        self._file_key = (stat.st_mtime_ns, stat.st_size)
+        return self.table
+
+    def for_version(self, version: str) -> DistanceTable | None:
+        if self.table is not None and self.table.version == version:
+            return self.table
+        if self.path is None or time.monotonic() - self._checked_at < self.recheck_seconds:
+            return None
+        self._reload_if_changed(self.path)
+        if self.table is not None and self.table.version == version:
+            return self.table
+        return None
+
+    def _reload_if_changed(self, path: str) -> None:
+        self._checked_at = time.monotonic()
+        try:
+            stat = os.stat(path)
+            if (stat.st_mtime_ns, stat.st_size) == self._file_key:
+                return
+            self.load(path)
+            self.reloads += 1
+        except (OSError, DistanceTableError):
+            # 파일이 없어졌거나 읽을 수 없으면 지금 표를 계속 사용하고 다음 확인 때 다시 시도
+            return
+
+
+distance_tables = DistanceTableStore()
+
+
+async def rebuild_distance_table(
+    path: str, session_factory: async_sessionmaker[AsyncSession] = AsyncSessionFactory
+) -> DistanceTable:
+    """
+    DB의 전체 장소로 거리 표를 다시 만들어 파일로 저장합니다.
+    """
+    # 순환 import를 피하기 위해 함수 안에서 import
+    from src.travel.services.place_catalog import PlaceCatalogSnapshot
+
+    async with session_factory() as session:
+        result = await session.execute(select(Place))
+        snapshot = PlaceCatalogSnapshot.from_places(list(result.scalars().all()))
+    # n x n 행렬 계산과 파일 쓰기는 이벤트 루프를 막지 않도록 스레드에서 실행
+    return await asyncio.to_thread(_build_and_save, snapshot.places, snapshot.distance_version, path)
+
+
+def _build_and_save(places: Sequence[Place], version: str, path: str) -> DistanceTable:
+    table = DistanceTable.build(places, version)
+    table.save(path)
+    return table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="장소 거리 표 생성")
+    parser.add_argument("--output", default=settings.PLACE_DISTANCE_TABLE_PATH)
+    args = parser.parse_args()
+    table = asyncio.run(rebuild_distance_table(args.output))
+    print(f"{args.output}: {len(table)}개 장소, 버전 {table.version}")
+
+
+if __name__ == "__main__":
+    main()
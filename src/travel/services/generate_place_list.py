@@ -1,17 +1,45 @@
+import math
 import random
-from math import atan2, cos, radians, sin, sqrt
+from typing import Callable
+
+import numpy as np
 
 from src import Place  # type: ignore
-from src.config.database.connection_async import get_async_session
-from src.travel.dtos.base_travel_route import PlaceInfo, Schedule, ScheduleInfo
+from src.config import settings
+from src.travel.dtos.base_travel_route import (
+    PlaceInfo,
+    Schedule,
+    ScheduleInfo,
+    TravelRouteConfig,
+    VisitTime,
+)
 from src.travel.models.enums import RegionEnum, ThemeEnum
-from src.travel.repo.place_repo import PlaceRepository
+from src.travel.services.distance_table import DistanceTable, distance_matrix
+from src.travel.services.itinerary import (
+    BREAKFAST_MINUTES,
+    DAY_END,
+    DINNER_MINUTES,
+    DINNER_WINDOW,
+    LUNCH_MINUTES,
+    LUNCH_WINDOW,
+    MEAL_LEG_MINUTES,
+    Stop,
+    from_minutes,
+    meal_stop,
+    plan_itinerary,
+    stop_for_place,
+    to_minutes,
+    visit_times,
+)
+from src.travel.services.place_catalog import PlaceCatalogSnapshot
+from src.travel.services.place_index import BucketKey, PlaceIndex
 from src.travel.services.shortest_path_sort import (
-    create_distance_matrix,
-    haversine,
-    solve_tsp_brute_force,
+    cross_track_distance,
+    haversine_one_to_many,
+    place_coordinates,
+    solve_tsp,
 )
-from src.travel.test.fixtures import place_repository
+from src.travel.services.spatial_index import SpatialIndex
 
 
 def loading_place_list() -> list[Place]:
@@ -68,204 +96,407 @@ def eating_place_list_to() -> list[Place]:
 # service 함수
 def random_place_list(
     regions: list[RegionEnum],
-    all_place_list: list[Place],
+    place_index: PlaceIndex,
     themes: list[ThemeEnum],
     morning: int = 0,
     afternoon: int = 0,
     selected_themes: set[ThemeEnum] | None = None,
     selected_regions: set[RegionEnum] | None = None,
     count: int | None = None,
+    rng: random.Random | None = None,
+    clusters: set[int] | None = None,
+    excluded: set[int] | None = None,
 ) -> list[Place]:
-    filtered_list = [i for i in all_place_list if i.theme in themes and i.region in regions]
+    sampler = place_index.sampler(themes=themes, regions=regions, rng=rng, excluded=excluded or ())
     if not selected_themes:
         selected_themes = set()
     if not selected_regions:
         selected_regions = set()
+    all_themes = set(themes)
+    all_regions = set(regions)
     result_place = []
     if not count:
         count = morning + afternoon
-    for i in range(count):
-        excluded_list: list[Place] = []
-        temp_list = [i for i in filtered_list]
+
+    def not_selected(key: BucketKey) -> bool:
+        return key[0] not in selected_themes or key[1] not in selected_regions
+
+    def in_clusters(key: BucketKey) -> bool:
+        return clusters is None or key[2] in clusters
+
+    for _ in range(count):
         choice_place = None
-        while temp_list:
-            choice_place = random.choice(temp_list)
-            # 선택한 테마와 지역들이 이미 모두다 선택됐으면 조건 무시
-            if selected_themes == set([i.value for i in themes]) and selected_regions == set(
-                [i.value for i in regions]
-            ):
-                break
-            # 테마와 지역들을 최대한 골고루 배정하기위해 이미 선택된것들 제외
-            if choice_place.region not in selected_regions or choice_place.theme not in selected_themes:
-                selected_regions.add(choice_place.region)
-                selected_themes.add(choice_place.theme)
+        # 테마와 지역들을 최대한 골고루 배정하기위해 아직 선택되지 않은 테마나 지역의 버킷에서 우선 선택
+        # 선택한 테마와 지역들이 이미 모두다 선택됐으면 조건 무시
+        # clusters가 있으면 그 클러스터 안에서 먼저 찾고, 모자라면 전체에서 찾음
+        # 클러스터 안에 남은 지역/테마가 없으면 클러스터보다 골고루 뽑는 것을 우선함
+        spread = not (selected_themes >= all_themes and selected_regions >= all_regions)
+        conditions: list[Callable[[BucketKey], bool]] = []
+        if spread:
+            conditions.append(lambda key: in_clusters(key) and not_selected(key))
+            if clusters is not None:
+                conditions.append(not_selected)
+        conditions.append(in_clusters)
+        if clusters is not None:
+            conditions.append(lambda key: True)
+        for condition in conditions:
+            choice_place = sampler.pick(condition)
+            if choice_place is not None:
                 break
-            temp_list.remove(choice_place)
-        # 정상적으로 break를 타고 나왔을때만 result에 추가
-        if temp_list:
-            filtered_list.remove(choice_place)  # type: ignore
-            result_place.append(choice_place)
-        # 이미 조건에맞는 장소가 남아있지않으므로 break후 무작위 선택
-        else:
+        # 조건에맞는 장소가 남아있지않으면 종료
+        if choice_place is None:
             break
-    # 추가적으로 골라야할 장소의 갯수
-    will_append_place_num = count - len(result_place)
-    if will_append_place_num:
-        # 이미선택된 장소 제외
-        temp_list = [i for i in filtered_list if i not in result_place]
-        # random.sample로 중복없이 부족한갯수 채우기
-        result_place.append(random.sample(temp_list, will_append_place_num))  # type: ignore
+        selected_themes.add(choice_place.theme)
+        selected_regions.add(choice_place.region)
+        result_place.append(choice_place)
 
-    return result_place  # type: ignore
+    return result_place
 
 
-def point_to_line_distance(
-    lat1: float, lon1: float, lat2: float, lon2: float, lat_rest: float, lon_rest: float
-) -> float:
-    # 직선 방정식 기반 거리 계산
-    numerator = abs((lon2 - lon1) * (lat_rest - lat1) - (lat2 - lat1) * (lon_rest - lon1))
-    denominator = sqrt((lon2 - lon1) ** 2 + (lat2 - lat1) ** 2)
-    return numerator / denominator
+# 필터링: 두 장소 사이 선분 근처에 있는 식당 찾기
+def is_near_line(place1: PlaceInfo, place2: PlaceInfo, restaurant: Place, max_distance_km: float = 5) -> bool:
+    distance = cross_track_distance(
+        place1.latitude,
+        place1.longitude,
+        place2.latitude,
+        place2.longitude,
+        np.array([restaurant.latitude]),
+        np.array([restaurant.longitude]),
+    )[0]
+    return bool(distance <= max_distance_km)
 
 
-# 필터링: 두 장소 사이 선분 근처에 있는 식당 찾기
-def is_near_line(place1: PlaceInfo, place2: PlaceInfo, restaurant: Place, max_distance_km: int = 5) -> bool:
-    distance = point_to_line_distance(
-        place1.latitude, place1.longitude, place2.latitude, place2.longitude, restaurant.latitude, restaurant.longitude
+def place_list_close_line(
+    start_place: PlaceInfo, end_place: PlaceInfo, restaurants: list[Place], max_distance_km: float = 3
+) -> list[Place]:
+    if not restaurants:
+        return []
+    distances = cross_track_distance(
+        start_place.latitude,
+        start_place.longitude,
+        end_place.latitude,
+        end_place.longitude,
+        *place_coordinates(restaurants),
     )
-    return distance <= max_distance_km
+    return [restaurants[i] for i in np.flatnonzero(distances <= max_distance_km)]
 
 
-def place_list_close_line(start_place: PlaceInfo, end_place: PlaceInfo, restaurants: list[Place]) -> list[Place]:
-    filtered_restaurants = [
-        restaurant for restaurant in restaurants if is_near_line(start_place, end_place, restaurant, 3)
-    ]
-    return filtered_restaurants
+def place_list_in_radius(start_place: PlaceInfo, radius: int, place_list: list[Place]) -> list[Place]:
+    if not place_list:
+        return []
+    distances = haversine_one_to_many(start_place.latitude, start_place.longitude, *place_coordinates(place_list))
+    return [place_list[i] for i in np.flatnonzero(distances <= radius)]
 
 
-def place_list_in_radius(start_place: PlaceInfo, radius: int, place_list: list[Place]) -> list[Place]:
-    result_place = []
-    for place in place_list:
-        if haversine(start_place.latitude, start_place.longitude, place.latitude, place.longitude) <= radius:
-            result_place.append(place)
-    return result_place
+EATING_RADIUS_KM = 3
+EATING_MAX_RADIUS_KM = 13
+# 점심은 오전 마지막 장소와 오후 첫 장소 사이 이동 경로에서 이 거리 안의 식당을 우선 선택
+EATING_CORRIDOR_KM = 3
+# 시간을 계산하는 일정은 시간 안에 들어가는 장소를 고를 수 있도록 장소 수의 이 배수만큼 후보를 뽑음
+ITINERARY_POOL_FACTOR = 2
 
 
 # service 함수
-def random_eating_place_list(start_place: PlaceInfo, end_place: PlaceInfo | None, place_list: list[Place]) -> Place:
-    filtered_list = None
-    plus = 0
-    while not filtered_list:
-        filtered_list = place_list_in_radius(start_place, 3 + plus, place_list)
-        if end_place is not None:
-            place_list_close_line(start_place, end_place, filtered_list)
-        plus += 1
-        if plus > 10:
-            break
-
-    choice_place = random.choice(filtered_list)
-    place_list.remove(choice_place)
+def random_eating_place_list(
+    start_place: PlaceInfo,
+    end_place: PlaceInfo | None,
+    restaurant_index: SpatialIndex,
+    excluded: set[int],
+    rng: random.Random | None = None,
+) -> Place | None:
+    """
+    start_place 근처 식당 중 하나를 무작위로 고릅니다. 이미 고른 식당(excluded)은 제외합니다.
+    3km 안에 식당이 없으면 1km씩 넓혀서 찾던 방식과 같은 결과가 되도록, 13km 안의 식당을 한 번에 찾고
+    가장 가까운 식당이 들어가는 가장 작은 반경 안에서 고릅니다. 13km 안에 없으면 가장 가까운 식당을 고릅니다.
+    end_place가 있으면 먼저 start_place -> end_place 경로 근처(3km)의 식당 중에서 고릅니다.
+    """
+    rng = rng or random.Random()
+    if end_place is not None:
+        corridor = restaurant_index.near_segment(
+            start_place.latitude,
+            start_place.longitude,
+            end_place.latitude,
+            end_place.longitude,
+            EATING_CORRIDOR_KM,
+            exclude=excluded,
+        )
+        if corridor:
+            choice_place = rng.choice(corridor).place
+            excluded.add(choice_place.id)  # type: ignore
+            return choice_place
+    neighbors = restaurant_index.within_radius(
+        start_place.latitude, start_place.longitude, EATING_MAX_RADIUS_KM, exclude=excluded
+    )
+    if neighbors:
+        radius = max(EATING_RADIUS_KM, math.ceil(neighbors[0].distance_km))
+        choice_place = rng.choice([neighbor.place for neighbor in neighbors if neighbor.distance_km <= radius])
+    else:
+        nearest = restaurant_index.nearest(start_place.latitude, start_place.longitude, exclude=excluded)
+        if not nearest:
+            return None
+        choice_place = nearest[0].place
+    excluded.add(choice_place.id)  # type: ignore
     return choice_place
 
 
+def assign_eating_places(
+    schedule: Schedule,
+    morning: list[PlaceInfo],
+    afternoon: list[PlaceInfo],
+    restaurant_index: SpatialIndex,
+    rng: random.Random | None = None,
+) -> tuple[PlaceInfo | None, PlaceInfo | None, PlaceInfo | None]:
+    """
+    아침/점심/저녁 식당을 고릅니다. 같은 식당이 두 번 나오지 않습니다.
+    """
+    excluded: set[int] = set()
+    # 시간을 계산하는 일정은 오전이나 오후 장소가 비어 있을 수 있음
+    places = morning + afternoon
+
+    def pick(start_place: PlaceInfo, end_place: PlaceInfo | None) -> PlaceInfo | None:
+        place = random_eating_place_list(start_place, end_place, restaurant_index, excluded, rng)
+        return PlaceInfo.model_validate(place) if place else None
+
+    breakfast = None
+    lunch = None
+    dinner = None
+    if not places:
+        return None, None, None
+    if schedule.morning and schedule.breakfast:
+        breakfast = pick(start_place=places[0], end_place=None)
+    if schedule.lunch:
+        if morning and afternoon:
+            lunch = pick(start_place=morning[-1], end_place=afternoon[0])
+        elif morning:
+            lunch = pick(start_place=morning[-1], end_place=None)
+        else:
+            lunch = pick(start_place=afternoon[0], end_place=None)
+    if schedule.dinner:
+        dinner = pick(start_place=places[-1], end_place=None)
+    return breakfast, lunch, dinner
+
+
+def timed_schedule(
+    schedule: Schedule,
+    place_list: list[Place],
+    pined_place_list: list[Place],
+    restaurant_index: SpatialIndex,
+    distance_table: DistanceTable | None,
+    rng: random.Random,
+) -> ScheduleInfo:
+    """
+    schedule.start_time ~ end_time 안에 끝나는 일정을 만듭니다.
+    고정한 장소는 모두 넣고, 후보(place_list) 중 시간 안에 들어가는 장소를 최대 morning + afternoon개까지 고릅니다.
+    아침은 시작 시각에, 저녁은 마지막 장소 다음에 먹는 것으로 보고 그만큼 장소를 둘러볼 시간을 줄입니다.
+    """
+    start = to_minutes(schedule.start_time)  # type: ignore
+    day_start = start + (BREAKFAST_MINUTES + MEAL_LEG_MINUTES if schedule.breakfast else 0)
+    day_end = to_minutes(schedule.end_time or DAY_END)
+    if schedule.dinner:
+        day_end = min(day_end - DINNER_MINUTES, to_minutes(DINNER_WINDOW[1])) - MEAL_LEG_MINUTES
+    candidates = pined_place_list + place_list
+    stops = [stop_for_place(place, node=i, required=i < len(pined_place_list)) for i, place in enumerate(candidates)]
+    lunch_index = None
+    if schedule.lunch:
+        lunch_index = len(stops)
+        stops.append(meal_stop(LUNCH_MINUTES + MEAL_LEG_MINUTES, LUNCH_WINDOW))
+    itinerary = plan_itinerary(
+        distance_matrix(candidates, distance_table),
+        stops,
+        day_start,
+        day_end,
+        max_optional=schedule.morning + schedule.afternoon - len(pined_place_list),
+    )
+    # 점심 전/후로 오전/오후를 나눔 (점심이 없으면 요청한 오전 장소 수만큼)
+    route = itinerary.route
+    if lunch_index is not None:
+        split = route.index(lunch_index)
+        morning_route, afternoon_route = route[:split], route[split + 1 :]
+    else:
+        morning_route, afternoon_route = route[: schedule.morning], route[schedule.morning :]
+    morning = [PlaceInfo.model_validate(candidates[i]) for i in morning_route]
+    afternoon = [PlaceInfo.model_validate(candidates[i]) for i in afternoon_route]
+    breakfast, lunch, dinner = assign_eating_places(schedule, morning, afternoon, restaurant_index, rng)
+
+    # 식당까지 정해졌으니 실제 좌표로 도착/출발 시각을 다시 계산
+    visits: list[tuple[PlaceInfo, Stop]] = []
+    if breakfast:
+        visits.append((breakfast, meal_stop(BREAKFAST_MINUTES)))
+    visits += [(place, stops[i]) for place, i in zip(morning, morning_route)]
+    if lunch:
+        visits.append((lunch, meal_stop(LUNCH_MINUTES, LUNCH_WINDOW)))
+    visits += [(place, stops[i]) for place, i in zip(afternoon, afternoon_route)]
+    if dinner:
+        visits.append((dinner, meal_stop(DINNER_MINUTES, DINNER_WINDOW)))
+    times = visit_times([(place.latitude, place.longitude) for place, _ in visits], [stop for _, stop in visits], start)
+    timeline = [
+        VisitTime(place_id=place.place_id, arrival=from_minutes(arrival), departure=from_minutes(departure))
+        for (place, _), (arrival, departure) in zip(visits, times)
+    ]
+    return ScheduleInfo(
+        breakfast=breakfast, morning=morning, lunch=lunch, afternoon=afternoon, dinner=dinner, timeline=timeline
+    )
+
+
 def complete_place_list(
     regions: list[RegionEnum],
     themes: list[ThemeEnum],
     schedule: Schedule,
-    all_place_list: list[Place],
-    all_eating_place_list: list[Place],
+    place_index: PlaceIndex,
+    restaurant_index: SpatialIndex,
+    distance_table: DistanceTable | None = None,
+    rng: random.Random | None = None,
 ) -> ScheduleInfo:
+    rng = rng or random.Random()
+    count = schedule.morning + schedule.afternoon
+    if schedule.start_time is not None:
+        count *= ITINERARY_POOL_FACTOR
+    clusters = None
+    if settings.ROUTE_CLUSTER_SAMPLING:
+        # 가까운 클러스터 안에서 뽑아 장소들이 흩어지지 않게 함
+        clusters = place_index.choose_clusters(themes, regions, count, rng)
     place_list = random_place_list(
-        all_place_list=all_place_list,
+        place_index=place_index,
         regions=regions,
         themes=themes,
-        morning=schedule.morning,
-        afternoon=schedule.afternoon,
+        count=count,
+        rng=rng,
+        clusters=clusters,
     )
-    distance_matrix = create_distance_matrix(place_list)
-    best_route, best_distance = solve_tsp_brute_force(distance_matrix)
+    if schedule.start_time is not None:
+        return timed_schedule(schedule, place_list, [], restaurant_index, distance_table, rng)
+    best_route, best_distance = solve_tsp(distance_matrix(place_list, distance_table))
     sorted_place_list = [place_list[i] for i in best_route]
-    eating_list = all_eating_place_list
-    breakfast = None
     morning = [PlaceInfo.model_validate(sorted_place_list[i]) for i in range(schedule.morning)]
-    lunch = None
     afternoon = [
         PlaceInfo.model_validate(sorted_place_list[i])
         for i in range(schedule.morning, schedule.morning + schedule.afternoon)
     ]
-    dinner = None
-    if schedule.morning and schedule.breakfast:
-        breakfast = PlaceInfo.model_validate(
-            random_eating_place_list(start_place=morning[0], end_place=None, place_list=eating_list)
-        )
-    if schedule.lunch:
-        if afternoon:
-            lunch = PlaceInfo.model_validate(
-                random_eating_place_list(start_place=morning[-1], end_place=afternoon[0], place_list=eating_list)
-            )
-        else:
-            lunch = PlaceInfo.model_validate(
-                random_eating_place_list(start_place=morning[-1], end_place=None, place_list=eating_list)
-            )
-    if schedule.dinner:
-        dinner = PlaceInfo.model_validate(
-            random_eating_place_list(start_place=afternoon[-1], end_place=None, place_list=eating_list)
-        )
+    breakfast, lunch, dinner = assign_eating_places(schedule, morning, afternoon, restaurant_index, rng)
     schedule = ScheduleInfo(breakfast=breakfast, morning=morning, lunch=lunch, afternoon=afternoon, dinner=dinner)  # type: ignore
     return schedule  # type: ignore
 
 
 def re_complete_place_list(
-    all_place_list: list[Place],
+    place_index: PlaceIndex,
     regions: list[RegionEnum],
     themes: list[ThemeEnum],
     schedule: Schedule,
     pined_place_list: list[Place],
-    all_eating_place_list: list[Place],
+    restaurant_index: SpatialIndex,
+    distance_table: DistanceTable | None = None,
+    rng: random.Random | None = None,
 ) -> ScheduleInfo:
+    rng = rng or random.Random()
     count = schedule.morning + schedule.afternoon - len(pined_place_list)
+    if schedule.start_time is not None:
+        count *= ITINERARY_POOL_FACTOR
+    clusters = None
+    if settings.ROUTE_CLUSTER_SAMPLING:
+        # 고정한 장소들의 클러스터(와 그 옆 클러스터)에서 나머지를 뽑음
+        clusters = place_index.choose_clusters(themes, regions, count, rng, around=pined_place_list)
     selected_themes = set()
     selected_regions = set()
     for i in pined_place_list:
         selected_themes.add(i.theme)
         selected_regions.add(i.region)
     place_list = random_place_list(
-        all_place_list=all_place_list,
+        place_index=place_index,
         regions=regions,
         themes=themes,
         count=count,
         selected_themes=selected_themes,
         selected_regions=selected_regions,
+        rng=rng,
+        clusters=clusters,
+        # 고정한 장소가 한 번 더 뽑히지 않게 함
+        excluded={place.id for place in pined_place_list if place.id is not None},
     )
+    if schedule.start_time is not None:
+        return timed_schedule(schedule, place_list, pined_place_list, restaurant_index, distance_table, rng)
     place_list += pined_place_list
-    distance_matrix = create_distance_matrix(place_list)
-    best_route, best_distance = solve_tsp_brute_force(distance_matrix)
+    best_route, best_distance = solve_tsp(distance_matrix(place_list, distance_table))
     sorted_place_list = [place_list[i] for i in best_route]
-    eating_list = all_eating_place_list
-    breakfast = None
     morning = [PlaceInfo.model_validate(sorted_place_list[i]) for i in range(schedule.morning)]
-    lunch = None
     afternoon = [
         PlaceInfo.model_validate(sorted_place_list[i])
         for i in range(schedule.morning, schedule.morning + schedule.afternoon)
     ]
-    dinner = None
-    if schedule.morning and schedule.breakfast:
-        breakfast = PlaceInfo.model_validate(
-            random_eating_place_list(start_place=morning[0], end_place=None, place_list=eating_list)
-        )
-    if schedule.lunch:
-        if afternoon:
-            lunch = PlaceInfo.model_validate(
-                random_eating_place_list(start_place=morning[-1], end_place=afternoon[0], place_list=eating_list)
-            )
-        else:
-            lunch = PlaceInfo.model_validate(
-                random_eating_place_list(start_place=morning[-1], end_place=None, place_list=eating_list)
-            )
-    if schedule.dinner:
-        dinner = PlaceInfo.model_validate(
-            random_eating_place_list(start_place=afternoon[-1], end_place=None, place_list=eating_list)
-        )
+    breakfast, lunch, dinner = assign_eating_places(schedule, morning, afternoon, restaurant_index, rng)
     new_schedule = ScheduleInfo(breakfast=breakfast, morning=morning, lunch=lunch, afternoon=afternoon, dinner=dinner)
     return new_schedule
+
+
+def new_seed() -> int:
+    # 요청에 시드가 없을 때 쓸 시드. 응답으로 돌려줘서 같은 일정을 다시 만들 수 있게 함
+    return random.getrandbits(32)
+
+
+# 경로 생성 작업 (route_executor에서 실행, 프로세스 모드에서도 쓸 수 있게 모듈 최상위 함수로 둠)
+# 같은 (config, seed, 카탈로그 버전)이면 항상 같은 일정을 만듭니다.
+def generate_schedule(
+    snapshot: PlaceCatalogSnapshot, config: TravelRouteConfig, seed: int | None = None
+) -> ScheduleInfo:
+    return complete_place_list(
+        regions=config.regions,
+        themes=config.themes,
+        schedule=config.schedule,
+        place_index=snapshot.place_index,
+        restaurant_index=snapshot.restaurant_index,
+        distance_table=snapshot.distance_table,
+        rng=random.Random(seed),
+    )
+
+
+def regenerate_schedule(
+    snapshot: PlaceCatalogSnapshot, config: TravelRouteConfig, pined_place_list: list[Place], seed: int | None = None
+) -> ScheduleInfo:
+    return re_complete_place_list(
+        regions=config.regions,
+        themes=config.themes,
+        schedule=config.schedule,
+        pined_place_list=pined_place_list,
+        place_index=snapshot.place_index,
+        restaurant_index=snapshot.restaurant_index,
+        distance_table=snapshot.distance_table,
+        rng=random.Random(seed),
+    )
+
+
+def schedule_key(schedule: ScheduleInfo) -> tuple[int, ...]:
+    # 같은 장소를 같은 순서로 방문하는 일정이면 같은 후보로 봄
+    places = [
+        schedule.breakfast,
+        *(schedule.morning or []),
+        schedule.lunch,
+        *(schedule.afternoon or []),
+        schedule.dinner,
+    ]
+    return tuple(place.place_id if place else 0 for place in places)
+
+
+def generate_schedules(
+    snapshot: PlaceCatalogSnapshot, config: TravelRouteConfig, count: int, seed: int | None = None
+) -> list[ScheduleInfo]:
+    """
+    서로 다른 일정 후보를 최대 count개 만듭니다.
+    미리 계산한 거리 표가 없으면 후보마다 고른 장소끼리의 거리만 계산합니다.
+    (요청 안에서 카탈로그 전체의 거리 표를 만들면 장소 수의 제곱만큼 시간과 메모리가 듦)
+    """
+    rng = random.Random(seed)
+    schedules: dict[tuple[int, ...], ScheduleInfo] = {}
+    # 장소가 적으면 같은 일정이 반복해서 나오므로 시도 횟수를 제한
+    for _ in range(count * 3):
+        schedule = complete_place_list(
+            regions=config.regions,
+            themes=config.themes,
+            schedule=config.schedule,
+            place_index=snapshot.place_index,
+            restaurant_index=snapshot.restaurant_index,
+            distance_table=snapshot.distance_table,
+            rng=rng,
+        )
+        schedules.setdefault(schedule_key(schedule), schedule)
+        if len(schedules) >= count:
+            break
+    return list(schedules.values())
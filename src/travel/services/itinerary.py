@@ -0,0 +1,374 @@
+from dataclasses import dataclass
+from datetime import time
+from time import perf_counter
+from typing import Sequence
+
+import numpy as np
+
+from src.travel.models.enums import ThemeEnum
+from src.travel.models.place import Place
+from src.travel.services.shortest_path_sort import DistanceMatrix, haversine
+
+MINUTES_PER_DAY = 24 * 60
+EPSILON = 1e-6
+
+# 장소에 체류 시간이 없을 때 쓰는 테마별 기본 체류 시간(분)
+THEME_DWELL_MINUTES = {
+    ThemeEnum.해변: 60,
+    ThemeEnum.자연: 90,
+    ThemeEnum.카페: 60,
+    ThemeEnum.전시: 75,
+    ThemeEnum.액티비티: 120,
+    ThemeEnum.식당: 60,
+}
+# 장소에 영업시간이 없을 때 쓰는 테마별 기본 영업시간 (여기 없는 테마는 하루 종일)
+THEME_OPENING_HOURS = {
+    ThemeEnum.카페: (time(10, 0), time(21, 0)),
+    ThemeEnum.전시: (time(9, 0), time(18, 0)),
+    ThemeEnum.액티비티: (time(9, 0), time(18, 0)),
+    ThemeEnum.식당: (time(8, 0), time(21, 0)),
+}
+
+# 끼니: 식사 시간(분)과 식사를 시작할 수 있는 시간대
+BREAKFAST_MINUTES = 45
+LUNCH_MINUTES = 60
+LUNCH_WINDOW = (time(11, 30), time(14, 0))
+DINNER_MINUTES = 75
+DINNER_WINDOW = (time(17, 30), time(20, 30))
+DAY_END = time(21, 0)
+# 식당은 경로를 정한 뒤에 근처(3km 안팎)에서 고르므로, 경로를 짤 때는 끼니마다 이만큼 이동 시간을 더 잡아둠
+MEAL_LEG_MINUTES = 15
+
+# 일정 전체의 시간을 계산하는 횟수 제한. 12곳 일정 계산이 한 번에 수 µs라 다 써도 100ms 안에 끝나고,
+# 보통은 수천 번 안에 더 나아지지 않아서 멈춤. 벽시계 대신 횟수로 자르므로 서버 부하와 상관없이
+# 같은 입력(같은 seed)이면 같은 일정이 나옴
+ITINERARY_MAX_EVALUATIONS = 10_000
+
+
+def to_minutes(value: time) -> float:
+    return value.hour * 60 + value.minute + value.second / 60
+
+
+def from_minutes(minutes: float) -> time:
+    # 하루를 넘기면 23:59로 표시
+    rounded = min(max(int(round(minutes)), 0), MINUTES_PER_DAY - 1)
+    return time(rounded // 60, rounded % 60)
+
+
+@dataclass(frozen=True)
+class SpeedModel:
+    """
+    직선 거리(km)로 이동 시간(분)을 추정합니다.
+    도로는 직선보다 detour_factor배 길고, 장소를 옮길 때마다 주차/도보 시간(overhead_minutes)이 듭니다.
+    """
+
+    speed_kmh: float = 40.0
+    detour_factor: float = 1.3
+    overhead_minutes: float = 10.0
+
+    def leg_minutes(self, distance_km: float) -> float:
+        if distance_km <= 0:
+            return 0.0
+        return distance_km * self.detour_factor / self.speed_kmh * 60 + self.overhead_minutes
+
+    def travel_minutes(self, distance_matrix: DistanceMatrix) -> np.ndarray:
+        distances = np.asarray(distance_matrix, dtype=np.float64)
+        minutes: np.ndarray = distances * (self.detour_factor / self.speed_kmh * 60) + self.overhead_minutes
+        minutes[distances <= 0] = 0.0
+        return minutes
+
+
+DEFAULT_SPEED = SpeedModel()
+
+
+@dataclass(frozen=True)
+class Stop:
+    """
+    일정에 넣을 방문 하나. 시각은 모두 자정부터의 분입니다.
+    - node: 거리 행렬의 행 번호. 점심처럼 위치가 아직 정해지지 않은 일정은 None (앞뒤 장소 사이 이동 시간만 계산)
+    - opens 전에 도착하면 기다렸다가 시작하고, closes까지 머무는 시간을 마쳐야 합니다.
+    - required: 시간이 모자라도 빼지 않음 (고정한 장소, 점심)
+    """
+
+    node: int | None
+    dwell: float
+    opens: float = 0.0
+    closes: float = MINUTES_PER_DAY
+    required: bool = False
+
+
+def stop_for_place(place: Place, node: int | None, required: bool = False) -> Stop:
+    # 장소에 체류 시간/영업시간이 없으면 테마 기본값 사용
+    default_opens, default_closes = THEME_OPENING_HOURS.get(place.theme, (None, None))
+    opens = place.opens_at or default_opens
+    closes = place.closes_at or default_closes
+    return Stop(
+        node=node,
+        dwell=place.dwell_minutes or THEME_DWELL_MINUTES[place.theme],
+        opens=to_minutes(opens) if opens else 0.0,
+        closes=to_minutes(closes) if closes else MINUTES_PER_DAY,
+        required=required,
+    )
+
+
+def meal_stop(dwell: float, window: tuple[time, time] | None = None) -> Stop:
+    # 식당은 경로가 정해진 뒤에 고르므로 위치 없이 시간만 차지하는 일정으로 넣음
+    if window is None:
+        return Stop(node=None, dwell=dwell, required=True)
+    return Stop(
+        node=None, dwell=dwell, opens=to_minutes(window[0]), closes=to_minutes(window[1]) + dwell, required=True
+    )
+
+
+@dataclass
+class Itinerary:
+    route: list[int]  # 방문 순서 (stops의 인덱스)
+    arrivals: list[float]
+    departures: list[float]
+    skipped: list[int]  # 시간 안에 들어가지 않아 뺀 장소 (stops의 인덱스)
+    travel_minutes: float
+    lateness: float  # 영업시간과 하루 일정을 넘긴 시간(분)의 합. 0이면 모든 시간 제약을 지킴
+
+    @property
+    def feasible(self) -> bool:
+        return self.lateness <= EPSILON
+
+
+class _Planner:
+    """
+    plan_itinerary의 탐색 상태. 일정 계산은 가장 많이 불리는 부분이라 파이썬 리스트로 계산합니다.
+    """
+
+    def __init__(
+        self,
+        travel: list[list[float]],
+        stops: Sequence[Stop],
+        day_start: float,
+        day_end: float,
+        max_evaluations: int,
+        deadline: float | None,
+    ) -> None:
+        self.travel = travel
+        self.nodes = [stop.node for stop in stops]
+        self.dwells = [stop.dwell for stop in stops]
+        self.opens = [stop.opens for stop in stops]
+        self.closes = [stop.closes for stop in stops]
+        self.day_start = day_start
+        self.day_end = day_end
+        self.max_evaluations = max_evaluations
+        self.deadline = deadline
+        self.evaluations = 0
+
+    @property
+    def exhausted(self) -> bool:
+        if self.evaluations >= self.max_evaluations:
+            return True
+        return self.deadline is not None and perf_counter() > self.deadline
+
+    def evaluate(self, route: list[int]) -> tuple[float, float]:
+        # (시간 제약을 넘긴 시간, 끝나는 시각). 앞쪽이 작을수록, 같으면 뒤쪽이 작을수록 좋은 일정
+        self.evaluations += 1
+        travel = self.travel
+        t = self.day_start
+        last = None
+        lateness = 0.0
+        for index in route:
+            node = self.nodes[index]
+            if node is not None:
+                if last is not None:
+                    t += travel[last][node]
+                last = node
+            opens = self.opens[index]
+            if t < opens:
+                t = opens
+            t += self.dwells[index]
+            if t > self.closes[index]:
+                lateness += t - self.closes[index]
+        if t > self.day_end:
+            lateness += t - self.day_end
+        return lateness, t
+
+    def timeline(self, route: list[int]) -> tuple[list[float], list[float], float]:
+        arrivals = []
+        departures = []
+        travel_minutes = 0.0
+        t = self.day_start
+        last = None
+        for index in route:
+            node = self.nodes[index]
+            if node is not None:
+                if last is not None:
+                    t += self.travel[last][node]
+                    travel_minutes += self.travel[last][node]
+                last = node
+            arrivals.append(t)
+            t = max(t, self.opens[index]) + self.dwells[index]
+            departures.append(t)
+        return arrivals, departures, travel_minutes
+
+    def _insertion_deltas(self, route: list[int], index: int) -> list[float]:
+        # 위치마다 끼워넣었을 때 늘어나는 이동 시간 (위치 없는 일정은 0)
+        node = self.nodes[index]
+        if node is None:
+            return [0.0] * (len(route) + 1)
+        located = [self.nodes[i] for i in route]
+        before: list[int | None] = [None] * (len(route) + 1)
+        after: list[int | None] = [None] * (len(route) + 1)
+        for position in range(1, len(route) + 1):
+            previous = located[position - 1]
+            before[position] = previous if previous is not None else before[position - 1]
+        for position in range(len(route) - 1, -1, -1):
+            following = located[position]
+            after[position] = following if following is not None else after[position + 1]
+        deltas = []
+        for previous, following in zip(before, after):
+            delta = 0.0
+            if previous is not None:
+                delta += self.travel[previous][node]
+            if following is not None:
+                delta += self.travel[node][following]
+            if previous is not None and following is not None:
+                delta -= self.travel[previous][following]
+            deltas.append(delta)
+        return deltas
+
+    def insert_required(self, route: list[int], indexes: list[int]) -> list[int]:
+        # 고정한 장소는 시간 제약을 넘기더라도 가장 나은 자리에 넣음
+        for index in indexes:
+            best_route = route + [index]
+            best_cost = self.evaluate(best_route)
+            for position in range(len(route)):
+                candidate = route[:position] + [index] + route[position:]
+                cost = self.evaluate(candidate)
+                if _better(cost, best_cost):
+                    best_route, best_cost = candidate, cost
+            route = best_route
+        return route
+
+    def insert_optional(self, route: list[int], candidates: list[int], limit: int) -> tuple[list[int], int]:
+        """
+        이동 시간이 가장 적게 늘어나는 (장소, 자리)부터 시간 제약을 지키는지 확인해서 하나씩 끼워넣습니다.
+        """
+        added = 0
+        while candidates and added < limit and not self.exhausted:
+            lateness = self.evaluate(route)[0]
+            options = sorted(
+                (delta, index, position)
+                for index in candidates
+                for position, delta in enumerate(self._insertion_deltas(route, index))
+            )
+            for _, index, position in options:
+                if self.exhausted:
+                    return route, added
+                candidate = route[:position] + [index] + route[position:]
+                if self.evaluate(candidate)[0] <= lateness + EPSILON:
+                    route = candidate
+                    candidates.remove(index)
+                    added += 1
+                    break
+            else:
+                break
+        return route, added
+
+    def improve(self, route: list[int]) -> list[int]:
+        """
+        2-opt(구간 뒤집기)와 한 곳 옮기기로 시간 제약을 넘긴 시간, 끝나는 시각 순서로 줄입니다.
+        """
+        best_cost = self.evaluate(route)
+        improved = True
+        while improved and not self.exhausted:
+            improved = False
+            for i in range(len(route) - 1):
+                for j in range(i + 1, len(route)):
+                    if self.exhausted:
+                        return route
+                    candidate = route[:i] + route[i : j + 1][::-1] + route[j + 1 :]
+                    cost = self.evaluate(candidate)
+                    if _better(cost, best_cost):
+                        route, best_cost = candidate, cost
+                        improved = True
+            for i in range(len(route)):
+                rest = route[:i] + route[i + 1 :]
+                for position in range(len(rest) + 1):
+                    if position == i or self.exhausted:
+                        continue
+                    candidate = rest[:position] + [route[i]] + rest[position:]
+                    cost = self.evaluate(candidate)
+                    if _better(cost, best_cost):
+                        route, best_cost = candidate, cost
+                        improved = True
+                        break
+        return route
+
+
+def _better(cost: tuple[float, float], best: tuple[float, float]) -> bool:
+    if cost[0] < best[0] - EPSILON:
+        return True
+    return abs(cost[0] - best[0]) <= EPSILON and cost[1] < best[1] - EPSILON
+
+
+def plan_itinerary(
+    distance_matrix: DistanceMatrix,
+    stops: Sequence[Stop],
+    day_start: float,
+    day_end: float,
+    speed: SpeedModel = DEFAULT_SPEED,
+    max_optional: int | None = None,
+    max_evaluations: int = ITINERARY_MAX_EVALUATIONS,
+    time_budget: float | None = None,
+) -> Itinerary:
+    """
+    체류 시간과 영업시간이 있는 장소들로 day_start ~ day_end 안에 끝나는 하루 일정을 만듭니다.
+    (시간 제약이 있는 오리엔티어링 문제: 후보 중 시간 안에 들어가는 장소를 최대한 많이, 일찍 끝나게 방문)
+    - required 일정은 모두 넣고, 나머지는 시간 제약을 지키는 것만 최대 max_optional개까지 넣습니다.
+    - 이동 시간이 가장 적게 늘어나는 자리부터 끼워넣은 뒤 2-opt와 한 곳 옮기기로 다듬고,
+      그만큼 생긴 여유 시간에 빠진 장소를 다시 끼워넣습니다.
+    - max_evaluations(일정 계산 횟수)와 time_budget(초)으로 탐색량을 제한합니다.
+    """
+    deadline = perf_counter() + time_budget if time_budget is not None else None
+    travel = speed.travel_minutes(distance_matrix).tolist() if len(distance_matrix) else []
+    planner = _Planner(travel, stops, day_start, day_end, max_evaluations, deadline)
+    route = planner.insert_required([], [index for index, stop in enumerate(stops) if stop.required])
+    skipped = [index for index, stop in enumerate(stops) if not stop.required]
+    limit = len(skipped) if max_optional is None else max_optional
+    route, added = planner.insert_optional(route, skipped, limit)
+    limit -= added
+    while True:
+        route = planner.improve(route)
+        if not skipped or limit <= 0 or planner.exhausted:
+            break
+        # 다듬어서 생긴 여유 시간에 더 넣을 수 있는지 확인하고, 더 넣은 장소가 없으면 종료
+        route, added = planner.insert_optional(route, skipped, limit)
+        if not added:
+            break
+        limit -= added
+    arrivals, departures, travel_minutes = planner.timeline(route)
+    return Itinerary(
+        route=route,
+        arrivals=arrivals,
+        departures=departures,
+        skipped=sorted(skipped),
+        travel_minutes=travel_minutes,
+        lateness=planner.evaluate(route)[0],
+    )
+
+
+def visit_times(
+    coordinates: Sequence[tuple[float, float]],
+    stops: Sequence[Stop],
+    day_start: float,
+    speed: SpeedModel = DEFAULT_SPEED,
+) -> list[tuple[float, float]]:
+    """
+    정해진 순서대로 방문할 때 (도착, 떠나는) 시각(분)을 구합니다. 식당까지 정해진 뒤 실제 좌표로 다시 계산할 때 사용합니다.
+    """
+    times = []
+    t = day_start
+    for i, ((lat, lon), stop) in enumerate(zip(coordinates, stops)):
+        if i:
+            previous_lat, previous_lon = coordinates[i - 1]
+            t += speed.leg_minutes(haversine(previous_lat, previous_lon, lat, lon))
+        arrival = t
+        t = max(t, stop.opens) + stop.dwell
+        times.append((arrival, t))
+    return times
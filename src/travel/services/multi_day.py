@@ -0,0 +1,95 @@
+import math
+import random
+from bisect import bisect_right
+from typing import Sequence
+
+from src.travel.dtos.base_travel_route import ScheduleInfo, TravelRouteConfig
+from src.travel.models.place import Place
+from src.travel.services.generate_place_list import (
+    ITINERARY_POOL_FACTOR,
+    complete_place_list,
+)
+from src.travel.services.place_catalog import PlaceCatalogSnapshot
+from src.travel.services.place_index import PlaceIndex
+from src.travel.services.spatial_index import SpatialIndex
+
+DayKey = tuple[int, float]
+
+
+def day_key(place: Place) -> DayKey:
+    # 클러스터 번호는 중심의 경도 순서라서 (클러스터, 경도) 순으로 놓으면 서쪽부터 동쪽으로 이어진 띠가 됨
+    # 클러스터를 계산하지 않은 장소는 경도만으로 나눔
+    return (place.cluster_id if place.cluster_id is not None else -1, place.longitude)
+
+
+def places_per_day(config: TravelRouteConfig) -> int:
+    # 하루 일정을 만들 때 뽑는 관광지 수
+    count = config.schedule.morning + config.schedule.afternoon
+    return count * ITINERARY_POOL_FACTOR if config.schedule.start_time is not None else count
+
+
+def eligible_places(snapshot: PlaceCatalogSnapshot, config: TravelRouteConfig) -> list[Place]:
+    sampler = snapshot.place_index.sampler(themes=config.themes, regions=config.regions)
+    return [place for bucket in sampler.buckets.values() for place in bucket]
+
+
+def eligible_count(snapshot: PlaceCatalogSnapshot, config: TravelRouteConfig) -> int:
+    sampler = snapshot.place_index.sampler(themes=config.themes, regions=config.regions)
+    return sum(len(bucket) for bucket in sampler.buckets.values())
+
+
+def split_days(places: Sequence[Place], days: int, min_size: int = 1) -> list[DayKey]:
+    """
+    장소를 서쪽부터 days개의 띠로 나누는 경계(day_key)를 구합니다. 경계 수는 days - 1개입니다.
+    장소 수가 비슷하도록 나누되, 날마다 min_size개 이상이 남는 범위에서 가장 가까운 클러스터 경계에서 자릅니다.
+    식당처럼 나눌 때 쓰지 않은 장소도 같은 경계로 날짜를 정할 수 있습니다. (day_of)
+    """
+    ordered = sorted(places, key=lambda place: (day_key(place), place.id or 0))
+    total = len(ordered)
+    min_size = max(0, min(min_size, total // days))
+    cluster_edges = {i for i in range(1, total) if ordered[i - 1].cluster_id != ordered[i].cluster_id}
+    bounds = []
+    start = 0
+    for day in range(1, days):
+        # 나누어 떨어지지 않으면 앞쪽 날짜가 하나씩 더 가짐
+        target = math.ceil(total * day / days)
+        low = start + min_size
+        high = total - (days - day) * min_size
+        candidates = [i for i in cluster_edges if low <= i <= high]
+        if candidates:
+            cut = min(candidates, key=lambda i: (abs(i - target), i))
+        else:
+            cut = min(max(target, low), high)
+        if cut >= total:
+            # 장소가 날짜 수보다 적으면 뒤쪽 날짜는 비어 있음
+            bounds.append((2**31, float("inf")))
+        else:
+            bounds.append(day_key(ordered[cut]))
+        start = cut
+    return bounds
+
+
+def day_of(place: Place, bounds: Sequence[DayKey]) -> int:
+    return bisect_right(bounds, day_key(place))
+
+
+def generate_day_schedule(
+    snapshot: PlaceCatalogSnapshot, config: TravelRouteConfig, days: int, day: int, seed: int
+) -> ScheduleInfo:
+    """
+    여러 날 일정 중 day번째(0부터) 날의 일정을 만듭니다. (route_executor에서 날짜별로 동시에 실행)
+    모든 날짜가 같은 경계로 관광지와 식당을 나눠 가지므로 날짜끼리 같은 장소가 나오지 않습니다.
+    """
+    places = eligible_places(snapshot, config)
+    bounds = split_days(places, days, places_per_day(config))
+    day_places = [place for place in places if day_of(place, bounds) == day]
+    day_restaurants = [place for place in snapshot.restaurants if day_of(place, bounds) == day]
+    return complete_place_list(
+        regions=config.regions,
+        themes=config.themes,
+        schedule=config.schedule,
+        place_index=PlaceIndex(day_places),
+        restaurant_index=SpatialIndex(day_restaurants),
+        distance_table=snapshot.distance_table,
+        rng=random.Random(seed + day),
+    )
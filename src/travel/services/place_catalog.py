@@ -0,0 +1,183 @@
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass, field
+from functools import cached_property
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import settings
+from src.config.database.connection_async import AsyncSessionFactory
+from src.travel.models.enums import ThemeEnum
+from src.travel.models.place import Place
+from src.travel.services.distance_table import DistanceTable, distance_tables
+from src.travel.services.place_index import PlaceIndex
+from src.travel.services.spatial_index import SpatialIndex
+
+
+def catalog_fingerprint(places: tuple[Place, ...]) -> str:
+    """
+    장소 목록의 내용으로 버전 문자열을 만듭니다.
+    같은 데이터를 로드한 워커끼리는 항상 같은 버전을 가집니다.
+    클러스터 번호도 장소 추천 결과를 바꾸므로 다시 클러스터링하면 버전이 바뀝니다.
+    """
+    digest = hashlib.sha1()
+    for place in places:
+        digest.update(
+            f"{place.id}|{place.name}|{place.theme}|{place.region}|{place.latitude}|{place.longitude}|"
+            f"{place.dwell_minutes}|{place.opens_at}|{place.closes_at}|{place.cluster_id}\n".encode()
+        )
+    return digest.hexdigest()[:16]
+
+
+def coordinates_fingerprint(places: tuple[Place, ...]) -> str:
+    """
+    장소 id와 좌표만으로 만든 버전 문자열. 거리 표는 좌표로만 계산하므로
+    이름이나 머무는 시간, 영업시간만 바뀌었을 때는 거리 표를 그대로 사용할 수 있습니다.
+    """
+    digest = hashlib.sha1()
+    for place in places:
+        digest.update(f"{place.id}|{place.latitude}|{place.longitude}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class PlaceCatalogSnapshot:
+    """
+    한 시점의 전체 장소 목록(불변).
+    요청마다 DB를 다시 읽지 않고 이 스냅샷을 공유해서 사용합니다.
+    """
+
+    places: tuple[Place, ...]
+    version: str
+    # 거리 표 버전 (장소 id와 좌표만 반영)
+    distance_version: str = ""
+    # 관광지와 식당은 로드할 때 한 번만 나눠두고, 요청마다 다시 나누지 않음
+    attractions: tuple[Place, ...] = ()
+    restaurants: tuple[Place, ...] = ()
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def from_places(cls, places: list[Place]) -> "PlaceCatalogSnapshot":
+        ordered = tuple(sorted(places, key=lambda place: place.id or 0))
+        attractions: list[Place] = []
+        restaurants: list[Place] = []
+        for place in ordered:
+            (restaurants if place.theme == ThemeEnum.식당 else attractions).append(place)
+        return cls(
+            places=ordered,
+            version=catalog_fingerprint(ordered),
+            distance_version=coordinates_fingerprint(ordered),
+            attractions=tuple(attractions),
+            restaurants=tuple(restaurants),
+        )
+
+    @cached_property
+    def by_id(self) -> dict[int, Place]:
+        return {place.id: place for place in self.places if place.id is not None}
+
+    @cached_property
+    def place_index(self) -> PlaceIndex:
+        # 식당은 끼니 추천에서 따로 고르므로 관광지 인덱스에서 제외
+        return PlaceIndex(self.attractions)
+
+    @cached_property
+    def restaurant_index(self) -> SpatialIndex:
+        return SpatialIndex(self.restaurants)
+
+    @property
+    def distance_table(self) -> DistanceTable | None:
+        # 미리 계산한 거리 표가 이 스냅샷과 같은 좌표로 만들어졌을 때만 사용
+        # 표를 나중에 다시 만들 수 있으므로 스냅샷에 저장하지 않고 매번 확인
+        return distance_tables.for_version(self.distance_version)
+
+
+class PlaceCatalog:
+    """
+    애플리케이션 전역 장소 캐시.
+    - 시작 시 한 번 로드하고, TTL이 지나거나 invalidate()가 호출되면 다음 조회 때 다시 로드합니다.
+    - hit/miss/reload 횟수와 로드 시간을 기록합니다.
+    """
+
+    def __init__(
+        self, ttl_seconds: float, session_factory: async_sessionmaker[AsyncSession] = AsyncSessionFactory
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.session_factory = session_factory
+        self._snapshot: PlaceCatalogSnapshot | None = None
+        self._stale = False
+        # invalidate()가 호출될 때마다 증가. 다시 읽는 도중에 들어온 invalidate()를 놓치지 않기 위해 사용
+        self._generation = 0
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self.invalidations = 0
+        self.last_reload_seconds = 0.0
+        self.total_reload_seconds = 0.0
+
+    def _is_fresh(self, snapshot: PlaceCatalogSnapshot | None) -> bool:
+        if snapshot is None or self._stale:
+            return False
+        return time.monotonic() - snapshot.loaded_at < self.ttl_seconds
+
+    async def get(self) -> PlaceCatalogSnapshot:
+        snapshot = self._snapshot
+        if snapshot is not None and self._is_fresh(snapshot):
+            self.hits += 1
+            return snapshot
+        async with self._lock:
+            # 락을 기다리는 동안 다른 요청이 이미 다시 로드했을 수 있음
+            if self._snapshot is not None and self._is_fresh(self._snapshot):
+                self.hits += 1
+                return self._snapshot
+            self.misses += 1
+            return await self._reload()
+
+    async def reload(self) -> PlaceCatalogSnapshot:
+        async with self._lock:
+            return await self._reload()
+
+    async def _reload(self) -> PlaceCatalogSnapshot:
+        started = time.perf_counter()
+        generation = self._generation
+        async with self.session_factory() as session:
+            result = await session.execute(select(Place))
+            places = list(result.scalars().all())
+        snapshot = PlaceCatalogSnapshot.from_places(places)
+        elapsed = time.perf_counter() - started
+        self._snapshot = snapshot
+        # 읽는 동안 장소가 바뀌었으면 이 스냅샷은 이미 오래된 것이므로 다음 조회 때 다시 읽음
+        self._stale = self._generation != generation
+        self.reloads += 1
+        self.last_reload_seconds = elapsed
+        self.total_reload_seconds += elapsed
+        return snapshot
+
+    def invalidate(self) -> None:
+        """
+        장소가 추가/수정/삭제되면 호출합니다. 다음 get()에서 DB를 다시 읽습니다.
+        """
+        self._stale = True
+        self._generation += 1
+        self.invalidations += 1
+
+    def stats(self) -> dict[str, int | float | str | bool | None]:
+        snapshot = self._snapshot
+        return {
+            "version": snapshot.version if snapshot else None,
+            "distance_table": snapshot is not None and snapshot.distance_table is not None,
+            "place_count": len(snapshot.places) if snapshot else 0,
+            "attraction_count": len(snapshot.attractions) if snapshot else 0,
+            "restaurant_count": len(snapshot.restaurants) if snapshot else 0,
+            "hits": self.hits,
+            "misses": self.misses,
+            "reloads": self.reloads,
+            "invalidations": self.invalidations,
+            "last_reload_seconds": self.last_reload_seconds,
+            "total_reload_seconds": self.total_reload_seconds,
+        }
+
+
+place_catalog = PlaceCatalog(ttl_seconds=settings.PLACE_CATALOG_TTL_SECONDS)
@@ -0,0 +1,111 @@
+import argparse
+import asyncio
+import math
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import settings
+from src.config.database.connection_async import AsyncSessionFactory
+from src.travel.services.shortest_path_sort import EARTH_RADIUS_KM
+
+KMEANS_MAX_ITERATIONS = 50
+
+
+def project_km(lats: np.ndarray, lons: np.ndarray, ref_lat: float) -> np.ndarray:
+    # 위도/경도 -> 평면 좌표(km). 제주도 정도 범위에서는 등장방형 투영으로 충분
+    x = EARTH_RADIUS_KM * np.radians(lons) * math.cos(math.radians(ref_lat))
+    y = EARTH_RADIUS_KM * np.radians(lats)
+    return np.column_stack([x, y]).astype(np.float64)
+
+
+def _squared_distances(points: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    diff = points[:, None, :] - centroids[None, :, :]
+    distances: np.ndarray = np.einsum("ijk,ijk->ij", diff, diff)
+    return distances
+
+
+def kmeans(points: np.ndarray, k: int, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    """
+    k-means++로 초기 중심을 고른 뒤 Lloyd 반복으로 (중심, 각 점의 클러스터 번호)를 구합니다.
+    클러스터 번호는 중심의 경도 -> 위도 순서로 매겨서 같은 데이터면 항상 같은 번호가 나옵니다.
+    """
+    n = len(points)
+    k = min(k, n)
+    if k <= 0:
+        return np.zeros((0, 2)), np.zeros(0, dtype=np.int64)
+    rng = np.random.default_rng(seed)
+    centroids = np.empty((k, 2))
+    centroids[0] = points[rng.integers(n)]
+    closest = _squared_distances(points, centroids[:1])[:, 0]
+    for i in range(1, k):
+        total = closest.sum()
+        index = rng.choice(n, p=closest / total) if total > 0 else rng.integers(n)
+        centroids[i] = points[index]
+        closest = np.minimum(closest, _squared_distances(points, centroids[i : i + 1])[:, 0])
+
+    labels = np.zeros(n, dtype=np.int64)
+    for iteration in range(KMEANS_MAX_ITERATIONS):
+        new_labels = _squared_distances(points, centroids).argmin(axis=1)
+        if iteration and np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        counts = np.bincount(labels, minlength=k)
+        sums = np.zeros((k, 2))
+        np.add.at(sums, labels, points)
+        # 비어버린 클러스터는 이전 중심을 유지
+        nonempty = counts > 0
+        centroids[nonempty] = sums[nonempty] / counts[nonempty, None]
+
+    order = np.lexsort((centroids[:, 1], centroids[:, 0]))
+    relabel = np.empty(k, dtype=np.int64)
+    relabel[order] = np.arange(k)
+    return centroids[order], relabel[labels]
+
+
+def nearest_cluster(
+    lats: np.ndarray, lons: np.ndarray, centroid_lats: np.ndarray, centroid_lons: np.ndarray
+) -> np.ndarray:
+    """
+    장소마다 가장 가까운 클러스터 중심의 인덱스를 반환합니다. (장소가 추가/이동했을 때 점진적으로 배정)
+    """
+    ref_lat = float(centroid_lats.mean())
+    points = project_km(lats, lons, ref_lat)
+    centroids = project_km(centroid_lats, centroid_lons, ref_lat)
+    labels: np.ndarray = _squared_distances(points, centroids).argmin(axis=1)
+    return labels
+
+
+async def recluster_places(
+    cluster_count: int = settings.PLACE_CLUSTER_COUNT,
+    session_factory: async_sessionmaker[AsyncSession] = AsyncSessionFactory,
+) -> int:
+    """
+    전체 장소를 k-means로 다시 나누고 place.cluster_id를 갱신합니다. 반환값은 클러스터 수입니다.
+    """
+    # 순환 import를 피하기 위해 함수 안에서 import
+    from src.travel.repo.place_repo import PlaceRepository
+
+    async with session_factory() as session:
+        place_repo = PlaceRepository(session)
+        coordinates = await place_repo.get_coordinates()
+        if not coordinates:
+            return 0
+        ids = [place_id for place_id, _, _ in coordinates]
+        lats = np.array([lat for _, lat, _ in coordinates])
+        lons = np.array([lon for _, _, lon in coordinates])
+        _, labels = kmeans(project_km(lats, lons, float(lats.mean())), cluster_count)
+        await place_repo.update_clusters(dict(zip(ids, labels.tolist())))
+    return int(labels.max()) + 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="장소 클러스터 다시 계산")
+    parser.add_argument("--clusters", type=int, default=settings.PLACE_CLUSTER_COUNT)
+    args = parser.parse_args()
+    cluster_count = asyncio.run(recluster_places(args.clusters))
+    print(f"{cluster_count}개 클러스터로 나눔")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+import argparse
+import asyncio
+import os
+import posixpath
+import zipfile
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import IO, Any, Iterator
+from xml.etree.ElementTree import Element, iterparse
+
+from src.config import settings
+from src.config.database.connection_async import AsyncSessionFactory
+from src.travel.models.base import kst
+from src.travel.models.enums import RegionEnum, ThemeEnum
+from src.travel.repo.place_repo import PlaceRepository
+from src.travel.services.distance_table import distance_tables, rebuild_distance_table
+from src.travel.services.place_catalog import place_catalog
+
+MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PACKAGE_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+IMPORT_BATCH_SIZE = 2000
+# asyncpg는 쿼리 하나에 파라미터를 32767개까지 받음. upsert 한 행에 8개 열(cluster_id 포함)을 넣음
+MAX_IMPORT_BATCH_SIZE = 32767 // 8
+# 공유 문자열 표는 셀 번호로 바로 찾아야 해서 메모리에 올림. 비정상적으로 큰 파일은 거부
+MAX_SHARED_STRINGS = 1_000_000
+MAX_REPORTED_ERRORS = 20
+NAME_MAX_LENGTH = 100
+
+
+class PlaceImportError(ValueError):
+    pass
+
+
+@dataclass
+class ImportReport:
+    rows: int = 0
+    inserted: int = 0
+    updated: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    def add_error(self, row_number: int, message: str) -> None:
+        self.invalid += 1
+        # 잘못된 행이 아주 많아도 메모리가 늘지 않도록 앞쪽 몇 개만 보관
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(f"{row_number}행: {message}")
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def column_letters(cell_ref: str) -> str:
+    return cell_ref.rstrip("0123456789")
+
+
+def _text(element: Element) -> str:
+    # <t> 하나 또는 서식이 다른 여러 조각(<r><t>)으로 나뉜 문자열
+    return "".join(t.text or "" for t in element.iter(f"{MAIN_NS}t"))
+
+
+def _first_sheet(archive: zipfile.ZipFile) -> tuple[str, str]:
+    # workbook.xml의 첫 번째 시트 (이름, 파일 경로). 찾지 못하면 기본 경로
+    sheet: Element | None = None
+    try:
+        with archive.open("xl/workbook.xml") as workbook:
+            for _, element in iterparse(workbook):
+                if element.tag == f"{MAIN_NS}sheet":
+                    sheet = element
+                    break
+        if sheet is None:
+            raise PlaceImportError("시트가 없는 파일입니다.")
+        rel_id = sheet.get(f"{REL_NS}id")
+        with archive.open("xl/_rels/workbook.xml.rels") as rels:
+            for _, element in iterparse(rels):
+                if element.tag == f"{PACKAGE_REL_NS}Relationship" and element.get("Id") == rel_id:
+                    target = element.get("Target", "")
+                    path = target.lstrip("/") if target.startswith("/") else posixpath.join("xl", target)
+                    return sheet.get("name", "Sheet1"), path
+    except KeyError:
+        pass
+    return "Sheet1", "xl/worksheets/sheet1.xml"
+
+
+def _shared_strings(archive: zipfile.ZipFile) -> list[str]:
+    if "xl/sharedStrings.xml" not in archive.namelist():
+        return []
+    strings: list[str] = []
+    with archive.open("xl/sharedStrings.xml") as shared:
+        for _, element in iterparse(shared):
+            if element.tag == f"{MAIN_NS}si":
+                if len(strings) >= MAX_SHARED_STRINGS:
+                    raise PlaceImportError(f"공유 문자열이 {MAX_SHARED_STRINGS}개를 넘는 파일은 불러올 수 없습니다.")
+                strings.append(_text(element))
+                element.clear()
+    return strings
+
+
+def _cell_value(cell: Element, shared_strings: list[str], sheet_name: str) -> str:
+    cell_type = cell.get("t")
+    if cell_type == "inlineStr":
+        return _text(cell).strip()
+    value = cell.find(f"{MAIN_NS}v")
+    if value is None or value.text is None:
+        return ""
+    if cell_type == "s":
+        # 잘리거나 손상된 파일이면 공유 문자열 표에 없는 번호를 가리킬 수 있음
+        try:
+            index = int(value.text)
+        except ValueError:
+            index = -1
+        if not 0 <= index < len(shared_strings):
+            raise PlaceImportError(
+                f"{sheet_name} 시트 {cell.get('r', '?')} 셀: 공유 문자열 번호가 잘못됐습니다. ({value.text})"
+            )
+        return shared_strings[index].strip()
+    return value.text.strip()
+
+
+def iter_xlsx_rows(source: str | IO[bytes]) -> Iterator[tuple[int, dict[str, str]]]:
+    """
+    첫 번째 시트를 한 행씩 읽어 (행 번호, {헤더: 값})을 반환합니다.
+    시트는 메모리에 올리지 않고 처리한 행을 바로 버립니다.
+    셀이 가리키는 공유 문자열 표(sharedStrings.xml)만 메모리에 올리며, MAX_SHARED_STRINGS개까지 허용합니다.
+    """
+    try:
+        archive = zipfile.ZipFile(source)
+    except zipfile.BadZipFile:
+        raise PlaceImportError("xlsx 파일이 아닙니다.")
+    with archive:
+        shared_strings = _shared_strings(archive)
+        header: dict[str, str] | None = None
+        sheet_data: Element | None = None
+        sheet_name, sheet_path = _first_sheet(archive)
+        with archive.open(sheet_path) as sheet:
+            for event, element in iterparse(sheet, events=("start", "end")):
+                if element.tag == f"{MAIN_NS}sheetData" and event == "start":
+                    sheet_data = element
+                if element.tag != f"{MAIN_NS}row" or event != "end":
+                    continue
+                values = {
+                    column_letters(cell.get("r", "")): _cell_value(cell, shared_strings, sheet_name)
+                    for cell in element.iter(f"{MAIN_NS}c")
+                }
+                row_number = int(element.get("r", "0"))
+                if sheet_data is not None:
+                    sheet_data.clear()
+                if header is None:
+                    header = {column: name.strip().lower() for column, name in values.items() if name}
+                    continue
+                row = {header[column]: value for column, value in values.items() if column in header}
+                if any(row.values()):
+                    yield row_number, row
+
+
+def parse_place_row(row: dict[str, str], default_theme: ThemeEnum | None) -> dict[str, Any]:
+    """
+    한 행을 place 테이블에 넣을 값으로 바꿉니다. 값이 잘못됐으면 PlaceImportError를 발생시킵니다.
+    지역은 region 열이 없으면 address 열(읍/면/시)을 사용하고, 테마는 theme 열이 없으면 파일의 테마를 사용합니다.
+    """
+    name = row.get("name", "")
+    if not name:
+        raise PlaceImportError("이름이 없습니다.")
+    if len(name) > NAME_MAX_LENGTH:
+        raise PlaceImportError(f"이름이 {NAME_MAX_LENGTH}자를 넘습니다.")
+    theme_value = row.get("theme") or (default_theme.value if default_theme else "")
+    region_value = row.get("region") or row.get("address", "")
+    try:
+        theme = ThemeEnum(theme_value)
+    except ValueError:
+        raise PlaceImportError(f"알 수 없는 테마입니다: {theme_value!r}")
+    try:
+        region = RegionEnum(region_value)
+    except ValueError:
+        raise PlaceImportError(f"알 수 없는 지역입니다: {region_value!r}")
+    try:
+        latitude = float(row.get("latitude", ""))
+        longitude = float(row.get("longitude", ""))
+    except ValueError:
+        raise PlaceImportError("위도/경도가 없거나 숫자가 아닙니다.")
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        raise PlaceImportError("위도/경도 범위를 벗어났습니다.")
+    now = datetime.now(kst)
+    return {
+        "name": name,
+        "theme": theme,
+        "region": region,
+        "latitude": latitude,
+        "longitude": longitude,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def theme_from_filename(filename: str | None) -> ThemeEnum | None:
+    # 자연.xlsx, 해변.xlsx 처럼 파일 이름이 테마인 경우
+    if not filename:
+        return None
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    try:
+        return ThemeEnum(stem)
+    except ValueError:
+        return None
+
+
+async def import_places(
+    source: str | IO[bytes],
+    place_repo: PlaceRepository,
+    default_theme: ThemeEnum | None = None,
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> ImportReport:
+    """
+    xlsx 파일의 장소를 batch_size개씩 INSERT ... ON CONFLICT (name)으로 저장합니다.
+    같은 파일 안에서 이름이 겹치면 처음 나온 행만 사용하고, 이미 DB에 있는 이름은 위치/테마/지역을 갱신합니다.
+    batch_size는 1 ~ MAX_IMPORT_BATCH_SIZE 사이여야 합니다.
+    """
+    if not 1 <= batch_size <= MAX_IMPORT_BATCH_SIZE:
+        raise PlaceImportError(f"batch_size는 1 ~ {MAX_IMPORT_BATCH_SIZE} 사이여야 합니다.")
+    report = ImportReport()
+    seen_names: set[str] = set()
+    rows = iter_xlsx_rows(source)
+    while True:
+        # 압축 해제와 XML 파싱은 CPU 작업이라 이벤트 루프를 막지 않도록 스레드에서 한 배치씩 읽음
+        batch = await asyncio.to_thread(_read_batch, rows, default_theme, batch_size, seen_names, report)
+        if not batch:
+            break
+        inserted, updated = await place_repo.upsert_bulk(batch)
+        report.inserted += inserted
+        report.updated += updated
+    return report
+
+
+def _read_batch(
+    rows: Iterator[tuple[int, dict[str, str]]],
+    default_theme: ThemeEnum | None,
+    batch_size: int,
+    seen_names: set[str],
+    report: ImportReport,
+) -> list[dict[str, Any]]:
+    batch: list[dict[str, Any]] = []
+    for row_number, row in rows:
+        report.rows += 1
+        try:
+            values = parse_place_row(row, default_theme)
+        except PlaceImportError as e:
+            report.add_error(row_number, str(e))
+            continue
+        if values["name"] in seen_names:
+            report.duplicates += 1
+            continue
+        seen_names.add(values["name"])
+        batch.append(values)
+        if len(batch) >= batch_size:
+            break
+    return batch
+
+
+async def refresh_place_indexes(distance_table_path: str = settings.PLACE_DISTANCE_TABLE_PATH) -> None:
+    """
+    장소를 불러온 뒤 장소 캐시(공간/테마 인덱스 포함)를 다시 만들고, 거리 표를 쓰고 있었다면 거리 표도 다시 만듭니다.
+    """
+    if os.path.exists(distance_table_path):
+        await rebuild_distance_table(distance_table_path, session_factory=place_catalog.session_factory)
+        distance_tables.load(distance_table_path)
+    await place_catalog.reload()
+
+
+async def run_import(paths: list[str], theme: ThemeEnum | None, batch_size: int) -> list[ImportReport]:
+    reports = []
+    async with AsyncSessionFactory() as session:
+        place_repo = PlaceRepository(session)
+        for path in paths:
+            reports.append(await import_places(path, place_repo, theme or theme_from_filename(path), batch_size))
+    await refresh_place_indexes()
+    return reports
+
+
+def batch_size_arg(value: str) -> int:
+    batch_size = int(value)
+    if not 1 <= batch_size <= MAX_IMPORT_BATCH_SIZE:
+        raise argparse.ArgumentTypeError(f"1 ~ {MAX_IMPORT_BATCH_SIZE} 사이여야 합니다.")
+    return batch_size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="xlsx 파일에서 장소 불러오기")
+    parser.add_argument("paths", nargs="+", help="자연.xlsx 처럼 파일 이름이 테마인 파일은 --theme 없이 불러올 수 있음")
+    parser.add_argument("--theme", type=ThemeEnum, choices=list(ThemeEnum), default=None)
+    parser.add_argument("--batch-size", type=batch_size_arg, default=IMPORT_BATCH_SIZE)
+    args = parser.parse_args()
+    reports = asyncio.run(run_import(args.paths, args.theme, args.batch_size))
+    for path, report in zip(args.paths, reports):
+        print(
+            f"{path}: {report.rows}행, 추가 {report.inserted}, 갱신 {report.updated}, "
+            f"중복 {report.duplicates}, 오류 {report.invalid}"
+        )
+        for error in report.errors:
+            print(f"  {error}")
+
+
+if __name__ == "__main__":
+    main()
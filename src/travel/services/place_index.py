@@ -0,0 +1,155 @@
+import random
+from typing import Callable, Iterable, Sequence
+
+from src.travel.models.enums import RegionEnum, ThemeEnum
+from src.travel.models.place import Place
+from src.travel.services.shortest_path_sort import haversine
+
+# (테마, 지역, 클러스터). 클러스터를 계산하지 않은 장소는 None
+BucketKey = tuple[ThemeEnum, RegionEnum, int | None]
+# 시작 클러스터 옆에서 더 가져올 수 있는 클러스터 수
+MAX_ADJACENT_CLUSTERS = 2
+
+
+class PlaceIndex:
+    """
+    (테마, 지역, 클러스터) 조합별로 장소를 미리 나눠둔 인덱스.
+    카탈로그 스냅샷마다 한 번만 만들고, 요청마다 필터링하지 않습니다.
+    """
+
+    def __init__(self, places: Iterable[Place]) -> None:
+        buckets: dict[BucketKey, list[Place]] = {}
+        coordinate_sums: dict[int, list[float]] = {}
+        for place in places:
+            try:
+                key = (ThemeEnum(place.theme), RegionEnum(place.region), place.cluster_id)
+            except ValueError:
+                # 테마/지역 값이 잘못 저장된 장소는 추천 대상에서 제외
+                continue
+            buckets.setdefault(key, []).append(place)
+            if place.cluster_id is not None:
+                sums = coordinate_sums.setdefault(place.cluster_id, [0.0, 0.0, 0])
+                sums[0] += place.latitude
+                sums[1] += place.longitude
+                sums[2] += 1
+        self.buckets: dict[BucketKey, tuple[Place, ...]] = {key: tuple(value) for key, value in buckets.items()}
+        self.cluster_centroids: dict[int, tuple[float, float]] = {
+            cluster_id: (lat / count, lon / count) for cluster_id, (lat, lon, count) in coordinate_sums.items()
+        }
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self.buckets.values())
+
+    def choose_clusters(
+        self,
+        themes: Iterable[ThemeEnum],
+        regions: Iterable[RegionEnum],
+        count: int,
+        rng: random.Random,
+        around: Sequence[Place] = (),
+    ) -> set[int] | None:
+        """
+        장소를 뽑을 클러스터들을 고릅니다. 조건에 맞는 장소 수에 비례해 시작 클러스터를 고르고
+        (around가 있으면 그 장소들의 클러스터), count개를 채울 때까지 중심이 가까운 클러스터를 최대 2개 더합니다.
+        요청한 지역/테마 중 고른 클러스터에 없는 것이 있으면 그 지역/테마가 있는 가장 가까운 클러스터를 더 넣어
+        여러 지역/테마를 골고루 뽑을 수 있게 합니다.
+        클러스터 정보가 없거나 그래도 장소가 모자라면 None(전체에서 뽑기)을 반환합니다.
+        """
+        themes, regions = set(themes), set(regions)
+        counts: dict[int, int] = {}
+        covers: dict[int, set[ThemeEnum | RegionEnum]] = {}
+        for (theme, region, cluster_id), bucket in self.buckets.items():
+            if cluster_id is not None and theme in themes and region in regions:
+                counts[cluster_id] = counts.get(cluster_id, 0) + len(bucket)
+                covers.setdefault(cluster_id, set()).update((theme, region))
+        if not counts:
+            return None
+        seeds = {place.cluster_id for place in around if place.cluster_id in self.cluster_centroids}
+        if not seeds:
+            clusters = sorted(counts)
+            seeds = {rng.choices(clusters, weights=[counts[cluster_id] for cluster_id in clusters])[0]}
+        chosen: set[int] = {cluster_id for cluster_id in seeds if cluster_id is not None}
+        lat = sum(self.cluster_centroids[cluster_id][0] for cluster_id in chosen) / len(chosen)
+        lon = sum(self.cluster_centroids[cluster_id][1] for cluster_id in chosen) / len(chosen)
+        total = sum(counts.get(cluster_id, 0) for cluster_id in chosen)
+        neighbors = sorted(
+            (cluster_id for cluster_id in counts if cluster_id not in chosen),
+            key=lambda cluster_id: (haversine(lat, lon, *self.cluster_centroids[cluster_id]), cluster_id),
+        )
+        for cluster_id in neighbors[:MAX_ADJACENT_CLUSTERS]:
+            if total >= count:
+                break
+            chosen.add(cluster_id)
+            total += counts[cluster_id]
+        covered: set[ThemeEnum | RegionEnum] = set()
+        for cluster_id in chosen:
+            covered |= covers[cluster_id]
+        for cluster_id in neighbors:
+            if cluster_id not in chosen and covers[cluster_id] - covered:
+                chosen.add(cluster_id)
+                total += counts[cluster_id]
+                covered |= covers[cluster_id]
+        return chosen if total >= count else None
+
+    def sampler(
+        self,
+        themes: Iterable[ThemeEnum],
+        regions: Iterable[RegionEnum],
+        rng: random.Random | None = None,
+        excluded: Iterable[int] = (),
+    ) -> "PlaceSampler":
+        return PlaceSampler(self, set(themes), set(regions), rng, set(excluded))
+
+
+class PlaceSampler:
+    """
+    요청 하나에서 사용하는 비복원 추출기.
+    버킷을 복사하지 않고 버킷마다 희소 Fisher-Yates 셔플을 진행하므로 한 번 뽑는 비용이 O(버킷 수)입니다.
+    rng를 넘기면 같은 시드로 항상 같은 순서로 뽑습니다.
+    excluded에 있는 장소(다시 만들 때 고정한 장소 등)는 뽑히면 버리고 다시 뽑습니다.
+    """
+
+    def __init__(
+        self,
+        index: PlaceIndex,
+        themes: set[ThemeEnum],
+        regions: set[RegionEnum],
+        rng: random.Random | None = None,
+        excluded: set[int] | None = None,
+    ) -> None:
+        self.rng = rng or random.Random()
+        self.excluded = excluded or set()
+        self.buckets = {key: bucket for key, bucket in index.buckets.items() if key[0] in themes and key[1] in regions}
+        self._taken: dict[BucketKey, int] = {}
+        self._swaps: dict[BucketKey, dict[int, int]] = {}
+
+    def remaining(self, key: BucketKey) -> int:
+        return len(self.buckets[key]) - self._taken.get(key, 0)
+
+    def _draw(self, key: BucketKey) -> Place:
+        bucket = self.buckets[key]
+        taken = self._taken.get(key, 0)
+        swaps = self._swaps.setdefault(key, {})
+        position = self.rng.randrange(taken, len(bucket))
+        chosen = swaps.get(position, position)
+        swaps[position] = swaps.get(taken, taken)
+        self._taken[key] = taken + 1
+        return bucket[chosen]
+
+    def pick(self, condition: Callable[[BucketKey], bool] | None = None) -> Place | None:
+        """
+        condition을 만족하는 버킷들에 남아있는 장소 중 하나를 균등한 확률로 뽑습니다.
+        """
+        while True:
+            keys = []
+            weights = []
+            for key in self.buckets:
+                remaining = self.remaining(key)
+                if remaining and (condition is None or condition(key)):
+                    keys.append(key)
+                    weights.append(remaining)
+            if not keys:
+                return None
+            place = self._draw(self.rng.choices(keys, weights=weights)[0])
+            if place.id not in self.excluded:
+                return place
@@ -0,0 +1,129 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Hashable
+
+from src.config import settings
+from src.travel.dtos.base_travel_route import ScheduleInfo, TravelRouteConfig
+from src.travel.services.generate_place_list import new_seed
+
+CacheKey = tuple[Hashable, ...]
+
+
+def config_key(config: TravelRouteConfig) -> CacheKey:
+    # 지역/테마는 순서와 중복이 결과에 영향을 주지 않으므로 정렬해서 같은 키로 봄
+    schedule = config.schedule
+    return (
+        tuple(sorted({region.value for region in config.regions})),
+        tuple(sorted({theme.value for theme in config.themes})),
+        (schedule.breakfast, schedule.morning, schedule.lunch, schedule.afternoon, schedule.dinner),
+        (schedule.start_time, schedule.end_time),
+    )
+
+
+@dataclass
+class CacheEntry:
+    variants: list[tuple[int, ScheduleInfo]]
+    created_at: float = field(default_factory=time.monotonic)
+    cursor: int = 0
+
+
+class RouteCache:
+    """
+    생성한 일정을 (카탈로그 버전, 정규화한 config, seed) 키로 보관하는 LRU + TTL 캐시.
+    - seed를 준 요청: 같은 seed의 일정은 항상 같으므로 그대로 재사용합니다.
+    - seed가 없는 요청: 키마다 variants개의 일정을 새 seed로 만들어 모아두고, 다 모이면 돌아가며 반환합니다.
+      반환한 seed로 다시 요청하면 같은 일정을 받을 수 있습니다.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, variants: int) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.variants = variants
+        self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _get_entry(self, key: CacheKey) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.created_at >= self.ttl_seconds:
+            del self._entries[key]
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _put_entry(self, key: CacheKey, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def get(
+        self,
+        version: str,
+        config: TravelRouteConfig,
+        seed: int | None,
+        generate: Callable[[int], Awaitable[ScheduleInfo]],
+    ) -> tuple[int, ScheduleInfo]:
+        """
+        캐시에 있으면 (seed, 일정)을 바로 반환하고, 없으면 generate(seed)로 만들어 저장합니다.
+        """
+        if self.max_entries <= 0 or self.variants <= 0:
+            seed = seed if seed is not None else new_seed()
+            return seed, await generate(seed)
+
+        key = (version, config_key(config), seed)
+        entry = self._get_entry(key)
+        if seed is not None:
+            if entry is not None:
+                self.hits += 1
+                return entry.variants[0]
+            self.misses += 1
+            schedule = await generate(seed)
+            self._put_entry(key, CacheEntry(variants=[(seed, schedule)]))
+            return seed, schedule
+
+        if entry is not None and len(entry.variants) >= self.variants:
+            self.hits += 1
+            variant = entry.variants[entry.cursor % len(entry.variants)]
+            entry.cursor += 1
+            return variant
+        # 후보가 다 모일 때까지는 새 seed로 만들어 추가
+        self.misses += 1
+        seed = new_seed()
+        schedule = await generate(seed)
+        entry = self._get_entry(key)
+        if entry is None:
+            self._put_entry(key, CacheEntry(variants=[(seed, schedule)]))
+        elif len(entry.variants) < self.variants:
+            entry.variants.append((seed, schedule))
+        return seed, schedule
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        requests = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "variants": self.variants,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / requests if requests else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+route_cache = RouteCache(
+    max_entries=settings.ROUTE_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.ROUTE_CACHE_TTL_SECONDS,
+    variants=settings.ROUTE_CACHE_VARIANTS,
+)
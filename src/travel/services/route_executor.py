@@ -0,0 +1,154 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from fastapi import HTTPException
+
+from src.config import settings
+from src.travel.services.place_catalog import PlaceCatalogSnapshot
+
+T = TypeVar("T")
+
+# 프로세스 모드에서 워커 프로세스가 들고 있는 카탈로그 스냅샷
+_worker_snapshot: PlaceCatalogSnapshot | None = None
+
+
+def _init_worker(snapshot: PlaceCatalogSnapshot) -> None:
+    global _worker_snapshot
+    _worker_snapshot = snapshot
+
+
+def _run_job(
+    job: Callable[..., T], snapshot: PlaceCatalogSnapshot | None, args: tuple[Any, ...]
+) -> tuple[T, float, float]:
+    # 스냅샷을 넘기지 않았으면(프로세스 모드) 워커 초기화 때 받은 스냅샷 사용
+    started_at = time.time()
+    started = time.perf_counter()
+    result = job(snapshot if snapshot is not None else _worker_snapshot, *args)
+    return result, started_at, time.perf_counter() - started
+
+
+class RouteExecutor:
+    """
+    경로 생성처럼 CPU를 많이 쓰는 작업을 이벤트 루프 밖에서 실행합니다.
+    - kind="thread": 스레드 풀 (numpy 계산은 GIL을 놓음)
+    - kind="process": 프로세스 풀. 워커 시작 시 카탈로그 스냅샷을 한 번만 넘기고, 카탈로그 버전이 바뀌면 풀을 새로 만듭니다.
+    - 대기 중인 작업이 max_pending을 넘으면 503, timeout_seconds 안에 끝나지 않으면 504를 반환합니다.
+      504를 반환해도 이미 실행 중인 작업은 끝날 때까지 pending에 남습니다.
+    """
+
+    def __init__(self, kind: str, max_workers: int, max_pending: int, timeout_seconds: float) -> None:
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor kind: {kind}")
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.timeout_seconds = timeout_seconds
+        self._executor: Executor | None = None
+        self._snapshot_version: str | None = None
+        # pending은 작업이 끝난 풀 스레드에서도 줄이므로 잠금 사용
+        self._pending_lock = threading.Lock()
+        self.pending = 0
+        self.jobs = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.last_run_seconds = 0.0
+        self.max_run_seconds = 0.0
+        self.total_run_seconds = 0.0
+        self.total_wait_seconds = 0.0
+
+    def start(self, snapshot: PlaceCatalogSnapshot | None = None) -> None:
+        if self._executor is not None:
+            return
+        if self.kind == "thread":
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="route")
+        elif snapshot is not None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, initializer=_init_worker, initargs=(snapshot,)
+            )
+            self._snapshot_version = snapshot.version
+
+    def shutdown(self, cancel_futures: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=cancel_futures)
+        self._executor = None
+        self._snapshot_version = None
+
+    def _get_executor(self, snapshot: PlaceCatalogSnapshot) -> Executor:
+        if self.kind == "process" and self._snapshot_version != snapshot.version:
+            # 장소 데이터가 바뀌었으면 새 스냅샷으로 워커를 다시 띄움. 이전 풀에 쌓인 작업은 취소하지 않고 마저 실행
+            self.shutdown(cancel_futures=False)
+        self.start(snapshot)
+        assert self._executor is not None
+        return self._executor
+
+    async def run(self, snapshot: PlaceCatalogSnapshot, job: Callable[..., T], *args: Any) -> T:
+        """
+        job(snapshot, *args)를 풀에서 실행합니다. 프로세스 모드에서 job은 모듈 최상위 함수여야 합니다.
+        """
+        with self._pending_lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=503, detail="Too many route requests. Please retry later.", headers={"Retry-After": "1"}
+                )
+            self.pending += 1
+        try:
+            executor = self._get_executor(snapshot)
+            job_snapshot = None if self.kind == "process" else snapshot
+            submitted_at = time.time()
+            job_future = executor.submit(_run_job, job, job_snapshot, args)
+        except BaseException:
+            self._release()
+            raise
+        # 기다리다 타임아웃이 나도 작업은 풀에서 계속 실행되므로, 작업이 실제로 끝나거나 취소될 때 pending을 줄임
+        job_future.add_done_callback(lambda _: self._release())
+        try:
+            result, started_at, elapsed = await asyncio.wait_for(
+                asyncio.wrap_future(job_future), timeout=self.timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise HTTPException(status_code=504, detail="Route generation timed out.")
+        except HTTPException:
+            raise
+        except Exception:
+            self.errors += 1
+            raise
+        self.jobs += 1
+        self.last_run_seconds = elapsed
+        self.max_run_seconds = max(self.max_run_seconds, elapsed)
+        self.total_run_seconds += elapsed
+        self.total_wait_seconds += max(0.0, started_at - submitted_at)
+        return result
+
+    def _release(self) -> None:
+        with self._pending_lock:
+            self.pending -= 1
+
+    def stats(self) -> dict[str, int | float | str | None]:
+        return {
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "jobs": self.jobs,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "last_run_seconds": self.last_run_seconds,
+            "max_run_seconds": self.max_run_seconds,
+            "avg_run_seconds": self.total_run_seconds / self.jobs if self.jobs else 0.0,
+            "avg_wait_seconds": self.total_wait_seconds / self.jobs if self.jobs else 0.0,
+        }
+
+
+route_executor = RouteExecutor(
+    kind=settings.ROUTE_EXECUTOR_KIND,
+    max_workers=settings.ROUTE_EXECUTOR_WORKERS,
+    max_pending=settings.ROUTE_EXECUTOR_MAX_PENDING,
+    timeout_seconds=settings.ROUTE_EXECUTOR_TIMEOUT_SECONDS,
+)
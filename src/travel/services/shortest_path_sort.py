@@ -1,11 +1,26 @@
+import time
+from itertools import permutations
 from math import atan2, cos, radians, sin, sqrt
+from typing import Callable, Sequence
+
+import numpy as np
+from ortools.constraint_solver import pywrapcp, routing_enums_pb2
 
 from src import Place  # type: ignore
 
+DistanceMatrix = Sequence[Sequence[float]] | np.ndarray
+TspSolver = Callable[[DistanceMatrix, float | None], tuple[list[int], float]]
+
+# 장소 수에 따라 자동으로 고르는 풀이 방식의 경계
+BRUTE_FORCE_MAX_NODES = 7
+HELD_KARP_MAX_NODES = 15
+
+EARTH_RADIUS_KM = 6371
+
 
 # 위도경도로 실제 지구상의 거리를 구하는 공식(지구는 둥글다!)
 def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    r = 6371  # 지구 반지름 (km)
+    r = EARTH_RADIUS_KM  # 지구 반지름 (km)
     dlat = radians(lat2 - lat1)
     dlon = radians(lon2 - lon1)
     a = sin(dlat / 2) ** 2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
@@ -13,25 +28,82 @@ def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     return r * c
 
 
-# 거리 행렬 생성
-def create_distance_matrix(place_list: list[Place]) -> list[list[float]]:
-    n = len(place_list)
-    distance_matrix = [[0] * n for _ in range(n)]
+def haversine_one_to_many(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    한 지점에서 여러 지점까지의 거리(km)를 한 번에 계산합니다.
+    """
+    lat1 = np.radians(lat)
+    lat2 = np.radians(np.asarray(lats, dtype=np.float64))
+    dlat = lat2 - lat1
+    dlon = np.radians(np.asarray(lons, dtype=np.float64) - lon)
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    distances: np.ndarray = 2 * EARTH_RADIUS_KM * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    return distances
 
-    for i in range(n):
-        for j in range(n):
-            if place_list[i] != place_list[j]:
-                distance_matrix[i][j] = haversine(  # type: ignore
-                    place_list[i].latitude, place_list[i].longitude, place_list[j].latitude, place_list[j].longitude
-                )
 
-    return distance_matrix  # type: ignore
+def haversine_matrix(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    좌표 배열로 모든 쌍의 거리(km)를 담은 n x n float64 행렬을 만듭니다.
+    """
+    lat = np.radians(np.asarray(lats, dtype=np.float64))
+    lon = np.radians(np.asarray(lons, dtype=np.float64))
+    dlat = lat[:, None] - lat[None, :]
+    dlon = lon[:, None] - lon[None, :]
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat)[:, None] * np.cos(lat)[None, :] * np.sin(dlon / 2) ** 2
+    matrix: np.ndarray = 2 * EARTH_RADIUS_KM * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    np.fill_diagonal(matrix, 0.0)
+    return matrix
 
 
-from itertools import permutations
+def cross_track_distance(
+    lat1: float, lon1: float, lat2: float, lon2: float, lats: np.ndarray, lons: np.ndarray
+) -> np.ndarray:
+    """
+    A-B 대원 선분에서 각 지점까지의 최단 거리(km)를 구합니다.
+    수선의 발이 선분 밖에 있으면 가까운 끝점까지의 거리를 사용합니다.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    phi1, phi2 = np.radians(lat1), np.radians(lat2)
+    phis = np.radians(lats)
+    to_start = haversine_one_to_many(lat1, lon1, lats, lons)
+    to_end = haversine_one_to_many(lat2, lon2, lats, lons)
+    segment = haversine_one_to_many(lat1, lon1, np.array([lat2]), np.array([lon2]))[0]
+    if segment == 0:
+        return to_start
+
+    def bearing(phi_b: np.ndarray | float, dlon: np.ndarray | float) -> np.ndarray:
+        y = np.sin(dlon) * np.cos(phi_b)
+        x = np.cos(phi1) * np.sin(phi_b) - np.sin(phi1) * np.cos(phi_b) * np.cos(dlon)
+        return np.asarray(np.arctan2(y, x))
+
+    angle = bearing(phis, np.radians(lons - lon1)) - bearing(phi2, np.radians(lon2 - lon1))
+    delta = to_start / EARTH_RADIUS_KM
+    cross = np.arcsin(np.clip(np.sin(delta) * np.sin(angle), -1.0, 1.0))
+    along = np.arccos(np.clip(np.cos(delta) / np.cos(cross), -1.0, 1.0)) * EARTH_RADIUS_KM
+    distances: np.ndarray = np.abs(cross) * EARTH_RADIUS_KM
+    # A 뒤쪽이면 A까지, B를 지나면 B까지의 거리
+    distances = np.where(np.cos(angle) < 0, to_start, distances)
+    distances = np.where((np.cos(angle) >= 0) & (along > segment), to_end, distances)
+    return distances
+
+
+def place_coordinates(place_list: Sequence[Place]) -> tuple[np.ndarray, np.ndarray]:
+    lats = np.fromiter((place.latitude for place in place_list), dtype=np.float64, count=len(place_list))
+    lons = np.fromiter((place.longitude for place in place_list), dtype=np.float64, count=len(place_list))
+    return lats, lons
 
 
-def solve_tsp_brute_force(distance_matrix: list[list[float]]) -> tuple[list[int], float]:
+# 거리 행렬 생성
+def create_distance_matrix(place_list: list[Place]) -> list[list[float]]:
+    return haversine_matrix(*place_coordinates(place_list)).tolist()  # type: ignore
+
+
+def route_distance(distance_matrix: DistanceMatrix, route: Sequence[int]) -> float:
+    return float(sum(distance_matrix[route[i]][route[i + 1]] for i in range(len(route) - 1)))
+
+
+def solve_tsp_brute_force(distance_matrix: DistanceMatrix) -> tuple[list[int], float]:
     num_nodes = len(distance_matrix)
     nodes = list(range(num_nodes))  # 노드 인덱스 생성 (0, 1, 2, ..., n-1)
 
@@ -54,3 +126,205 @@ def solve_tsp_brute_force(distance_matrix: list[list[float]]) -> tuple[list[int]
             best_route = route
 
     return best_route, best_distance  # type: ignore
+
+
+def solve_tsp_held_karp(distance_matrix: DistanceMatrix) -> tuple[list[int], float]:
+    """
+    비트마스크 DP(Held-Karp)로 시작점이 자유로운 최단 경로를 구합니다. O(2^n * n^2)
+    같은 크기의 부분집합을 한 번에 numpy로 계산합니다.
+    """
+    dist = np.asarray(distance_matrix, dtype=np.float64)
+    num_nodes = len(dist)
+    if num_nodes < 2:
+        return list(range(num_nodes)), 0.0
+
+    full = 1 << num_nodes
+    masks = np.arange(full)
+    popcount = np.zeros(full, dtype=np.int64)
+    for node in range(num_nodes):
+        popcount += (masks >> node) & 1
+
+    # cost[mask, k]: mask에 속한 노드를 모두 방문하고 k에서 끝나는 최소 거리
+    cost = np.full((full, num_nodes), np.inf)
+    parent = np.full((full, num_nodes), -1, dtype=np.int8)
+    for node in range(num_nodes):
+        cost[1 << node, node] = 0.0
+
+    for size in range(2, num_nodes + 1):
+        layer = masks[popcount == size]
+        for node in range(num_nodes):
+            with_node = layer[(layer >> node) & 1 == 1]
+            # 직전 상태에 없는 노드는 cost가 inf 이므로 자동으로 제외됨
+            candidates = cost[with_node ^ (1 << node)] + dist[:, node]
+            best = candidates.argmin(axis=1)
+            cost[with_node, node] = candidates[np.arange(len(with_node)), best]
+            parent[with_node, node] = best
+
+    mask = full - 1
+    node = int(cost[mask].argmin())
+    best_distance = float(cost[mask, node])
+    route = []
+    while node != -1:
+        route.append(node)
+        previous = int(parent[mask, node])
+        mask ^= 1 << node
+        node = previous
+    route.reverse()
+    return route, best_distance
+
+
+def _nearest_neighbor_route(dist: list[list[float]], start: int) -> list[int]:
+    route = [start]
+    unvisited = set(range(len(dist))) - {start}
+    while unvisited:
+        current = dist[route[-1]]
+        nearest = min(unvisited, key=lambda node: current[node])
+        route.append(nearest)
+        unvisited.remove(nearest)
+    return route
+
+
+def _two_opt(route: list[int], dist: list[list[float]], deadline: float | None) -> bool:
+    # 구간 route[i:j+1]을 뒤집어서 거리가 줄어들면 적용 (시작/끝이 열린 경로)
+    improved = False
+    num_nodes = len(route)
+    for i in range(num_nodes - 1):
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+        for j in range(i + 1, num_nodes):
+            before = 0.0
+            after = 0.0
+            if i > 0:
+                before += dist[route[i - 1]][route[i]]
+                after += dist[route[i - 1]][route[j]]
+            if j < num_nodes - 1:
+                before += dist[route[j]][route[j + 1]]
+                after += dist[route[i]][route[j + 1]]
+            if after < before - 1e-9:
+                route[i : j + 1] = reversed(route[i : j + 1])
+                improved = True
+    return improved
+
+
+def _or_opt(route: list[int], dist: list[list[float]], deadline: float | None) -> bool:
+    # 1~3개짜리 구간을 떼어서 다른 위치에 끼워넣어 거리가 줄어들면 적용
+    improved = False
+    for length in (1, 2, 3):
+        i = 0
+        while i + length <= len(route):
+            if deadline is not None and time.perf_counter() > deadline:
+                return improved
+            segment = route[i : i + length]
+            rest = route[:i] + route[i + length :]
+            current = route_distance(dist, route)
+            best_route = None
+            best_distance = current - 1e-9
+            for position in range(len(rest) + 1):
+                if position == i:
+                    continue
+                for candidate_segment in (segment, segment[::-1]):
+                    candidate = rest[:position] + candidate_segment + rest[position:]
+                    distance = route_distance(dist, candidate)
+                    if distance < best_distance:
+                        best_distance = distance
+                        best_route = candidate
+            if best_route is not None:
+                route[:] = best_route
+                improved = True
+            i += 1
+    return improved
+
+
+def solve_tsp_heuristic(distance_matrix: DistanceMatrix, time_budget: float | None = None) -> tuple[list[int], float]:
+    """
+    최근접 이웃으로 초기 경로를 만들고 2-opt, Or-opt로 개선합니다.
+    time_budget(초)이 주어지면 그 시간 안에서만 개선합니다.
+    """
+    deadline = time.perf_counter() + time_budget if time_budget is not None else None
+    dist = np.asarray(distance_matrix, dtype=np.float64).tolist()
+    num_nodes = len(dist)
+    if num_nodes < 2:
+        return list(range(num_nodes)), 0.0
+
+    best_route = _nearest_neighbor_route(dist, 0)
+    for start in range(1, num_nodes):
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+        route = _nearest_neighbor_route(dist, start)
+        if route_distance(dist, route) < route_distance(dist, best_route):
+            best_route = route
+
+    while deadline is None or time.perf_counter() < deadline:
+        improved = _two_opt(best_route, dist, deadline)
+        improved = _or_opt(best_route, dist, deadline) or improved
+        if not improved:
+            break
+    return best_route, route_distance(dist, best_route)
+
+
+def solve_tsp_ortools(distance_matrix: DistanceMatrix, time_budget: float | None = None) -> tuple[list[int], float]:
+    """
+    OR-Tools 라우팅 솔버 사용. 거리가 0인 가상 출발점을 두어 시작/끝이 자유로운 경로로 만듭니다.
+    """
+    dist = np.asarray(distance_matrix, dtype=np.float64)
+    num_nodes = len(dist)
+    if num_nodes < 2:
+        return list(range(num_nodes)), 0.0
+
+    depot = num_nodes
+    scaled = np.zeros((num_nodes + 1, num_nodes + 1), dtype=np.int64)
+    scaled[:num_nodes, :num_nodes] = np.rint(dist * 1000)  # km -> m 정수
+    manager = pywrapcp.RoutingIndexManager(num_nodes + 1, 1, depot)
+    routing = pywrapcp.RoutingModel(manager)
+
+    def distance_callback(from_index: int, to_index: int) -> int:
+        return int(scaled[manager.IndexToNode(from_index)][manager.IndexToNode(to_index)])
+
+    transit = routing.RegisterTransitCallback(distance_callback)
+    routing.SetArcCostEvaluatorOfAllVehicles(transit)
+    parameters = pywrapcp.DefaultRoutingSearchParameters()
+    parameters.first_solution_strategy = routing_enums_pb2.FirstSolutionStrategy.PATH_CHEAPEST_ARC
+    if time_budget is not None:
+        parameters.local_search_metaheuristic = routing_enums_pb2.LocalSearchMetaheuristic.GUIDED_LOCAL_SEARCH
+        parameters.time_limit.FromMilliseconds(max(1, int(time_budget * 1000)))
+    solution = routing.SolveWithParameters(parameters)
+    if solution is None:
+        return solve_tsp_heuristic(dist, time_budget)
+
+    route = []
+    index = solution.Value(routing.NextVar(routing.Start(0)))
+    while not routing.IsEnd(index):
+        route.append(manager.IndexToNode(index))
+        index = solution.Value(routing.NextVar(index))
+    return route, route_distance(dist, route)
+
+
+TSP_SOLVERS: dict[str, TspSolver] = {
+    "brute_force": lambda distance_matrix, time_budget: solve_tsp_brute_force(distance_matrix),
+    "held_karp": lambda distance_matrix, time_budget: solve_tsp_held_karp(distance_matrix),
+    "heuristic": solve_tsp_heuristic,
+    "ortools": solve_tsp_ortools,
+}
+
+
+def select_tsp_solver(num_nodes: int) -> str:
+    if num_nodes <= BRUTE_FORCE_MAX_NODES:
+        return "brute_force"
+    if num_nodes <= HELD_KARP_MAX_NODES:
+        return "held_karp"
+    return "heuristic"
+
+
+def solve_tsp(
+    distance_matrix: DistanceMatrix, time_budget: float | None = None, solver: str | None = None
+) -> tuple[list[int], float]:
+    """
+    장소 수에 맞는 풀이 방식을 골라 최단 방문 순서를 구합니다.
+    - n <= 7: 완전 탐색, n <= 15: Held-Karp, 그 이상: 최근접 이웃 + 2-opt/Or-opt
+    - solver로 직접 지정할 수 있고("ortools" 포함), time_budget(초)은 휴리스틱 계열의 탐색 시간을 제한합니다.
+    """
+    if solver is None:
+        solver = select_tsp_solver(len(distance_matrix))
+    if solver not in TSP_SOLVERS:
+        raise ValueError(f"Unknown TSP solver: {solver}")
+    return TSP_SOLVERS[solver](distance_matrix, time_budget)
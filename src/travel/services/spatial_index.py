@@ -0,0 +1,118 @@
+import math
+from typing import Iterable, NamedTuple
+
+import numpy as np
+
+from src.travel.models.place import Place
+from src.travel.services.shortest_path_sort import (
+    EARTH_RADIUS_KM,
+    cross_track_distance,
+    haversine_one_to_many,
+    place_coordinates,
+)
+
+# 투영 좌표와 실제(구면) 거리의 차이를 감안해 후보 영역을 조금 넓게 잡음
+SEARCH_MARGIN = 1.01
+
+
+class Neighbor(NamedTuple):
+    place: Place
+    distance_km: float
+
+
+class SpatialIndex:
+    """
+    장소를 km 단위 격자 칸에 나눠 담은 공간 인덱스.
+    제주도 정도 범위에서는 등장방형 투영(위도 보정)으로 충분하므로, 주변 칸의 장소만 실제 거리로 확인합니다.
+    카탈로그 스냅샷마다 한 번만 만듭니다.
+    """
+
+    def __init__(self, places: Iterable[Place], cell_km: float = 2.0) -> None:
+        self.places = tuple(places)
+        self.cell_km = cell_km
+        self.lats, self.lons = place_coordinates(self.places)
+        self.ids = np.fromiter((place.id or 0 for place in self.places), dtype=np.int64, count=len(self.places))
+        self.ref_lat = float(self.lats.mean()) if len(self.places) else 0.0
+        self.xs, self.ys = self.project(self.lats, self.lons)
+
+        cells: dict[tuple[int, int], list[int]] = {}
+        for i, (x, y) in enumerate(zip(self.xs, self.ys)):
+            cells.setdefault((math.floor(x / cell_km), math.floor(y / cell_km)), []).append(i)
+        self.cells = {key: np.array(value, dtype=np.int64) for key, value in cells.items()}
+
+    def __len__(self) -> int:
+        return len(self.places)
+
+    def project(self, lats: np.ndarray | float, lons: np.ndarray | float) -> tuple[np.ndarray, np.ndarray]:
+        # 위도/경도 -> 평면 좌표(km)
+        x = EARTH_RADIUS_KM * np.radians(lons) * math.cos(math.radians(self.ref_lat))
+        y = EARTH_RADIUS_KM * np.radians(lats)
+        return np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+
+    def _candidates(self, x_min: float, x_max: float, y_min: float, y_max: float) -> np.ndarray:
+        cx_min, cx_max = math.floor(x_min / self.cell_km), math.floor(x_max / self.cell_km)
+        cy_min, cy_max = math.floor(y_min / self.cell_km), math.floor(y_max / self.cell_km)
+        if (cx_max - cx_min + 1) * (cy_max - cy_min + 1) >= len(self.cells):
+            # 검색 영역이 전체보다 크면 비어있는 칸까지 돌 필요 없이 모든 칸을 확인
+            keys: Iterable[tuple[int, int]] = (
+                key for key in self.cells if cx_min <= key[0] <= cx_max and cy_min <= key[1] <= cy_max
+            )
+        else:
+            keys = ((cx, cy) for cx in range(cx_min, cx_max + 1) for cy in range(cy_min, cy_max + 1))
+        found = [self.cells[key] for key in keys if key in self.cells]
+        if not found:
+            return np.zeros(0, dtype=np.int64)
+        return np.concatenate(found)
+
+    def _exclude(self, candidates: np.ndarray, exclude: set[int] | None) -> np.ndarray:
+        if not exclude or not len(candidates):
+            return candidates
+        return candidates[~np.isin(self.ids[candidates], list(exclude))]
+
+    def _neighbors(self, candidates: np.ndarray, distances: np.ndarray, k: int | None) -> list[Neighbor]:
+        order = np.argsort(distances, kind="stable")
+        if k is not None:
+            order = order[:k]
+        return [Neighbor(self.places[candidates[i]], float(distances[i])) for i in order]
+
+    def within_radius(
+        self, lat: float, lon: float, radius_km: float, k: int | None = None, exclude: set[int] | None = None
+    ) -> list[Neighbor]:
+        """
+        반경 radius_km 안의 장소를 가까운 순서로 반환합니다. k를 주면 가장 가까운 k개만 반환합니다.
+        """
+        xs, ys = self.project(lat, lon)
+        x, y = float(xs), float(ys)
+        margin = radius_km * SEARCH_MARGIN
+        candidates = self._exclude(self._candidates(x - margin, x + margin, y - margin, y + margin), exclude)
+        distances = haversine_one_to_many(lat, lon, self.lats[candidates], self.lons[candidates])
+        mask = distances <= radius_km
+        return self._neighbors(candidates[mask], distances[mask], k)
+
+    def nearest(self, lat: float, lon: float, k: int = 1, exclude: set[int] | None = None) -> list[Neighbor]:
+        """
+        거리 제한 없이 가장 가까운 k개를 반환합니다. 검색 반경을 두 배씩 넓혀가며 찾습니다.
+        """
+        available = len(self._exclude(np.arange(len(self.places)), exclude))
+        radius_km = self.cell_km
+        while True:
+            neighbors = self.within_radius(lat, lon, radius_km, k=k, exclude=exclude)
+            if len(neighbors) >= k or len(neighbors) >= available or radius_km > 2 * math.pi * EARTH_RADIUS_KM:
+                return neighbors
+            radius_km *= 2
+
+    def near_segment(
+        self, lat1: float, lon1: float, lat2: float, lon2: float, distance_km: float, exclude: set[int] | None = None
+    ) -> list[Neighbor]:
+        """
+        A-B 선분에서 distance_km 안에 있는 장소를 선분까지 가까운 순서로 반환합니다.
+        """
+        (ax, bx), (ay, by) = self.project(np.array([lat1, lat2]), np.array([lon1, lon2]))
+        margin = distance_km * SEARCH_MARGIN
+        candidates = self._candidates(
+            min(ax, bx) - margin, max(ax, bx) + margin, min(ay, by) - margin, max(ay, by) + margin
+        )
+        candidates = self._exclude(candidates, exclude)
+        distances = cross_track_distance(lat1, lon1, lat2, lon2, self.lats[candidates], self.lons[candidates])
+        mask = distances <= distance_km
+        return self._neighbors(candidates[mask], distances[mask], None)
@@ -0,0 +1,78 @@
+import os
+import timeit
+from math import sqrt
+
+import pytest
+
+from src.travel.dtos.base_travel_route import PlaceInfo
+from src.travel.models.place import Place
+from src.travel.services.generate_place_list import place_list_close_line
+from src.travel.services.spatial_index import SpatialIndex
+from src.travel.test.test_spatial_index import make_restaurants
+
+# 실행 시간이 걸리므로 RUN_BENCHMARKS=true 일 때만 실행
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.skipif(os.getenv("RUN_BENCHMARKS") != "true", reason="RUN_BENCHMARKS=true 일 때만 실행"),
+]
+
+
+def legacy_point_to_line_distance(
+    lat1: float, lon1: float, lat2: float, lon2: float, lat_rest: float, lon_rest: float
+) -> float:
+    # 이전 구현: 위도/경도(도 단위) 평면 직선 거리
+    numerator = abs((lon2 - lon1) * (lat_rest - lat1) - (lat2 - lat1) * (lon_rest - lon1))
+    denominator = sqrt((lon2 - lon1) ** 2 + (lat2 - lat1) ** 2)
+    return numerator / denominator
+
+
+def legacy_place_list_close_line(start_place: PlaceInfo, end_place: PlaceInfo, restaurants: list[Place]) -> list[Place]:
+    return [
+        restaurant
+        for restaurant in restaurants
+        if legacy_point_to_line_distance(
+            start_place.latitude,
+            start_place.longitude,
+            end_place.latitude,
+            end_place.longitude,
+            restaurant.latitude,
+            restaurant.longitude,
+        )
+        <= 3
+    ]
+
+
+class TestCorridorBenchmark:
+
+    @pytest.mark.parametrize("n", [100, 1000, 10000])
+    def test_corridor_filter(self, n: int) -> None:
+        restaurants = make_restaurants(n)
+        index = SpatialIndex(restaurants)
+        start_place = PlaceInfo(place_id=1, name="오전", latitude=33.25, longitude=126.3)
+        end_place = PlaceInfo(place_id=2, name="오후", latitude=33.48, longitude=126.55)
+
+        def legacy() -> list[Place]:
+            return legacy_place_list_close_line(start_place, end_place, restaurants)
+
+        def vectorized() -> list[Place]:
+            return place_list_close_line(start_place, end_place, restaurants)
+
+        def indexed() -> list[Place]:
+            return [
+                neighbor.place
+                for neighbor in index.near_segment(
+                    start_place.latitude, start_place.longitude, end_place.latitude, end_place.longitude, 3
+                )
+            ]
+
+        timings = {}
+        for name, func in [("legacy", legacy), ("vectorized", vectorized), ("indexed", indexed)]:
+            number = 20
+            timings[name] = min(timeit.repeat(func, number=number, repeat=5)) / number
+        print(f"\nn={n} " + " ".join(f"{name}={seconds * 1e6:.1f}us" for name, seconds in timings.items()))
+
+        # 이전 구현은 도 단위 거리를 km와 비교해서 사실상 모든 식당이 통과함
+        assert len(legacy()) > len(vectorized())
+        assert {place.id for place in vectorized()} == {place.id for place in indexed()}
+        if n >= 1000:
+            assert timings["indexed"] < timings["legacy"]
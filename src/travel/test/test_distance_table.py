@@ -0,0 +1,125 @@
+import os
+from datetime import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.travel.models.place import Place
+from src.travel.services.distance_table import (
+    DistanceTable,
+    DistanceTableError,
+    DistanceTableStore,
+    distance_tables,
+    rebuild_distance_table,
+)
+from src.travel.services.place_catalog import PlaceCatalogSnapshot
+from src.travel.services.shortest_path_sort import haversine_matrix, place_coordinates
+from src.travel.test.test_place_index import make_places
+
+
+@pytest.mark.asyncio
+class TestDistanceTable:
+
+    async def test_save_load(self, tmp_path: Path) -> None:
+        snapshot = PlaceCatalogSnapshot.from_places(make_places())
+        path = str(tmp_path / "distances.bin")
+        DistanceTable.build(snapshot.places, snapshot.version).save(path)
+
+        table = DistanceTable.load(path)
+        assert isinstance(table.matrix, np.memmap)
+        assert table.version == snapshot.version
+        assert len(table) == len(snapshot.places)
+
+        places = [snapshot.places[7], snapshot.places[2], snapshot.places[30]]
+        expected = haversine_matrix(*place_coordinates(places))
+        assert np.allclose(table.sub_matrix(places), expected, atol=1e-3)
+
+    async def test_unknown_place_fallback(self, tmp_path: Path) -> None:
+        snapshot = PlaceCatalogSnapshot.from_places(make_places())
+        table = DistanceTable.build(snapshot.places, snapshot.version)
+        new_place = Place(id=1000, name="새 장소", theme="자연", region="제주시", latitude=33.5, longitude=126.6)
+        places = [snapshot.places[0], new_place]
+        assert np.allclose(table.sub_matrix(places), haversine_matrix(*place_coordinates(places)))
+
+    async def test_invalid_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "distances.bin"
+        path.write_bytes(b"\0" * 128)
+        with pytest.raises(DistanceTableError):
+            DistanceTable.load(str(path))
+
+    async def test_store_version(self, tmp_path: Path) -> None:
+        snapshot = PlaceCatalogSnapshot.from_places(make_places())
+        path = str(tmp_path / "distances.bin")
+        DistanceTable.build(snapshot.places, snapshot.version).save(path)
+        store = DistanceTableStore()
+        assert store.load(str(tmp_path / "missing.bin")) is None
+        store.load(path)
+        assert store.for_version(snapshot.version) is store.table
+        assert store.for_version("other") is None
+
+    async def test_store_reopens_rebuilt_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        clock = [1000.0]
+        monkeypatch.setattr("src.travel.services.distance_table.time.monotonic", lambda: clock[0])
+        places = make_places()
+        old = PlaceCatalogSnapshot.from_places(places)
+        new = PlaceCatalogSnapshot.from_places(places[:-1])  # 장소 하나가 빠진 뒤
+        path = str(tmp_path / "distances.bin")
+        DistanceTable.build(old.places, old.distance_version).save(path)
+        store = DistanceTableStore(recheck_seconds=30)
+        store.load(path)
+        assert store.for_version(old.distance_version) is store.table
+
+        # 다른 프로세스가 파일을 다시 만듦
+        DistanceTable.build(new.places, new.distance_version).save(path)
+        stats = []
+        real_stat = os.stat
+
+        def counting_stat(stat_path: str) -> os.stat_result:
+            stats.append(stat_path)
+            return real_stat(stat_path)
+
+        monkeypatch.setattr("src.travel.services.distance_table.os.stat", counting_stat)
+        # 확인 간격 안에서는 파일을 보지 않고 바로 None
+        assert store.for_version(new.distance_version) is None
+        assert stats == [] and store.reloads == 0
+
+        clock[0] += 30
+        table = store.for_version(new.distance_version)
+        assert table is not None and len(table) == len(new.places) and store.reloads == 1
+        assert store.for_version(new.distance_version) is table
+
+        # 파일이 그대로면 다시 열지 않고, 여전히 맞지 않으면 None
+        clock[0] += 30
+        assert store.for_version(old.distance_version) is None
+        assert store.reloads == 1 and store.table is table
+
+    async def test_rebuild(self, tmp_path: Path, async_session: AsyncSession, place_list_init: list[Place]) -> None:
+        path = str(tmp_path / "distances.bin")
+        table = await rebuild_distance_table(path, session_factory=async_sessionmaker(bind=async_session.bind))
+        assert len(table) == len(place_list_init)
+        assert DistanceTable.load(path).version == table.version
+
+    async def test_version_ignores_non_coordinate_fields(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        places = make_places()
+        snapshot = PlaceCatalogSnapshot.from_places(places)
+        path = str(tmp_path / "distances.bin")
+        DistanceTable.build(snapshot.places, snapshot.distance_version).save(path)
+        monkeypatch.setattr(distance_tables, "table", DistanceTable.load(path))
+        assert snapshot.distance_table is distance_tables.table
+
+        # 이름/머무는 시간/영업시간만 바뀌면 카탈로그 버전은 바뀌어도 거리 표는 그대로 사용
+        edited = [place.model_copy() for place in places]
+        edited[0].name = "이름 변경"
+        edited[1].dwell_minutes = 150
+        edited[2].opens_at, edited[2].closes_at = time(10, 0), time(18, 0)
+        edited_snapshot = PlaceCatalogSnapshot.from_places(edited)
+        assert edited_snapshot.version != snapshot.version
+        assert edited_snapshot.distance_table is distance_tables.table
+
+        # 위치가 바뀌거나 장소가 빠지면 다시 만들 때까지 사용하지 않음
+        moved = [place.model_copy() for place in places]
+        moved[0].latitude += 0.01
+        assert PlaceCatalogSnapshot.from_places(moved).distance_table is None
+        assert PlaceCatalogSnapshot.from_places(places[1:]).distance_table is None
@@ -0,0 +1,183 @@
+import random
+from datetime import time
+
+import numpy as np
+
+from src.travel.dtos.base_travel_route import Schedule, ScheduleInfo
+from src.travel.models.enums import RegionEnum, ThemeEnum
+from src.travel.models.place import Place
+from src.travel.services.generate_place_list import (
+    complete_place_list,
+    re_complete_place_list,
+)
+from src.travel.services.itinerary import (
+    SpeedModel,
+    Stop,
+    from_minutes,
+    plan_itinerary,
+    stop_for_place,
+    to_minutes,
+)
+from src.travel.services.place_catalog import PlaceCatalogSnapshot
+
+
+def line_matrix(count: int, step_km: float = 10.0) -> np.ndarray:
+    # 일직선 위에 step_km 간격으로 놓인 장소들
+    positions = np.arange(count) * step_km
+    matrix: np.ndarray = np.abs(positions[:, None] - positions[None, :])
+    return matrix
+
+
+def make_catalog(seed: int = 0) -> PlaceCatalogSnapshot:
+    rng = random.Random(seed)
+    themes = [ThemeEnum.자연, ThemeEnum.카페, ThemeEnum.전시, ThemeEnum.식당]
+    places = [
+        Place(
+            id=i + 1,
+            name=f"장소{i}",
+            theme=themes[i % len(themes)],
+            region=RegionEnum.제주시,
+            latitude=33.45 + rng.gauss(0, 0.03),
+            longitude=126.55 + rng.gauss(0, 0.04),
+        )
+        for i in range(80)
+    ]
+    return PlaceCatalogSnapshot.from_places(places)
+
+
+class TestSpeedModel:
+
+    def test_travel_minutes(self) -> None:
+        speed = SpeedModel(speed_kmh=60, detour_factor=1.0, overhead_minutes=5)
+        minutes = speed.travel_minutes(line_matrix(3))
+        assert minutes.tolist() == [[0, 15, 25], [15, 0, 15], [25, 15, 0]]
+        assert speed.leg_minutes(30) == 35 and speed.leg_minutes(0) == 0
+
+    def test_stop_for_place(self) -> None:
+        place = Place(name="미술관", theme=ThemeEnum.전시, region=RegionEnum.제주시, latitude=33.5, longitude=126.5)
+        stop = stop_for_place(place, node=0)
+        assert (stop.dwell, from_minutes(stop.opens), from_minutes(stop.closes)) == (75, time(9, 0), time(18, 0))
+        # 장소에 값이 있으면 테마 기본값보다 우선
+        place.dwell_minutes, place.opens_at = 30, time(13, 0)
+        stop = stop_for_place(place, node=0, required=True)
+        assert (stop.dwell, from_minutes(stop.opens), stop.required) == (30, time(13, 0), True)
+
+
+class TestPlanItinerary:
+    speed = SpeedModel(speed_kmh=60, detour_factor=1.0, overhead_minutes=0)
+
+    def test_visits_all_when_time_allows(self) -> None:
+        stops = [Stop(node=i, dwell=30) for i in range(5)]
+        itinerary = plan_itinerary(line_matrix(5), stops, 540, 1080, speed=self.speed)
+        assert itinerary.feasible and itinerary.skipped == []
+        # 일직선이면 한쪽 끝에서 다른 쪽 끝으로 (이동 40분 + 체류 150분)
+        assert itinerary.route in ([0, 1, 2, 3, 4], [4, 3, 2, 1, 0])
+        assert itinerary.travel_minutes == 40 and itinerary.departures[-1] == 540 + 190
+        assert itinerary.arrivals[1] == itinerary.departures[0] + 10
+
+    def test_opening_hours(self) -> None:
+        # 1번은 13시에 열어서 가까워도 나중에 방문하고, 일찍 도착하면 기다림
+        stops = [Stop(node=0, dwell=60), Stop(node=1, dwell=60, opens=780), Stop(node=2, dwell=60)]
+        itinerary = plan_itinerary(line_matrix(3), stops, 540, 1080, speed=self.speed)
+        assert itinerary.feasible
+        assert itinerary.route[-1] == 1
+        position = itinerary.route.index(1)
+        assert itinerary.departures[position] == 780 + 60
+
+    def test_drops_what_does_not_fit(self) -> None:
+        stops = [Stop(node=i, dwell=120) for i in range(6)]
+        itinerary = plan_itinerary(line_matrix(6, step_km=1), stops, 540, 900, speed=self.speed)
+        assert itinerary.feasible
+        assert len(itinerary.route) == 2 and len(itinerary.skipped) == 4
+        limited = plan_itinerary(
+            line_matrix(6, step_km=1), [Stop(node=i, dwell=10) for i in range(6)], 540, 900, max_optional=3
+        )
+        assert len(limited.route) == 3
+
+    def test_required_and_meal_stops(self) -> None:
+        stops = [
+            Stop(node=0, dwell=90),
+            Stop(node=1, dwell=90),
+            Stop(node=2, dwell=600, required=True),  # 시간 안에 안 들어가도 빼지 않음
+            Stop(node=None, dwell=60, opens=690, closes=900, required=True),
+        ]
+        itinerary = plan_itinerary(line_matrix(3), stops, 540, 1080, speed=self.speed)
+        assert 2 in itinerary.route and 3 in itinerary.route
+        assert not itinerary.feasible
+
+        stops = [Stop(node=i, dwell=60) for i in range(4)] + [
+            Stop(node=None, dwell=60, opens=690, closes=900, required=True)
+        ]
+        itinerary = plan_itinerary(line_matrix(4), stops, 540, 1080, speed=self.speed)
+        assert itinerary.feasible and len(itinerary.route) == 5
+        lunch = itinerary.route.index(4)
+        assert 690 <= itinerary.departures[lunch] - 60 <= 840
+        # 위치 없는 일정은 이동 시간에 영향이 없음
+        assert itinerary.travel_minutes == 30
+
+    def test_evaluation_budget(self) -> None:
+        rng = np.random.default_rng(0)
+        points = rng.uniform(0, 30, size=(24, 2))
+        matrix = np.linalg.norm(points[:, None, :] - points[None, :, :], axis=2)
+        stops = [Stop(node=i, dwell=30, opens=float(rng.choice([0, 600, 720]))) for i in range(24)]
+        first = plan_itinerary(matrix, stops, 540, 1200, max_optional=12)
+        assert first.feasible and len(first.route) == 12
+        assert plan_itinerary(matrix, stops, 540, 1200, max_optional=12).route == first.route
+        small = plan_itinerary(matrix, stops, 540, 1200, max_optional=12, max_evaluations=50)
+        assert len(small.route) <= 12
+
+
+class TestTimedSchedule:
+
+    def test_complete_place_list(self) -> None:
+        snapshot = make_catalog()
+        schedule = Schedule(
+            breakfast=True, morning=3, lunch=True, afternoon=3, dinner=True, start_time=time(9, 0), end_time=time(21, 0)
+        )
+
+        def generate(seed: int) -> ScheduleInfo:
+            return complete_place_list(
+                regions=[RegionEnum.제주시],
+                themes=[ThemeEnum.자연, ThemeEnum.카페, ThemeEnum.전시],
+                schedule=schedule,
+                place_index=snapshot.place_index,
+                restaurant_index=snapshot.restaurant_index,
+                rng=random.Random(seed),
+            )
+
+        result = generate(1)
+        assert result.morning is not None and result.afternoon is not None and result.timeline is not None
+        morning, afternoon, timeline = result.morning, result.afternoon, result.timeline
+        places = [result.breakfast, *morning, result.lunch, *afternoon, result.dinner]
+        assert len(morning) + len(afternoon) <= 6
+        assert [visit.place_id for visit in timeline] == [place.place_id for place in places if place]
+        assert len(timeline) == len(places)
+        assert timeline[0].arrival == time(9, 0) and timeline[-1].departure <= time(21, 0)
+        for previous, visit in zip(timeline, timeline[1:]):
+            assert previous.departure <= visit.arrival <= visit.departure
+        # 점심은 11:30 ~ 14:00에 시작, 관광지는 영업시간 안에 둘러봄
+        lunch = timeline[len(morning) + 1]
+        assert time(12, 30) <= lunch.departure <= time(15, 0)
+        visits = {visit.place_id: visit for visit in timeline}
+        for place_info in morning + afternoon:
+            stop = stop_for_place(snapshot.by_id[place_info.place_id], node=None)
+            assert to_minutes(visits[place_info.place_id].departure) <= stop.closes
+        assert generate(1) == result
+
+    def test_re_complete_place_list(self) -> None:
+        snapshot = make_catalog()
+        schedule = Schedule(breakfast=False, morning=2, lunch=True, afternoon=2, dinner=False, start_time=time(10, 0))
+        pined = [place for place in snapshot.attractions if place.theme == ThemeEnum.자연][:2]
+        result = re_complete_place_list(
+            place_index=snapshot.place_index,
+            regions=[RegionEnum.제주시],
+            themes=[ThemeEnum.자연, ThemeEnum.카페],
+            schedule=schedule,
+            pined_place_list=pined,
+            restaurant_index=snapshot.restaurant_index,
+            rng=random.Random(0),
+        )
+        place_ids = [place.place_id for place in result.morning + result.afternoon]  # type: ignore
+        assert {place.id for place in pined} <= set(place_ids) and len(place_ids) <= 4
+        assert result.breakfast is None and result.lunch is not None
+        assert len(result.timeline) == len(place_ids) + 1  # type: ignore
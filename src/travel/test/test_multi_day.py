@@ -0,0 +1,83 @@
+import random
+
+from src.travel.dtos.base_travel_route import Schedule, ScheduleInfo, TravelRouteConfig
+from src.travel.models.enums import RegionEnum, ThemeEnum
+from src.travel.models.place import Place
+from src.travel.services.multi_day import day_of, generate_day_schedule, split_days
+from src.travel.services.place_catalog import PlaceCatalogSnapshot
+
+# 서쪽부터 한림, 제주시, 성산 부근
+CENTERS = [(33.41, 126.27), (33.50, 126.53), (33.44, 126.92)]
+
+
+def make_places(clustered: bool = True, per_center: int = 20) -> list[Place]:
+    rng = random.Random(0)
+    places: list[Place] = []
+    for center_index, (lat, lon) in enumerate(CENTERS):
+        for i in range(per_center):
+            places.append(
+                Place(
+                    id=len(places) + 1,
+                    name=f"장소{center_index}-{i}",
+                    theme=[ThemeEnum.자연, ThemeEnum.카페, ThemeEnum.식당][i % 3],
+                    region=RegionEnum.제주시,
+                    latitude=lat + rng.gauss(0, 0.01),
+                    longitude=lon + rng.gauss(0, 0.01),
+                    cluster_id=center_index if clustered else None,
+                )
+            )
+    return places
+
+
+def visited_ids(schedule: ScheduleInfo) -> list[int]:
+    places = [
+        schedule.breakfast,
+        *(schedule.morning or []),
+        schedule.lunch,
+        *(schedule.afternoon or []),
+        schedule.dinner,
+    ]
+    return [place.place_id for place in places if place]
+
+
+class TestSplitDays:
+
+    def test_cuts_at_cluster_edges(self) -> None:
+        places = make_places()
+        bounds = split_days(places, 3)
+        assert len(bounds) == 2
+        # 클러스터가 하나씩 하루가 됨
+        assert all(day_of(place, bounds) == place.cluster_id for place in places)
+        # 날마다 필요한 장소 수를 채울 수 있으면 클러스터 경계가 아니어도 자름
+        bounds = split_days(places[:25], 2, min_size=12)
+        days = [day_of(place, bounds) for place in places[:25]]
+        assert days.count(0) >= 12 and days.count(1) >= 12
+
+    def test_without_clusters(self) -> None:
+        places = make_places(clustered=False)
+        bounds = split_days(places, 2)
+        days = [day_of(place, bounds) for place in places]
+        assert days.count(0) == days.count(1) == 30
+        west = max(place.longitude for place, day in zip(places, days) if day == 0)
+        assert all(place.longitude > west for place, day in zip(places, days) if day == 1)
+        # 장소가 날짜 수보다 적으면 뒤쪽 날짜가 빔
+        bounds = split_days(places[:1], 3)
+        assert len(bounds) == 2 and day_of(places[0], bounds) == 0
+
+
+class TestGenerateDaySchedule:
+
+    def test_no_repeated_places(self) -> None:
+        for clustered in (True, False):
+            snapshot = PlaceCatalogSnapshot.from_places(make_places(clustered))
+            config = TravelRouteConfig(
+                regions=[RegionEnum.제주시],
+                themes=[ThemeEnum.자연, ThemeEnum.카페],
+                schedule=Schedule(breakfast=True, morning=3, lunch=True, afternoon=3, dinner=True),
+            )
+            schedules = [generate_day_schedule(snapshot, config, 3, day, seed=7) for day in range(3)]
+            place_ids = [place_id for schedule in schedules for place_id in visited_ids(schedule)]
+            assert len(place_ids) == 3 * 9
+            assert len(set(place_ids)) == len(place_ids)
+            # 같은 seed면 같은 일정
+            assert generate_day_schedule(snapshot, config, 3, 1, seed=7) == schedules[1]
@@ -0,0 +1,77 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.travel.models.place import Place, PlaceUpdate
+from src.travel.repo.place_repo import PlaceRepository
+from src.travel.services.place_catalog import PlaceCatalog, place_catalog
+
+
+@pytest.mark.asyncio
+class TestPlaceCatalog:
+
+    async def test_get_loads_once(self, async_session: AsyncSession, place_list_init: list[Place]) -> None:
+        catalog = PlaceCatalog(ttl_seconds=600, session_factory=async_sessionmaker(bind=async_session.bind))
+        first = await catalog.get()
+        second = await catalog.get()
+        assert first is second
+        assert len(first.places) == len(place_list_init)
+        assert [place.id for place in first.places] == sorted(place.id for place in place_list_init)  # type: ignore
+        stats = catalog.stats()
+        assert stats["misses"] == 1 and stats["hits"] == 1 and stats["reloads"] == 1
+
+    async def test_partitioned_places(self, async_session: AsyncSession, place_list_init: list[Place]) -> None:
+        catalog = PlaceCatalog(ttl_seconds=600, session_factory=async_sessionmaker(bind=async_session.bind))
+        snapshot = await catalog.get()
+        restaurant_ids = {place.id for place in place_list_init if place.theme == "식당"}
+        assert restaurant_ids and {place.id for place in snapshot.restaurants} == restaurant_ids
+        assert {place.id for place in snapshot.attractions} == {place.id for place in place_list_init} - restaurant_ids
+        assert len(snapshot.restaurant_index) == len(restaurant_ids)
+        assert len(snapshot.place_index) == len(snapshot.attractions)
+        stats = catalog.stats()
+        assert stats["attraction_count"] + stats["restaurant_count"] == stats["place_count"]  # type: ignore
+
+    async def test_ttl_expired_reload(self, async_session: AsyncSession, place_list_init: list[Place]) -> None:
+        catalog = PlaceCatalog(ttl_seconds=0, session_factory=async_sessionmaker(bind=async_session.bind))
+        first = await catalog.get()
+        second = await catalog.get()
+        assert first is not second
+        assert first.version == second.version  # 데이터가 같으면 버전도 같음
+        assert catalog.stats()["reloads"] == 2
+
+    async def test_repository_write_invalidates(
+        self, async_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(place_catalog, "session_factory", async_sessionmaker(bind=async_session.bind))
+        place_repository = PlaceRepository(async_session)
+        await place_repository.save(
+            Place(name="한라산", theme="자연", region="제주시", latitude=33.361666, longitude=126.529166)
+        )
+        before = await place_catalog.get()
+        assert [place.name for place in before.places] == ["한라산"]
+
+        await place_repository.update(PlaceUpdate(name="한라산1"), before.places[0].id)  # type: ignore
+        after = await place_catalog.get()
+        assert after is not before
+        assert after.version != before.version
+        assert [place.name for place in after.places] == ["한라산1"]
+
+        await place_repository.delete(after.places[0].id)  # type: ignore
+        assert (await place_catalog.get()).places == ()
+
+    async def test_invalidate_during_reload(self, async_session: AsyncSession, place_list_init: list[Place]) -> None:
+        session_factory = async_sessionmaker(bind=async_session.bind)
+        catalog = PlaceCatalog(ttl_seconds=600, session_factory=session_factory)
+
+        def invalidating_factory() -> AsyncSession:
+            # DB를 읽기 시작한 뒤 다른 요청이 장소를 수정한 상황
+            catalog.invalidate()
+            return session_factory()
+
+        catalog.session_factory = invalidating_factory  # type: ignore
+        first = await catalog.get()
+        catalog.session_factory = session_factory
+        # 읽는 도중에 들어온 invalidate()가 남아 있어 다음 조회에서 다시 읽음
+        second = await catalog.get()
+        assert second is not first
+        assert await catalog.get() is second
+        assert catalog.stats()["reloads"] == 2
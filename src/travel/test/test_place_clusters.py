@@ -0,0 +1,226 @@
+import random
+
+import numpy as np
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import settings
+from src.travel.dtos.base_travel_route import Schedule
+from src.travel.models.enums import RegionEnum, ThemeEnum
+from src.travel.models.place import Place, PlaceUpdate
+from src.travel.repo.place_repo import PlaceRepository
+from src.travel.services.generate_place_list import (
+    complete_place_list,
+    random_place_list,
+    re_complete_place_list,
+)
+from src.travel.services.place_catalog import PlaceCatalogSnapshot
+from src.travel.services.place_clusters import (
+    kmeans,
+    nearest_cluster,
+    project_km,
+    recluster_places,
+)
+from src.travel.services.place_index import PlaceIndex
+from src.travel.services.shortest_path_sort import haversine
+from src.travel.services.spatial_index import SpatialIndex
+
+# 제주시, 성산읍, 대정읍 부근
+CENTERS = [(33.50, 126.53), (33.44, 126.92), (33.23, 126.25)]
+CENTER_REGIONS = [RegionEnum.제주시, RegionEnum.성산읍, RegionEnum.대정읍]
+
+
+def make_clustered_places(per_center: int = 30, seed: int = 0) -> list[Place]:
+    rng = random.Random(seed)
+    places: list[Place] = []
+    for center_index, (lat, lon) in enumerate(CENTERS):
+        for i in range(per_center):
+            places.append(
+                Place(
+                    id=len(places) + 1,
+                    name=f"장소{center_index}-{i}",
+                    theme=ThemeEnum.자연 if i % 2 else ThemeEnum.카페,
+                    region=RegionEnum.제주시,
+                    latitude=lat + rng.gauss(0, 0.01),
+                    longitude=lon + rng.gauss(0, 0.01),
+                    cluster_id=center_index,
+                )
+            )
+    return places
+
+
+def make_regional_places(per_center: int = 30) -> list[Place]:
+    places = make_clustered_places(per_center)
+    for place in places:
+        place.region = CENTER_REGIONS[place.cluster_id]  # type: ignore
+    return places
+
+
+def route_length(places: list[Place]) -> float:
+    return sum(haversine(a.latitude, a.longitude, b.latitude, b.longitude) for a, b in zip(places, places[1:]))
+
+
+class TestKMeans:
+
+    def test_separates_blobs(self) -> None:
+        places = make_clustered_places()
+        lats = np.array([place.latitude for place in places])
+        lons = np.array([place.longitude for place in places])
+        centroids, labels = kmeans(project_km(lats, lons, float(lats.mean())), 3)
+        assert len(centroids) == 3
+        # 같은 중심 근처의 장소는 같은 클러스터
+        for center_index in range(3):
+            assert len(set(labels[center_index * 30 : (center_index + 1) * 30].tolist())) == 1
+        assert len(set(labels.tolist())) == 3
+        # 같은 데이터면 같은 번호
+        assert np.array_equal(kmeans(project_km(lats, lons, float(lats.mean())), 3)[1], labels)
+
+    def test_small_input(self) -> None:
+        centroids, labels = kmeans(np.array([[0.0, 0.0], [1.0, 1.0]]), 5)
+        assert len(centroids) == 2 and sorted(labels.tolist()) == [0, 1]
+        assert len(kmeans(np.zeros((0, 2)), 3)[1]) == 0
+
+    def test_nearest_cluster(self) -> None:
+        labels = nearest_cluster(
+            np.array([33.45, 33.24]),
+            np.array([126.90, 126.27]),
+            np.array([lat for lat, _ in CENTERS]),
+            np.array([lon for _, lon in CENTERS]),
+        )
+        assert labels.tolist() == [1, 2]
+
+
+class TestClusterSampling:
+
+    def test_choose_clusters(self) -> None:
+        place_index = PlaceIndex(make_clustered_places())
+        rng = random.Random(0)
+        themes, regions = [ThemeEnum.자연, ThemeEnum.카페], [RegionEnum.제주시]
+        assert len(place_index.choose_clusters(themes, regions, 10, rng)) == 1  # type: ignore
+        # 한 클러스터로 모자라면 가장 가까운 클러스터를 더함 (대정읍 -> 제주시)
+        around = [place for place in place_index.buckets[(ThemeEnum.자연, RegionEnum.제주시, 2)]][:1]
+        assert place_index.choose_clusters(themes, regions, 40, rng, around=around) == {2, 0}
+        assert place_index.choose_clusters(themes, regions, 100, rng) is None
+        assert PlaceIndex(make_clustered_places()[:0]).choose_clusters(themes, regions, 1, rng) is None
+
+    def test_choose_clusters_keeps_every_region(self) -> None:
+        place_index = PlaceIndex(make_regional_places())
+        themes = [ThemeEnum.자연, ThemeEnum.카페]
+        for seed in range(10):
+            # 장소 수는 한 클러스터로 충분해도 요청한 지역마다 클러스터가 하나씩은 들어감
+            assert place_index.choose_clusters(themes, CENTER_REGIONS, 4, random.Random(seed)) == {0, 1, 2}
+            assert place_index.choose_clusters(themes, CENTER_REGIONS[:2], 4, random.Random(seed)) == {0, 1}
+
+    def test_clustered_routes_cover_every_region(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings, "ROUTE_CLUSTER_SAMPLING", True)
+        places = make_regional_places()
+        by_id = {place.id: place for place in places}
+        place_index = PlaceIndex(places)
+        schedule = Schedule(breakfast=False, morning=2, lunch=False, afternoon=2, dinner=False)
+        for seed in range(20):
+            result = complete_place_list(
+                regions=CENTER_REGIONS,
+                themes=[ThemeEnum.자연, ThemeEnum.카페],
+                schedule=schedule,
+                place_index=place_index,
+                restaurant_index=SpatialIndex([]),
+                rng=random.Random(seed),
+            )
+            chosen = [by_id[info.place_id] for info in result.morning + result.afternoon]  # type: ignore
+            assert {place.region for place in chosen} == set(CENTER_REGIONS)
+            assert {place.theme for place in chosen} == {ThemeEnum.자연, ThemeEnum.카페}
+
+    def test_random_place_list_within_clusters(self) -> None:
+        place_index = PlaceIndex(make_clustered_places())
+        place_list = random_place_list(
+            regions=[RegionEnum.제주시], place_index=place_index, themes=[ThemeEnum.자연], count=10, clusters={1}
+        )
+        assert len(place_list) == 10 and {place.cluster_id for place in place_list} == {1}
+        # 클러스터 안의 장소가 모자라면 나머지는 다른 클러스터에서
+        place_list = random_place_list(
+            regions=[RegionEnum.제주시], place_index=place_index, themes=[ThemeEnum.자연], count=20, clusters={1}
+        )
+        assert len(place_list) == 20 and len({place.id for place in place_list}) == 20
+        assert sum(place.cluster_id == 1 for place in place_list) == 15
+
+    def test_regenerate_never_repeats_pinned_places(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # 고정한 장소의 클러스터 안에서 나머지를 뽑아도 고정한 장소는 다시 뽑히지 않음
+        monkeypatch.setattr(settings, "ROUTE_CLUSTER_SAMPLING", True)
+        place_index = PlaceIndex(make_clustered_places(per_center=6))
+        pined_place_list = list(place_index.buckets[(ThemeEnum.자연, RegionEnum.제주시, 0)][:2])
+        schedule = Schedule(breakfast=False, morning=2, lunch=False, afternoon=2, dinner=False)
+        for seed in range(200):
+            result = re_complete_place_list(
+                place_index=place_index,
+                regions=[RegionEnum.제주시],
+                themes=[ThemeEnum.자연, ThemeEnum.카페],
+                schedule=schedule,
+                pined_place_list=pined_place_list,
+                restaurant_index=SpatialIndex([]),
+                rng=random.Random(seed),
+            )
+            place_ids = [info.place_id for info in result.morning + result.afternoon]  # type: ignore
+            assert len(place_ids) == len(set(place_ids)) == 4
+
+    def test_clustered_routes_are_shorter(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        places = make_clustered_places()
+        place_index = PlaceIndex(places)
+        restaurant_index = SpatialIndex([])
+        schedule = Schedule(breakfast=False, morning=2, lunch=False, afternoon=2, dinner=False)
+
+        def average_length() -> float:
+            lengths = []
+            for seed in range(30):
+                result = complete_place_list(
+                    regions=[RegionEnum.제주시],
+                    themes=[ThemeEnum.자연, ThemeEnum.카페],
+                    schedule=schedule,
+                    place_index=place_index,
+                    restaurant_index=restaurant_index,
+                    rng=random.Random(seed),
+                )
+                by_id = {place.id: place for place in places}
+                lengths.append(route_length([by_id[info.place_id] for info in result.morning + result.afternoon]))  # type: ignore
+            return sum(lengths) / len(lengths)
+
+        monkeypatch.setattr(settings, "ROUTE_CLUSTER_SAMPLING", False)
+        scattered = average_length()
+        monkeypatch.setattr(settings, "ROUTE_CLUSTER_SAMPLING", True)
+        clustered = average_length()
+        assert clustered < scattered / 2
+
+
+@pytest.mark.asyncio
+class TestReclusterPlaces:
+
+    async def test_recluster_and_incremental_assignment(self, async_session: AsyncSession) -> None:
+        place_repository = PlaceRepository(async_session)
+        places = make_clustered_places(per_center=5)
+        for place in places:
+            place.id = None
+            place.cluster_id = None
+        await place_repository.save_bulk(places)
+        assert {place.cluster_id for place in places} == {None}  # 아직 클러스터 없음
+        before = PlaceCatalogSnapshot.from_places(await place_repository.get_place_list())
+
+        cluster_count = await recluster_places(3, session_factory=async_sessionmaker(bind=async_session.bind))
+        assert cluster_count == 3
+        async_session.expire_all()
+        # 클러스터가 바뀌면 카탈로그 버전도 바뀌어 경로 캐시와 프로세스 풀이 새 클러스터를 사용함
+        after = PlaceCatalogSnapshot.from_places(await place_repository.get_place_list())
+        assert after.version != before.version
+        assert after.distance_version == before.distance_version
+        centroids = await place_repository.get_cluster_centroids()
+        assert [cluster_id for cluster_id, _, _ in centroids] == [0, 1, 2]
+        clusters = {place.name: place.cluster_id for place in await place_repository.get_place_list()}
+        assert len({clusters[f"장소{center_index}-0"] for center_index in range(3)}) == 3
+
+        # 새 장소는 가장 가까운 클러스터로
+        new_place = await place_repository.save(
+            Place(name="성산 근처", theme=ThemeEnum.자연, region=RegionEnum.성산읍, latitude=33.45, longitude=126.9)
+        )
+        assert new_place.cluster_id == clusters["장소1-0"]
+
+        # 위치를 옮기면 다시 배정
+        updated = await place_repository.update(PlaceUpdate(latitude=33.24, longitude=126.26), new_place.id)  # type: ignore
+        assert updated.cluster_id == clusters["장소2-0"]
@@ -0,0 +1,222 @@
+import io
+import threading
+import zipfile
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.travel.models.enums import RegionEnum, ThemeEnum
+from src.travel.repo.place_repo import PlaceRepository
+from src.travel.services import place_importer
+from src.travel.services.place_importer import (
+    MAX_IMPORT_BATCH_SIZE,
+    PlaceImportError,
+    import_places,
+    iter_xlsx_rows,
+    parse_place_row,
+    theme_from_filename,
+)
+
+ROOT = Path(__file__).resolve().parents[3]
+WORKBOOK = (
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="장소" sheetId="1" r:id="rId1"/></sheets></workbook>'
+)
+WORKBOOK_RELS = (
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="worksheet" Target="worksheets/places.xml"/></Relationships>'
+)
+
+
+def make_xlsx(rows: list[list[str | float | None]]) -> io.BytesIO:
+    # 문자열은 공유 문자열(sharedStrings)로, 숫자는 값으로 저장한 최소한의 xlsx
+    shared: list[str] = []
+    sheet_rows = []
+    for row_index, row in enumerate(rows, start=1):
+        cells = []
+        for column_index, value in enumerate(row):
+            ref = f"{chr(ord('A') + column_index)}{row_index}"
+            if value is None:
+                continue
+            if isinstance(value, str):
+                shared.append(value)
+                cells.append(f'<c r="{ref}" t="s"><v>{len(shared) - 1}</v></c>')
+            else:
+                cells.append(f'<c r="{ref}"><v>{value}</v></c>')
+        sheet_rows.append(f'<row r="{row_index}">{"".join(cells)}</row>')
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("xl/workbook.xml", WORKBOOK)
+        archive.writestr("xl/_rels/workbook.xml.rels", WORKBOOK_RELS)
+        archive.writestr(
+            "xl/sharedStrings.xml",
+            '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            + "".join(f"<si><t>{escape(value)}</t></si>" for value in shared)
+            + "</sst>",
+        )
+        archive.writestr(
+            "xl/worksheets/places.xml",
+            '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+            + "".join(sheet_rows)
+            + "</sheetData></worksheet>",
+        )
+    buffer.seek(0)
+    return buffer
+
+
+HEADER: list[str | float | None] = ["name", "full_address", "address", "latitude", "longitude"]
+
+
+class TestXlsxRows:
+
+    def test_shipped_workbook(self) -> None:
+        rows = list(iter_xlsx_rows(str(ROOT / "자연.xlsx")))
+        assert len(rows) == 340
+        row_number, row = rows[1]
+        assert row_number == 3
+        assert row == {
+            "name": "휴애리자연생활공원",
+            "full_address": "서귀포시 남원읍 신례동로 256",
+            "address": "남원읍",
+            "latitude": "33.3085402",
+            "longitude": "126.6344826",
+        }
+        assert list(iter_xlsx_rows(str(ROOT / "해변.xlsx"))) == []
+
+    def test_shared_strings_and_sparse_cells(self) -> None:
+        source = make_xlsx([HEADER, ["한라산", None, "제주시", 33.36, 126.53], [None, None, None, None, None]])
+        assert list(iter_xlsx_rows(source)) == [
+            (2, {"name": "한라산", "address": "제주시", "latitude": "33.36", "longitude": "126.53"})
+        ]
+
+    def test_not_xlsx(self) -> None:
+        with pytest.raises(PlaceImportError):
+            list(iter_xlsx_rows(io.BytesIO(b"name,address\n")))
+
+    @pytest.mark.parametrize("index", ["7", "-1", "abc"])
+    def test_bad_shared_string_index(self, index: str) -> None:
+        source = make_xlsx([HEADER, ["한라산", None, "제주시", 33.36, 126.53]])
+        with zipfile.ZipFile(source) as archive:
+            files = {name: archive.read(name) for name in archive.namelist()}
+        # 2행 A열(한라산)이 공유 문자열 표에 없는 번호를 가리키도록 바꿈
+        files["xl/worksheets/places.xml"] = files["xl/worksheets/places.xml"].replace(
+            b'<c r="A2" t="s"><v>5</v>', f'<c r="A2" t="s"><v>{index}</v>'.encode()
+        )
+        broken = io.BytesIO()
+        with zipfile.ZipFile(broken, "w") as archive:
+            for name, data in files.items():
+                archive.writestr(name, data)
+        broken.seek(0)
+        with pytest.raises(PlaceImportError, match="장소 시트 A2 셀"):
+            list(iter_xlsx_rows(broken))
+
+    def test_too_many_shared_strings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(place_importer, "MAX_SHARED_STRINGS", 5)
+        source = make_xlsx([HEADER, ["한라산", None, "제주시", 33.36, 126.53]])
+        with pytest.raises(PlaceImportError):
+            list(iter_xlsx_rows(source))
+
+
+class TestParsePlaceRow:
+
+    def test_valid_row(self) -> None:
+        row = {"name": "한라산", "address": "제주시", "latitude": "33.36", "longitude": "126.53"}
+        values = parse_place_row(row, ThemeEnum.자연)
+        assert values["theme"] == ThemeEnum.자연 and values["region"] == RegionEnum.제주시
+        assert values["latitude"] == 33.36 and values["longitude"] == 126.53
+        # theme/region 열이 있으면 우선
+        values = parse_place_row({**row, "theme": "카페", "region": "애월읍"}, ThemeEnum.자연)
+        assert values["theme"] == ThemeEnum.카페 and values["region"] == RegionEnum.애월읍
+
+    @pytest.mark.parametrize(
+        "row, theme",
+        [
+            ({"address": "제주시", "latitude": "33.36", "longitude": "126.53"}, ThemeEnum.자연),
+            ({"name": "한라산", "address": "부산시", "latitude": "33.36", "longitude": "126.53"}, ThemeEnum.자연),
+            ({"name": "한라산", "address": "제주시", "latitude": "33.36", "longitude": "126.53"}, None),
+            ({"name": "한라산", "address": "제주시", "latitude": "", "longitude": "126.53"}, ThemeEnum.자연),
+            ({"name": "한라산", "address": "제주시", "latitude": "133.36", "longitude": "126.53"}, ThemeEnum.자연),
+        ],
+    )
+    def test_invalid_row(self, row: dict[str, str], theme: ThemeEnum | None) -> None:
+        with pytest.raises(PlaceImportError):
+            parse_place_row(row, theme)
+
+    def test_theme_from_filename(self) -> None:
+        assert theme_from_filename("data/자연.xlsx") == ThemeEnum.자연
+        assert theme_from_filename("places.xlsx") is None
+
+
+@pytest.mark.asyncio
+class TestImportPlaces:
+
+    async def test_batched_upsert(self, async_session: AsyncSession) -> None:
+        place_repository = PlaceRepository(async_session)
+        source = make_xlsx(
+            [
+                HEADER,
+                ["한라산", None, "제주시", 33.36, 126.53],
+                ["성산일출봉", None, "성산읍", 33.46, 126.94],
+                ["한라산", None, "서귀포시", 33.0, 126.0],  # 같은 파일 안의 중복은 처음 행 사용
+                ["새별오름", None, "애월읍", None, None],  # 위치 없음
+                ["사려니숲길", None, "조천읍", 33.43, 126.64],
+            ]
+        )
+        report = await import_places(source, place_repository, ThemeEnum.자연, batch_size=2)
+        assert (report.rows, report.inserted, report.updated) == (5, 3, 0)
+        assert (report.duplicates, report.invalid) == (1, 1)
+        assert report.errors == ["5행: 위도/경도가 없거나 숫자가 아닙니다."]
+        places = {place.name: place for place in await place_repository.get_place_list()}
+        assert set(places) == {"한라산", "성산일출봉", "사려니숲길"}
+        assert places["한라산"].region == RegionEnum.제주시
+
+        # 이미 있는 이름은 갱신
+        source = make_xlsx(
+            [HEADER, ["한라산", None, "서귀포시", 33.35, 126.55], ["용눈이오름", None, "구좌읍", 33.45, 126.83]]
+        )
+        report = await import_places(source, place_repository, ThemeEnum.자연)
+        assert (report.inserted, report.updated) == (1, 1)
+        async_session.expire_all()
+        places = {place.name: place for place in await place_repository.get_place_list()}
+        assert len(places) == 4
+        assert places["한라산"].region == RegionEnum.서귀포시 and places["한라산"].latitude == 33.35
+
+    async def test_parses_off_event_loop(self, async_session: AsyncSession, monkeypatch: pytest.MonkeyPatch) -> None:
+        threads = set()
+
+        def parse(row: dict[str, str], default_theme: ThemeEnum | None) -> dict[str, object]:
+            threads.add(threading.current_thread())
+            return parse_place_row(row, default_theme)
+
+        monkeypatch.setattr(place_importer, "parse_place_row", parse)
+        source = make_xlsx(
+            [HEADER, ["한라산", None, "제주시", 33.36, 126.53], ["성산일출봉", None, "성산읍", 33.46, 126.94]]
+        )
+        report = await import_places(source, PlaceRepository(async_session), ThemeEnum.자연, batch_size=1)
+        assert report.inserted == 2
+        assert threads and threading.current_thread() not in threads
+
+    @pytest.mark.parametrize("batch_size", [0, MAX_IMPORT_BATCH_SIZE + 1])
+    async def test_batch_size_bounds(self, async_session: AsyncSession, batch_size: int) -> None:
+        # 한 INSERT의 파라미터 수가 asyncpg 한도(32767)를 넘지 않도록 제한
+        assert MAX_IMPORT_BATCH_SIZE * 8 <= 32767
+        with pytest.raises(PlaceImportError):
+            await import_places(make_xlsx([HEADER]), PlaceRepository(async_session), ThemeEnum.자연, batch_size)
+
+    async def test_max_batch_size(self, async_session: AsyncSession) -> None:
+        rows: list[list[str | float | None]] = [
+            [f"장소{i}", None, "제주시", 33.3 + i * 1e-5, 126.5] for i in range(MAX_IMPORT_BATCH_SIZE)
+        ]
+        source = make_xlsx([HEADER, *rows])
+        report = await import_places(source, PlaceRepository(async_session), ThemeEnum.자연, MAX_IMPORT_BATCH_SIZE)
+        assert report.inserted == MAX_IMPORT_BATCH_SIZE
+
+    async def test_shipped_workbook(self, async_session: AsyncSession) -> None:
+        place_repository = PlaceRepository(async_session)
+        report = await import_places(str(ROOT / "자연.xlsx"), place_repository, ThemeEnum.자연, batch_size=100)
+        assert report.rows == 340
+        assert report.inserted == len(await place_repository.get_place_list())
+        assert report.inserted + report.duplicates + report.invalid == report.rows
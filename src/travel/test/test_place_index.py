@@ -0,0 +1,127 @@
+from src.travel.dtos.base_travel_route import Schedule, TravelRouteConfig
+from src.travel.models.enums import RegionEnum, ThemeEnum
+from src.travel.models.place import Place
+from src.travel.services.generate_place_list import (
+    generate_schedule,
+    generate_schedules,
+    random_place_list,
+    schedule_key,
+)
+from src.travel.services.place_catalog import PlaceCatalogSnapshot
+from src.travel.services.place_index import PlaceIndex
+
+
+def make_places() -> list[Place]:
+    place_list = []
+    place_id = 1
+    for theme in [ThemeEnum.자연, ThemeEnum.해변, ThemeEnum.카페]:
+        for region in [RegionEnum.제주시, RegionEnum.서귀포시, RegionEnum.애월읍]:
+            for i in range(5):
+                place_list.append(
+                    Place(
+                        id=place_id,
+                        name=f"{theme.value}-{region.value}-{i}",
+                        theme=theme,
+                        region=region,
+                        latitude=33.3 + place_id * 0.001,
+                        longitude=126.5 + place_id * 0.001,
+                    )
+                )
+                place_id += 1
+    return place_list
+
+
+class TestPlaceIndex:
+
+    def test_buckets(self) -> None:
+        place_index = PlaceIndex(make_places())
+        assert len(place_index.buckets) == 9
+        assert len(place_index) == 45
+        assert all(len(bucket) == 5 for bucket in place_index.buckets.values())
+
+    def test_sampler_without_replacement(self) -> None:
+        sampler = PlaceIndex(make_places()).sampler(themes=[ThemeEnum.자연], regions=[RegionEnum.제주시])
+        picked = [sampler.pick() for _ in range(5)]
+        assert len({place.id for place in picked}) == 5  # type: ignore
+        assert sampler.pick() is None
+
+    def test_sampler_excluded(self) -> None:
+        place_index = PlaceIndex(make_places())
+        sampler = place_index.sampler(themes=[ThemeEnum.자연], regions=[RegionEnum.제주시], excluded={1, 3})
+        picked = [sampler.pick() for _ in range(3)]
+        assert {place.id for place in picked} == {2, 4, 5}  # type: ignore
+        assert sampler.pick() is None
+
+    def test_random_place_list_filter(self) -> None:
+        place_index = PlaceIndex(make_places())
+        themes = [ThemeEnum.자연, ThemeEnum.카페]
+        regions = [RegionEnum.서귀포시]
+        random_list = random_place_list(regions=regions, place_index=place_index, themes=themes, morning=2, afternoon=3)
+        assert len(random_list) == 5
+        assert len({place.id for place in random_list}) == 5
+        assert {place.theme for place in random_list} <= set(themes)
+        assert {place.region for place in random_list} <= set(regions)
+
+    def test_random_place_list_spread(self) -> None:
+        # 선택한 테마/지역 조합이 4개이므로 두 번째 장소는 첫 장소와 테마나 지역이 달라야 함
+        place_index = PlaceIndex(make_places())
+        themes = [ThemeEnum.자연, ThemeEnum.해변]
+        regions = [RegionEnum.제주시, RegionEnum.애월읍]
+        for _ in range(20):
+            random_list = random_place_list(regions=regions, place_index=place_index, themes=themes, count=2)
+            assert len({place.theme for place in random_list}) == 2 or len({place.region for place in random_list}) == 2
+
+    def test_random_place_list_not_enough(self) -> None:
+        place_index = PlaceIndex(make_places())
+        random_list = random_place_list(
+            regions=[RegionEnum.제주시], place_index=place_index, themes=[ThemeEnum.해변], count=10
+        )
+        assert len(random_list) == 5
+
+
+class TestGenerateSchedules:
+
+    def test_distinct_candidates(self) -> None:
+        snapshot = PlaceCatalogSnapshot.from_places(make_places())
+        config = TravelRouteConfig(
+            regions=[RegionEnum.제주시, RegionEnum.서귀포시],
+            themes=[ThemeEnum.자연, ThemeEnum.카페],
+            schedule=Schedule(breakfast=False, morning=2, lunch=False, afternoon=2, dinner=False),
+        )
+        schedules = generate_schedules(snapshot, config, 5)
+        assert len(schedules) == 5
+        assert len({schedule_key(schedule) for schedule in schedules}) == 5
+
+    def test_not_enough_places(self) -> None:
+        snapshot = PlaceCatalogSnapshot.from_places(make_places())
+        config = TravelRouteConfig(
+            regions=[RegionEnum.제주시],
+            themes=[ThemeEnum.자연],
+            schedule=Schedule(breakfast=False, morning=3, lunch=False, afternoon=2, dinner=False),
+        )
+        # 장소가 5개뿐이라 방문 순서가 최단 경로로 정해지면 후보가 거의 하나로 모임
+        schedules = generate_schedules(snapshot, config, 10)
+        assert 1 <= len(schedules) < 10
+
+    def test_same_seed_same_schedule(self) -> None:
+        restaurants = [
+            Place(
+                id=100 + i,
+                name=f"식당{i}",
+                theme=ThemeEnum.식당,
+                region=RegionEnum.제주시,
+                latitude=33.3 + i * 0.002,
+                longitude=126.5,
+            )
+            for i in range(10)
+        ]
+        snapshot = PlaceCatalogSnapshot.from_places(make_places() + restaurants)
+        config = TravelRouteConfig(
+            regions=[RegionEnum.제주시, RegionEnum.서귀포시, RegionEnum.애월읍],
+            themes=[ThemeEnum.자연, ThemeEnum.카페],
+            schedule=Schedule(breakfast=True, morning=2, lunch=True, afternoon=2, dinner=True),
+        )
+        assert generate_schedule(snapshot, config, seed=7) == generate_schedule(snapshot, config, seed=7)
+        assert generate_schedules(snapshot, config, 3, seed=7) == generate_schedules(snapshot, config, 3, seed=7)
+        # 시드가 다르면 다른 일정이 나옴
+        assert len({schedule_key(generate_schedule(snapshot, config, seed=seed)) for seed in range(10)}) > 1
@@ -81,3 +81,16 @@ class TestPlaceRepository:
             assert get_place.id == new_place.id
         else:
             assert False
+
+    async def test_get_by_ids(self, async_session: AsyncSession) -> None:
+        place_repository = PlaceRepository(async_session)
+        place_list = await place_repository.save_bulk(
+            place_list=[
+                Place(name="한라산", theme="자연", region="제주시", latitude=33.36, longitude=126.53),
+                Place(name="성산일출봉", theme="자연", region="성산읍", latitude=33.46, longitude=126.94),
+            ]
+        )
+        ids = [place.id for place in place_list if place.id is not None]
+        get_place_list = await place_repository.get_by_ids([*ids, 100000])
+        assert {place.id for place in get_place_list} == set(ids)
+        assert await place_repository.get_by_ids([]) == []
@@ -2,10 +2,11 @@ from datetime import datetime
 
 import pytest
 from fastapi import HTTPException
+from sqlalchemy import event
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src import User
+from src import Place, User  # type: ignore
 from src.travel.models.travel_route_place import TravelRoute
 from src.travel.repo.travel_route_repo import TravelRouteRepository
 from src.user.repo.repository import UserRepository
@@ -33,6 +34,46 @@ class TestTravelRouteRepository:
         new_travel_route = await travel_route_repository.save(travel_route)
         assert new_travel_route.__dict__ == travel_route.__dict__ and new_travel_route.id
 
+    async def test_save_with_places(
+        self,
+        async_session: AsyncSession,
+        travel_route_repository: TravelRouteRepository,
+        user_save_init: tuple[User, User],
+        place_list_init: list[Place],
+    ) -> None:
+        user1, user2 = user_save_init
+        travel_route = TravelRoute(
+            title="ddd",
+            user_id=user1.id,
+            regions=["제주시"],
+            themes=["자연"],
+            breakfast=True,
+            morning=2,
+            lunch=True,
+            afternoon=2,
+            dinner=False,
+        )
+        place_ids = [place.id for place in place_list_init[:6]]
+        statements = []
+
+        def before_cursor_execute(*args) -> None:  # type: ignore
+            statements.append(args[2])
+
+        sync_engine = async_session.bind.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            saved = await travel_route_repository.save_with_places(travel_route, place_ids)  # type: ignore
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", before_cursor_execute)
+
+        # 경로 1번 + 장소 여러 행 1번
+        assert len([s for s in statements if s.startswith("INSERT INTO travelrouteplace")]) == 1
+        assert len([s for s in statements if s.startswith("INSERT")]) == 2
+        loaded = await travel_route_repository.get_by_id(saved.id)  # type: ignore
+        ordered = sorted(loaded.travel_route_places, key=lambda trp: trp.priority)  # type: ignore
+        assert [trp.place_id for trp in ordered] == place_ids
+        assert [trp.priority for trp in ordered] == [1, 2, 3, 4, 5, 6]
+
     async def test_get_travel_route_list(
         self, travel_route_init: list[TravelRoute], travel_route_repository: TravelRouteRepository
     ) -> None:
@@ -53,6 +94,38 @@ class TestTravelRouteRepository:
         comp_list = [i for i in saved_travel_list if i.user_id == user1.id]
         assert len(travel_list) == len(comp_list)
 
+    async def test_get_travel_route_page_by_user(
+        self,
+        user_save_init: tuple[User, User],
+        travel_route_init: list[TravelRoute],
+        travel_route_repository: TravelRouteRepository,
+    ) -> None:
+        user1, user2 = user_save_init
+        first_page, total = await travel_route_repository.get_travel_route_page_by_user(user2.id, page=1, size=3)
+        second_page, _ = await travel_route_repository.get_travel_route_page_by_user(user2.id, page=2, size=3)
+        assert total == 4 and len(first_page) == 3 and len(second_page) == 1
+        expected = sorted(
+            (route for route in travel_route_init if route.user_id == user2.id),
+            key=lambda route: (route.created_at, route.id),
+            reverse=True,
+        )
+        assert [route.id for route in first_page + second_page] == [route.id for route in expected]
+
+    async def test_get_travel_route_list_by_user_after(
+        self,
+        user_save_init: tuple[User, User],
+        travel_route_init: list[TravelRoute],
+        travel_route_repository: TravelRouteRepository,
+    ) -> None:
+        user1, user2 = user_save_init
+        first = await travel_route_repository.get_travel_route_list_by_user_after(user2.id, size=3)
+        last = first[-1]
+        second = await travel_route_repository.get_travel_route_list_by_user_after(
+            user2.id, size=3, cursor=(last.created_at, last.id)  # type: ignore
+        )
+        page, _ = await travel_route_repository.get_travel_route_page_by_user(user2.id, page=1, size=4)
+        assert [route.id for route in first + second] == [route.id for route in page]
+
     async def test_get_by_id(
         self, travel_route_init: list[TravelRoute], travel_route_repository: TravelRouteRepository
     ) -> None:
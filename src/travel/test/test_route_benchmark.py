@@ -0,0 +1,268 @@
+import gc
+import json
+import os
+import random
+import time
+import tracemalloc
+from datetime import time as time_of_day
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Generator, NamedTuple
+
+import numpy as np
+import pytest
+
+from src.travel.dtos.base_travel_route import Schedule, TravelRouteConfig
+from src.travel.models.enums import RegionEnum, ThemeEnum
+from src.travel.models.place import Place
+from src.travel.services.generate_place_list import (
+    ITINERARY_POOL_FACTOR,
+    complete_place_list,
+    generate_schedules,
+    re_complete_place_list,
+)
+from src.travel.services.itinerary import plan_itinerary, stop_for_place
+from src.travel.services.place_catalog import PlaceCatalogSnapshot
+from src.travel.services.shortest_path_sort import (
+    create_distance_matrix,
+    solve_tsp_brute_force,
+)
+
+# 실행 시간이 걸리므로 RUN_BENCHMARKS=true 일 때만 실행 (DB 없이 합성 카탈로그로 측정)
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.skipif(os.getenv("RUN_BENCHMARKS") != "true", reason="RUN_BENCHMARKS=true 일 때만 실행"),
+]
+
+BASELINE_PATH = Path(__file__).with_name("benchmark_baseline.json")
+# 기준값보다 이 배수 + 여유값 이상 느려지거나 메모리를 더 쓰면 실패
+TIME_TOLERANCE = float(os.getenv("BENCHMARK_TOLERANCE", "2.0"))
+TIME_SLACK_MS = 0.5
+MEMORY_TOLERANCE = 1.5
+MEMORY_SLACK_KIB = 64.0
+
+CATALOG_SIZES = [1_000, 10_000, 100_000]
+STOPS = [2, 4, 8, 12]
+ROUNDS = 50
+# 매 실행이 같은 장소를 뽑도록 고정한 시드 (실행마다 작업량이 달라지지 않게)
+BENCHMARK_SEED = 0
+# 시간을 계산하는 일정은 대화형으로 쓸 수 있도록 12곳 기준 p99가 이 시간 안이어야 함
+ITINERARY_P99_LIMIT_MS = 100
+# 후보 여러 개를 한 번에 만들어도 카탈로그 크기에 비례하는 메모리를 쓰지 않아야 함
+BATCH_COUNT = 3
+BATCH_PEAK_LIMIT_KIB = 4 * 1024
+
+# 읍/면 중심 좌표 근처에 장소를 흩뿌림
+REGION_CENTERS = {
+    RegionEnum.제주시: (33.4996, 126.5312),
+    RegionEnum.서귀포시: (33.2541, 126.5601),
+    RegionEnum.한경면: (33.3224, 126.1912),
+    RegionEnum.한림읍: (33.4113, 126.2694),
+    RegionEnum.애월읍: (33.4629, 126.3310),
+    RegionEnum.조천읍: (33.5383, 126.6347),
+    RegionEnum.구좌읍: (33.5218, 126.8531),
+    RegionEnum.대정읍: (33.2258, 126.2513),
+    RegionEnum.안덕면: (33.2534, 126.3707),
+    RegionEnum.남원읍: (33.2801, 126.7199),
+    RegionEnum.표선면: (33.3267, 126.8333),
+    RegionEnum.성산읍: (33.4370, 126.9170),
+}
+REGIONS = [RegionEnum.제주시, RegionEnum.애월읍, RegionEnum.성산읍]
+THEMES = [ThemeEnum.자연, ThemeEnum.카페, ThemeEnum.해변]
+
+
+class BenchmarkResult(NamedTuple):
+    p50_ms: float
+    p99_ms: float
+    peak_kib: float
+
+
+@lru_cache(maxsize=None)
+def make_catalog(size: int, seed: int = 0) -> PlaceCatalogSnapshot:
+    rng = random.Random(seed)
+    regions = list(REGION_CENTERS)
+    themes = list(ThemeEnum)
+    places = []
+    for i in range(size):
+        region = regions[i % len(regions)]
+        lat, lon = REGION_CENTERS[region]
+        places.append(
+            Place(
+                id=i + 1,
+                name=f"장소{i}",
+                theme=themes[rng.randrange(len(themes))],
+                region=region,
+                latitude=lat + rng.gauss(0, 0.03),
+                longitude=lon + rng.gauss(0, 0.04),
+            )
+        )
+    return PlaceCatalogSnapshot.from_places(places)
+
+
+def make_schedule(stops: int, start_time: time_of_day | None = None) -> Schedule:
+    return Schedule(
+        breakfast=True,
+        morning=stops // 2,
+        lunch=True,
+        afternoon=stops - stops // 2,
+        dinner=True,
+        start_time=start_time,
+    )
+
+
+def measure(func: Callable[[], Any], rounds: int = ROUNDS) -> BenchmarkResult:
+    func()  # 워밍업 (지연 생성되는 인덱스 등)
+    timings = []
+    # 큰 카탈로그에서는 GC 전체 수집이 측정 중간에 끼어 p99가 크게 흔들리므로 측정 동안 끔
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        gc.enable()
+    # 메모리는 tracemalloc이 실행을 느리게 하므로 시간 측정과 따로 한 번만 잼
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    p50, p99 = np.percentile(timings, [50, 99])
+    return BenchmarkResult(float(p50), float(p99), peak / 1024)
+
+
+class Baseline:
+    """
+    저장된 기준값과 이번 실행 결과. UPDATE_BENCHMARK_BASELINE=true 이면 모듈이 끝날 때 결과로 기준값을 갱신합니다.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.saved: dict[str, dict[str, float]] = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+        self.results: dict[str, dict[str, float]] = {}
+        self.update = os.getenv("UPDATE_BENCHMARK_BASELINE") == "true"
+
+    def check(self, name: str, result: BenchmarkResult) -> None:
+        print(f"\n{name}: p50={result.p50_ms:.3f}ms p99={result.p99_ms:.3f}ms peak={result.peak_kib:.1f}KiB")
+        self.results[name] = {key: round(value, 3) for key, value in result._asdict().items()}
+        expected = self.saved.get(name)
+        if expected is None or self.update:
+            return
+        for key in ("p50_ms", "p99_ms"):
+            value = getattr(result, key)
+            limit = expected[key] * TIME_TOLERANCE + TIME_SLACK_MS
+            assert value <= limit, f"{name} {key} {value:.3f} > {limit:.3f}"
+        limit = expected["peak_kib"] * MEMORY_TOLERANCE + MEMORY_SLACK_KIB
+        assert result.peak_kib <= limit, f"{name} peak_kib {result.peak_kib:.1f} > {limit:.1f}"
+
+    def save(self) -> None:
+        saved = dict(sorted({**self.saved, **self.results}.items()))
+        self.path.write_text(json.dumps(saved, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+@pytest.fixture(scope="module")
+def baseline() -> Generator[Baseline, None, None]:
+    baseline = Baseline(BASELINE_PATH)
+    yield baseline
+    if baseline.update:
+        baseline.save()
+
+
+class TestRouteBenchmark:
+
+    @pytest.mark.parametrize("stops", STOPS)
+    @pytest.mark.parametrize("size", CATALOG_SIZES)
+    def test_complete_place_list(self, baseline: Baseline, size: int, stops: int) -> None:
+        snapshot = make_catalog(size)
+        schedule = make_schedule(stops)
+
+        def run() -> None:
+            complete_place_list(
+                regions=REGIONS,
+                themes=THEMES,
+                schedule=schedule,
+                place_index=snapshot.place_index,
+                restaurant_index=snapshot.restaurant_index,
+                rng=random.Random(BENCHMARK_SEED),
+            )
+
+        baseline.check(f"complete_place_list[{size}-{stops}]", measure(run))
+
+    @pytest.mark.parametrize("stops", STOPS)
+    @pytest.mark.parametrize("size", CATALOG_SIZES)
+    def test_re_complete_place_list(self, baseline: Baseline, size: int, stops: int) -> None:
+        snapshot = make_catalog(size)
+        schedule = make_schedule(stops)
+        pined_place_list = [
+            place for place in snapshot.attractions if place.theme in THEMES and place.region in REGIONS
+        ][: stops // 2]
+
+        def run() -> None:
+            re_complete_place_list(
+                place_index=snapshot.place_index,
+                regions=REGIONS,
+                themes=THEMES,
+                schedule=schedule,
+                pined_place_list=pined_place_list,
+                restaurant_index=snapshot.restaurant_index,
+                rng=random.Random(BENCHMARK_SEED),
+            )
+
+        baseline.check(f"re_complete_place_list[{size}-{stops}]", measure(run))
+
+    @pytest.mark.parametrize("size", CATALOG_SIZES)
+    def test_generate_schedules(self, baseline: Baseline, size: int) -> None:
+        snapshot = make_catalog(size)
+        config = TravelRouteConfig(regions=REGIONS, themes=THEMES, schedule=make_schedule(STOPS[-1]))
+        result = measure(lambda: generate_schedules(snapshot, config, BATCH_COUNT, seed=BENCHMARK_SEED), rounds=10)
+        baseline.check(f"generate_schedules[{size}-{BATCH_COUNT}]", result)
+        assert result.peak_kib < BATCH_PEAK_LIMIT_KIB
+
+    @pytest.mark.parametrize("stops", STOPS)
+    def test_create_distance_matrix(self, baseline: Baseline, stops: int) -> None:
+        place_list = list(make_catalog(CATALOG_SIZES[0]).attractions[:stops])
+        baseline.check(f"create_distance_matrix[{stops}]", measure(lambda: create_distance_matrix(place_list)))
+
+    @pytest.mark.parametrize("stops", [2, 4, 6, 8])
+    def test_solve_tsp_brute_force(self, baseline: Baseline, stops: int) -> None:
+        # n! 이라 일정 최대 길이(12)까지는 측정하지 않음
+        distance_matrix = create_distance_matrix(list(make_catalog(CATALOG_SIZES[0]).attractions[:stops]))
+        rounds = 5 if stops >= 8 else ROUNDS
+        baseline.check(
+            f"solve_tsp_brute_force[{stops}]",
+            measure(lambda: solve_tsp_brute_force(distance_matrix), rounds=rounds),
+        )
+
+    @pytest.mark.parametrize("stops", STOPS)
+    def test_plan_itinerary(self, baseline: Baseline, stops: int) -> None:
+        snapshot = make_catalog(CATALOG_SIZES[0])
+        candidates = [place for place in snapshot.attractions if place.region in REGIONS][
+            : stops * ITINERARY_POOL_FACTOR
+        ]
+        distance_matrix = create_distance_matrix(candidates)
+        stop_list = [stop_for_place(place, node=i) for i, place in enumerate(candidates)]
+        result = measure(lambda: plan_itinerary(distance_matrix, stop_list, 9 * 60, 21 * 60, max_optional=stops))
+        baseline.check(f"plan_itinerary[{stops}]", result)
+        assert result.p99_ms < ITINERARY_P99_LIMIT_MS
+
+    @pytest.mark.parametrize("size", CATALOG_SIZES)
+    def test_complete_place_list_timed(self, baseline: Baseline, size: int) -> None:
+        snapshot = make_catalog(size)
+        schedule = make_schedule(STOPS[-1], start_time=time_of_day(9, 0))
+
+        def run() -> None:
+            complete_place_list(
+                regions=REGIONS,
+                themes=THEMES,
+                schedule=schedule,
+                place_index=snapshot.place_index,
+                restaurant_index=snapshot.restaurant_index,
+                rng=random.Random(BENCHMARK_SEED),
+            )
+
+        result = measure(run)
+        baseline.check(f"complete_place_list_timed[{size}-{STOPS[-1]}]", result)
+        assert result.p99_ms < ITINERARY_P99_LIMIT_MS
@@ -0,0 +1,91 @@
+import pytest
+
+from src.travel.dtos.base_travel_route import Schedule, ScheduleInfo, TravelRouteConfig
+from src.travel.models.enums import RegionEnum, ThemeEnum
+from src.travel.services.route_cache import RouteCache, config_key
+
+
+def make_config(regions: list[RegionEnum], themes: list[ThemeEnum]) -> TravelRouteConfig:
+    return TravelRouteConfig(
+        regions=regions,
+        themes=themes,
+        schedule=Schedule(breakfast=False, morning=2, lunch=True, afternoon=2, dinner=False),
+    )
+
+
+class FakeGenerator:
+    def __init__(self) -> None:
+        self.seeds: list[int] = []
+
+    async def __call__(self, seed: int) -> ScheduleInfo:
+        self.seeds.append(seed)
+        return ScheduleInfo(breakfast=None, morning=[], lunch=None, afternoon=[], dinner=None)
+
+
+@pytest.mark.asyncio
+class TestRouteCache:
+
+    async def test_config_key_normalized(self) -> None:
+        first = make_config([RegionEnum.제주시, RegionEnum.애월읍], [ThemeEnum.카페, ThemeEnum.자연])
+        second = make_config(
+            [RegionEnum.애월읍, RegionEnum.제주시, RegionEnum.제주시], [ThemeEnum.자연, ThemeEnum.카페]
+        )
+        assert config_key(first) == config_key(second)
+        assert config_key(first) != config_key(make_config([RegionEnum.제주시], [ThemeEnum.카페]))
+
+    async def test_seeded_request(self) -> None:
+        cache = RouteCache(max_entries=10, ttl_seconds=600, variants=3)
+        config = make_config([RegionEnum.제주시], [ThemeEnum.카페])
+        generate = FakeGenerator()
+        first = await cache.get("v1", config, 7, generate)
+        second = await cache.get("v1", config, 7, generate)
+        assert first == second and first[0] == 7
+        assert generate.seeds == [7]
+        # 카탈로그 버전이 바뀌면 다시 만듦
+        await cache.get("v2", config, 7, generate)
+        assert generate.seeds == [7, 7]
+        stats = cache.stats()
+        assert stats["hits"] == 1 and stats["misses"] == 2
+
+    async def test_rotating_variants(self) -> None:
+        cache = RouteCache(max_entries=10, ttl_seconds=600, variants=3)
+        config = make_config([RegionEnum.제주시], [ThemeEnum.카페])
+        generate = FakeGenerator()
+        filled = [await cache.get("v1", config, None, generate) for _ in range(3)]
+        assert [seed for seed, _ in filled] == generate.seeds
+        # 후보가 다 모이면 더 계산하지 않고 돌아가며 반환
+        served = [await cache.get("v1", config, None, generate) for _ in range(6)]
+        assert len(generate.seeds) == 3
+        assert [seed for seed, _ in served] == generate.seeds * 2
+        stats = cache.stats()
+        assert stats["hits"] == 6 and stats["misses"] == 3 and stats["hit_rate"] == pytest.approx(6 / 9)
+
+    async def test_lru_eviction(self) -> None:
+        cache = RouteCache(max_entries=2, ttl_seconds=600, variants=1)
+        config = make_config([RegionEnum.제주시], [ThemeEnum.카페])
+        generate = FakeGenerator()
+        await cache.get("v1", config, 1, generate)
+        await cache.get("v1", config, 2, generate)
+        await cache.get("v1", config, 1, generate)  # 1을 최근 사용으로 갱신
+        await cache.get("v1", config, 3, generate)  # 가장 오래 안 쓴 2가 빠짐
+        assert cache.stats()["evictions"] == 1
+        await cache.get("v1", config, 1, generate)
+        await cache.get("v1", config, 2, generate)
+        assert generate.seeds == [1, 2, 3, 2]
+
+    async def test_ttl_expired(self) -> None:
+        cache = RouteCache(max_entries=10, ttl_seconds=0, variants=1)
+        config = make_config([RegionEnum.제주시], [ThemeEnum.카페])
+        generate = FakeGenerator()
+        await cache.get("v1", config, 1, generate)
+        await cache.get("v1", config, 1, generate)
+        assert generate.seeds == [1, 1]
+        assert cache.stats()["expirations"] == 1
+
+    async def test_disabled(self) -> None:
+        cache = RouteCache(max_entries=0, ttl_seconds=600, variants=3)
+        config = make_config([RegionEnum.제주시], [ThemeEnum.카페])
+        generate = FakeGenerator()
+        await cache.get("v1", config, 1, generate)
+        await cache.get("v1", config, 1, generate)
+        assert generate.seeds == [1, 1] and cache.stats()["entries"] == 0
@@ -0,0 +1,103 @@
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from src.travel.services.place_catalog import PlaceCatalogSnapshot
+from src.travel.services.route_executor import RouteExecutor
+from src.travel.test.test_place_index import make_places
+
+
+def count_places(snapshot: PlaceCatalogSnapshot, offset: int) -> tuple[int, str, int]:
+    return len(snapshot.places) + offset, snapshot.version, os.getpid()
+
+
+def wait_for(snapshot: PlaceCatalogSnapshot, event: threading.Event) -> None:
+    event.wait(5)
+
+
+def sleep_and_count(snapshot: PlaceCatalogSnapshot, seconds: float) -> tuple[int, str]:
+    time.sleep(seconds)
+    return len(snapshot.places), snapshot.version
+
+
+@pytest.mark.asyncio
+class TestRouteExecutor:
+
+    async def test_thread_run(self) -> None:
+        snapshot = PlaceCatalogSnapshot.from_places(make_places())
+        executor = RouteExecutor(kind="thread", max_workers=2, max_pending=4, timeout_seconds=5)
+        try:
+            count, version, pid = await executor.run(snapshot, count_places, 1)
+            assert count == 46 and version == snapshot.version and pid == os.getpid()
+            stats = executor.stats()
+            assert stats["jobs"] == 1 and stats["pending"] == 0
+        finally:
+            executor.shutdown()
+
+    async def test_overload_and_timeout(self) -> None:
+        snapshot = PlaceCatalogSnapshot.from_places(make_places())
+        executor = RouteExecutor(kind="thread", max_workers=1, max_pending=1, timeout_seconds=0.2)
+        event = threading.Event()
+        try:
+            first = asyncio.create_task(executor.run(snapshot, wait_for, event))
+            await asyncio.sleep(0.05)
+            with pytest.raises(HTTPException) as overloaded:
+                await executor.run(snapshot, wait_for, event)
+            assert overloaded.value.status_code == 503
+            assert overloaded.value.headers == {"Retry-After": "1"}
+            with pytest.raises(HTTPException) as timed_out:
+                await first
+            assert timed_out.value.status_code == 504
+            stats = executor.stats()
+            assert stats["rejected"] == 1 and stats["timeouts"] == 1
+            # 타임아웃이 나도 풀에서 실행 중인 작업은 끝날 때까지 자리를 차지함
+            assert stats["pending"] == 1
+            with pytest.raises(HTTPException) as still_overloaded:
+                await executor.run(snapshot, wait_for, event)
+            assert still_overloaded.value.status_code == 503
+            event.set()
+            for _ in range(100):
+                if executor.pending == 0:
+                    break
+                await asyncio.sleep(0.01)
+            assert executor.pending == 0
+        finally:
+            event.set()
+            executor.shutdown()
+
+    async def test_process_run(self) -> None:
+        places = make_places()
+        snapshot = PlaceCatalogSnapshot.from_places(places)
+        executor = RouteExecutor(kind="process", max_workers=1, max_pending=4, timeout_seconds=30)
+        try:
+            count, version, pid = await executor.run(snapshot, count_places, 0)
+            assert count == 45 and version == snapshot.version and pid != os.getpid()
+
+            # 카탈로그가 바뀌면 새 스냅샷으로 워커를 다시 띄움
+            new_snapshot = PlaceCatalogSnapshot.from_places(places[:10])
+            count, version, _ = await executor.run(new_snapshot, count_places, 0)
+            assert count == 10 and version == new_snapshot.version
+        finally:
+            executor.shutdown()
+
+    async def test_process_rotation_drains_queued_jobs(self) -> None:
+        places = make_places()
+        old_snapshot = PlaceCatalogSnapshot.from_places(places)
+        new_snapshot = PlaceCatalogSnapshot.from_places(places[:10])
+        executor = RouteExecutor(kind="process", max_workers=1, max_pending=10, timeout_seconds=30)
+        try:
+            await executor.run(old_snapshot, count_places, 0)  # 워커를 먼저 띄워둠
+            queued = [asyncio.create_task(executor.run(old_snapshot, sleep_and_count, 0.1)) for _ in range(6)]
+            await asyncio.sleep(0.05)
+            assert executor.pending == 6
+            # 이전 풀에 작업이 쌓여 있는 동안 카탈로그 버전이 바뀜
+            assert await executor.run(new_snapshot, sleep_and_count, 0) == (10, new_snapshot.version)
+            # 이전 풀에 쌓인 작업도 취소되지 않고 이전 스냅샷으로 끝남
+            assert await asyncio.gather(*queued) == [(45, old_snapshot.version)] * 6
+            assert executor.stats()["pending"] == 0 and executor.stats()["errors"] == 0
+        finally:
+            executor.shutdown()
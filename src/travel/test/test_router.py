@@ -1,14 +1,20 @@
+from pathlib import Path
+from typing import AsyncGenerator
+
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from starlette.testclient import TestClient
 
 from src import Place, TravelRoute, TravelRoutePlace, User  # type: ignore
 from src.config.database.connection_async import get_async_session
 from src.main import app
+from src.travel.services.place_catalog import place_catalog
 from src.user.services.authentication import authenticate
 
+ROOT = Path(__file__).resolve().parents[3]
+
 
 @pytest_asyncio.fixture
 async def client() -> AsyncClient:  # type: ignore
@@ -56,6 +62,216 @@ class TestRouter:
     #     )
     #     assert response.status_code == 200
 
+    async def test_generate_travel_route_from_catalog(
+        self,
+        client: AsyncClient,
+        async_session: AsyncSession,
+        place_list_init: list[Place],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(place_catalog, "session_factory", async_sessionmaker(bind=async_session.bind))
+        await place_catalog.reload()  # 이전 테스트에서 캐시된 스냅샷을 버림
+        # 제주카트클럽 근처 식당이 적어서 끼니는 점심/저녁만 요청
+        response = await client.post(
+            "/api/v1/travelroute",
+            json={
+                "config": {
+                    "regions": ["서귀포시", "한림읍", "안덕면"],
+                    "themes": ["자연", "액티비티"],
+                    "schedule": {"breakfast": False, "morning": 1, "lunch": True, "afternoon": 2, "dinner": True},
+                }
+            },
+        )
+        assert response.status_code == 200
+        schedule = response.json()["schedule"]
+        place_ids = [schedule["lunch"], schedule["dinner"]]
+        place_ids += schedule["morning"] + schedule["afternoon"]
+        assert len({place["place_id"] for place in place_ids}) == 5
+
+        # 응답으로 받은 seed를 다시 보내면 같은 일정이 나옴
+        seed = response.json()["seed"]
+        replay = await client.post("/api/v1/travelroute", json={"config": response.json()["config"], "seed": seed})
+        assert replay.status_code == 200
+        assert replay.json() == response.json()
+
+    async def test_generate_travel_route_batch(
+        self,
+        client: AsyncClient,
+        async_session: AsyncSession,
+        place_list_init: list[Place],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(place_catalog, "session_factory", async_sessionmaker(bind=async_session.bind))
+        await place_catalog.reload()
+        response = await client.post(
+            "/api/v1/travelroute/batch",
+            json={
+                "config": {
+                    "regions": ["서귀포시", "한림읍", "안덕면"],
+                    "themes": ["자연", "액티비티"],
+                    "schedule": {"breakfast": False, "morning": 1, "lunch": False, "afternoon": 1, "dinner": False},
+                },
+                "count": 3,
+            },
+        )
+        assert response.status_code == 200
+        schedules = response.json()["schedules"]
+        assert 1 <= len(schedules) <= 3
+        keys = {(schedule["morning"][0]["place_id"], schedule["afternoon"][0]["place_id"]) for schedule in schedules}
+        assert len(keys) == len(schedules)
+
+        response = await client.post(
+            "/api/v1/travelroute/batch", json={"config": response.json()["config"], "count": 11}
+        )
+        assert response.status_code == 422
+
+    async def test_generate_multi_day_travel_route(
+        self,
+        client: AsyncClient,
+        async_session: AsyncSession,
+        place_list_init: list[Place],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(place_catalog, "session_factory", async_sessionmaker(bind=async_session.bind))
+        await place_catalog.reload()
+        config = {
+            "regions": ["서귀포시", "한림읍", "안덕면"],
+            "themes": ["자연", "액티비티"],
+            "schedule": {"breakfast": False, "morning": 1, "lunch": True, "afternoon": 0, "dinner": False},
+        }
+        response = await client.post("/api/v1/travelroute/days", json={"config": config, "days": 3, "seed": 5})
+        assert response.status_code == 200
+        schedules = response.json()["schedules"]
+        assert len(schedules) == 3
+        place_ids = [schedule["morning"][0]["place_id"] for schedule in schedules]
+        place_ids += [schedule["lunch"]["place_id"] for schedule in schedules if schedule["lunch"]]
+        assert len(set(place_ids)) == len(place_ids)
+        # 서쪽부터: 제주카트클럽(한림읍) -> 군산오름(안덕면) -> 서귀포 자연휴양림
+        assert place_ids[:3] == [3, 1, 2]
+
+        # 장소가 모자라면 400
+        response = await client.post("/api/v1/travelroute/days", json={"config": config, "days": 4})
+        assert response.status_code == 400
+
+    async def test_re_generator_pinned_places(
+        self,
+        client: AsyncClient,
+        async_session: AsyncSession,
+        place_list_init: list[Place],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        async def mock_session() -> AsyncGenerator[AsyncSession, None]:
+            yield async_session
+
+        app.dependency_overrides[get_async_session] = mock_session
+        monkeypatch.setattr(place_catalog, "session_factory", async_sessionmaker(bind=async_session.bind))
+        await place_catalog.reload()
+        # 캐시를 다시 읽기 전에 추가된 장소는 DB에서 한 번에 조회
+        new_place = Place(id=1000, name="새 장소", theme="자연", region="서귀포시", latitude=33.3, longitude=126.4)
+        async_session.add(new_place)
+        await async_session.commit()
+
+        def place_info(place: Place) -> dict[str, object]:
+            return {"place_id": place.id, "name": place.name, "latitude": place.latitude, "longitude": place.longitude}
+
+        config = {
+            "regions": ["서귀포시", "한림읍", "안덕면"],
+            "themes": ["자연", "액티비티"],
+            "schedule": {"breakfast": False, "morning": 2, "lunch": False, "afternoon": 1, "dinner": False},
+        }
+        response = await client.patch(
+            "/api/v1/travelroute",
+            json={
+                "config": config,
+                "schedule": {"morning": [place_info(place_list_init[0])], "afternoon": [place_info(new_place)]},
+            },
+        )
+        assert response.status_code == 200
+        schedule = response.json()["schedule"]
+        place_ids = {place["place_id"] for place in schedule["morning"] + schedule["afternoon"]}
+        assert {place_list_init[0].id, new_place.id} <= place_ids and len(place_ids) == 3
+
+        missing = {"place_id": 100000, "name": "없는 장소", "latitude": 0, "longitude": 0}
+        response = await client.patch(
+            "/api/v1/travelroute", json={"config": config, "schedule": {"morning": [missing]}}
+        )
+        assert response.status_code == 404
+        del app.dependency_overrides[get_async_session]
+
+    async def test_import_places(
+        self,
+        client: AsyncClient,
+        async_session: AsyncSession,
+        user_save_init: tuple[User, User],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        async def mock_session() -> AsyncGenerator[AsyncSession, None]:
+            yield async_session
+
+        async def mock_authenticate() -> str:
+            return user_save_init[0].id
+
+        app.dependency_overrides[get_async_session] = mock_session
+        app.dependency_overrides[authenticate] = mock_authenticate
+        monkeypatch.setattr(place_catalog, "session_factory", async_sessionmaker(bind=async_session.bind))
+        with open(ROOT / "자연.xlsx", "rb") as file:
+            content = file.read()
+        files = {"file": ("자연.xlsx", content)}
+
+        response = await client.post("/api/v1/travelroute/places/import", files=files)
+        assert response.status_code == 403
+
+        user_save_init[0].is_superuser = True
+        await async_session.commit()
+        response = await client.post("/api/v1/travelroute/places/import", files=files)
+        assert response.status_code == 200
+        report = response.json()
+        assert report["rows"] == 340 and report["inserted"] > 0 and report["updated"] == 0
+        # 불러온 뒤 장소 캐시를 다시 만듦
+        assert place_catalog.stats()["place_count"] == report["inserted"]
+
+        response = await client.post(
+            "/api/v1/travelroute/places/import", files={"file": ("places.xlsx", b"not a workbook")}
+        )
+        assert response.status_code == 400
+        del app.dependency_overrides[get_async_session]
+
+    async def test_stats_require_admin(
+        self,
+        client: AsyncClient,
+        async_session: AsyncSession,
+        user_save_init: tuple[User, User],
+    ) -> None:
+        async def mock_session() -> AsyncGenerator[AsyncSession, None]:
+            yield async_session
+
+        async def mock_authenticate() -> str:
+            return user_save_init[0].id
+
+        app.dependency_overrides[get_async_session] = mock_session
+        app.dependency_overrides.pop(authenticate, None)
+        paths = [
+            "/api/v1/travelroute/catalog/stats",
+            "/api/v1/travelroute/executor/stats",
+            "/api/v1/travelroute/cache/stats",
+        ]
+        for path in paths:
+            # 로그인하지 않은 요청
+            assert (await client.get(path)).status_code == 403
+
+        app.dependency_overrides[authenticate] = mock_authenticate
+        for path in paths:
+            response = await client.get(path)
+            assert response.status_code == 403
+            assert response.json()["detail"] == "Admin permission required"
+
+        user_save_init[0].is_superuser = True
+        await async_session.commit()
+        for path in paths:
+            assert (await client.get(path)).status_code == 200
+        del app.dependency_overrides[get_async_session]
+        del app.dependency_overrides[authenticate]
+
     async def test_save_travel_route(
         self, client: AsyncClient, user_save_init: tuple[User, User], place_list_init: list[Place]
     ) -> None:
@@ -98,6 +314,52 @@ class TestRouter:
         response = await client.get("/api/v1/travelroute?page=1&&size=3")
         assert response.status_code == 200
 
+    async def test_get_travel_routes_cursor(
+        self,
+        client: AsyncClient,
+        async_session: AsyncSession,
+        user_save_init: tuple[User, User],
+        place_list_init: list[Place],
+    ) -> None:
+        async def mock_authenticate() -> str:
+            return user_save_init[1].id
+
+        async def mock_session() -> AsyncGenerator[AsyncSession, None]:
+            # 테이블을 다시 만든 뒤 앱 엔진의 prepared statement 캐시가 깨지지 않도록 테스트 세션 사용
+            yield async_session
+
+        app.dependency_overrides[authenticate] = mock_authenticate
+        app.dependency_overrides[get_async_session] = mock_session
+        place = {"place_id": place_list_init[0].id, "name": "string", "latitude": 0, "longitude": 0}
+        for i in range(4):
+            await client.post(
+                url="/api/v1/travelroute/save",
+                json={
+                    "title": f"경로{i}",
+                    "schedule": {"morning": [place], "afternoon": [place]},
+                    "config": {
+                        "regions": ["제주시"],
+                        "themes": ["자연"],
+                        "schedule": {"breakfast": False, "morning": 1, "lunch": False, "afternoon": 1, "dinner": False},
+                    },
+                },
+            )
+        response = await client.get("/api/v1/travelroute?size=3")
+        first = response.json()
+        assert first["page"] == 1 and first["total_travel_routes"] == 4 and len(first["travel_list"]) == 3
+        assert first["next_cursor"]
+
+        response = await client.get(f"/api/v1/travelroute?size=3&cursor={first['next_cursor']}")
+        second = response.json()
+        assert second["page"] is None and second["total_travel_routes"] is None
+        assert len(second["travel_list"]) == 1 and second["next_cursor"] is None
+        titles = [route["title"] for route in first["travel_list"] + second["travel_list"]]
+        assert titles == ["경로3", "경로2", "경로1", "경로0"]
+
+        response = await client.get("/api/v1/travelroute?size=3&cursor=invalid")
+        assert response.status_code == 400
+        del app.dependency_overrides[get_async_session]
+
     # async def test_get_one_travel_route(
     #     self,
     #     client: AsyncClient,
@@ -0,0 +1,138 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.travel.dtos.base_travel_route import PlaceInfo
+from src.travel.models.place import Place
+from src.travel.services.generate_place_list import random_eating_place_list
+from src.travel.services.shortest_path_sort import (
+    cross_track_distance,
+    haversine,
+    haversine_one_to_many,
+    place_coordinates,
+)
+from src.travel.services.spatial_index import SpatialIndex
+
+
+def make_restaurants(n: int, seed: int = 0) -> list[Place]:
+    rng = random.Random(seed)
+    return [
+        Place(
+            id=i + 1,
+            name=f"식당{i}",
+            theme="식당",
+            region="제주시",
+            latitude=33.2 + rng.random() * 0.4,
+            longitude=126.2 + rng.random() * 0.7,
+        )
+        for i in range(n)
+    ]
+
+
+def slerp_points(lat1: float, lon1: float, lat2: float, lon2: float, n: int) -> list[tuple[float, float]]:
+    # 대원 선분 위의 점들 (구면 선형 보간)
+    a = np.array(
+        [np.cos(np.radians(lat1)) * np.cos(np.radians(lon1)), np.cos(np.radians(lat1)) * np.sin(np.radians(lon1))]
+        + [np.sin(np.radians(lat1))]
+    )
+    b = np.array(
+        [np.cos(np.radians(lat2)) * np.cos(np.radians(lon2)), np.cos(np.radians(lat2)) * np.sin(np.radians(lon2))]
+        + [np.sin(np.radians(lat2))]
+    )
+    omega = np.arccos(np.clip(a @ b, -1, 1))
+    points = []
+    for t in np.linspace(0, 1, n):
+        v = (np.sin((1 - t) * omega) * a + np.sin(t * omega) * b) / np.sin(omega)
+        points.append((float(np.degrees(np.arcsin(v[2]))), float(np.degrees(np.arctan2(v[1], v[0])))))
+    return points
+
+
+class TestCrossTrack:
+
+    def test_matches_dense_sampling(self) -> None:
+        restaurants = make_restaurants(100, seed=1)
+        lats, lons = place_coordinates(restaurants)
+        lat1, lon1, lat2, lon2 = 33.25, 126.3, 33.48, 126.8
+        distances = cross_track_distance(lat1, lon1, lat2, lon2, lats, lons)
+        points = slerp_points(lat1, lon1, lat2, lon2, 2000)
+        for lat, lon, distance in zip(lats, lons, distances):
+            expected = min(haversine(lat, lon, p_lat, p_lon) for p_lat, p_lon in points)
+            assert abs(distance - expected) < 0.05
+
+    def test_clamped_to_segment(self) -> None:
+        # 선분 연장선 위의 점은 가까운 끝점까지의 거리
+        distances = cross_track_distance(33.4, 126.4, 33.4, 126.6, np.array([33.4, 33.4]), np.array([126.3, 126.7]))
+        assert distances[0] == pytest.approx(haversine(33.4, 126.4, 33.4, 126.3))
+        assert distances[1] == pytest.approx(haversine(33.4, 126.6, 33.4, 126.7))
+
+
+class TestSpatialIndex:
+
+    def test_within_radius_matches_scan(self) -> None:
+        restaurants = make_restaurants(500)
+        index = SpatialIndex(restaurants)
+        lats, lons = place_coordinates(restaurants)
+        for lat, lon, radius in [(33.4, 126.5, 3), (33.25, 126.3, 7.5), (33.5, 126.9, 13)]:
+            distances = haversine_one_to_many(lat, lon, lats, lons)
+            expected = {restaurants[i].id for i in np.flatnonzero(distances <= radius)}
+            neighbors = index.within_radius(lat, lon, radius)
+            assert {neighbor.place.id for neighbor in neighbors} == expected
+            assert [neighbor.distance_km for neighbor in neighbors] == sorted(n.distance_km for n in neighbors)
+
+    def test_nearest(self) -> None:
+        restaurants = make_restaurants(200)
+        index = SpatialIndex(restaurants)
+        lats, lons = place_coordinates(restaurants)
+        distances = haversine_one_to_many(34.0, 127.5, lats, lons)  # 섬 밖의 먼 지점
+        expected = [restaurants[i].id for i in np.argsort(distances)[:3]]
+        assert [neighbor.place.id for neighbor in index.nearest(34.0, 127.5, k=3)] == expected
+        excluded = {expected[0]}
+        assert index.nearest(34.0, 127.5, exclude=excluded)[0].place.id == expected[1]
+        assert SpatialIndex([]).nearest(33.4, 126.5) == []
+
+    def test_near_segment(self) -> None:
+        restaurants = [
+            Place(id=1, name="선분 위", theme="식당", region="제주시", latitude=33.4, longitude=126.45),
+            Place(id=2, name="선분 근처", theme="식당", region="제주시", latitude=33.41, longitude=126.5),
+            Place(id=3, name="선분 끝 너머", theme="식당", region="제주시", latitude=33.4, longitude=126.7),
+            Place(id=4, name="멀리", theme="식당", region="제주시", latitude=33.3, longitude=126.5),
+        ]
+        index = SpatialIndex(restaurants)
+        neighbors = index.near_segment(33.4, 126.4, 33.4, 126.6, 2)
+        assert [neighbor.place.id for neighbor in neighbors] == [1, 2]
+
+
+class TestRandomEatingPlace:
+
+    def test_excluded_and_fallback(self) -> None:
+        restaurants = make_restaurants(5)
+        index = SpatialIndex(restaurants)
+        start_place = PlaceInfo(place_id=100, name="출발", latitude=33.4, longitude=126.5)
+        excluded: set[int] = set()
+        picked = [random_eating_place_list(start_place, None, index, excluded) for _ in range(5)]
+        assert len({place.id for place in picked if place}) == 5
+        assert random_eating_place_list(start_place, None, index, excluded) is None
+
+    def test_smallest_radius(self) -> None:
+        restaurants = [
+            Place(id=1, name="가까운 식당", theme="식당", region="제주시", latitude=33.4, longitude=126.52),
+            Place(id=2, name="먼 식당", theme="식당", region="제주시", latitude=33.4, longitude=126.6),
+        ]
+        index = SpatialIndex(restaurants)
+        start_place = PlaceInfo(place_id=100, name="출발", latitude=33.4, longitude=126.5)
+        for _ in range(10):
+            assert random_eating_place_list(start_place, None, index, set()).id == 1  # type: ignore
+
+    def test_lunch_on_the_way(self) -> None:
+        restaurants = [
+            Place(id=1, name="가는 길", theme="식당", region="제주시", latitude=33.401, longitude=126.55),
+            Place(id=2, name="반대 방향", theme="식당", region="제주시", latitude=33.4, longitude=126.45),
+        ]
+        index = SpatialIndex(restaurants)
+        morning = PlaceInfo(place_id=100, name="오전", latitude=33.4, longitude=126.5)
+        afternoon = PlaceInfo(place_id=101, name="오후", latitude=33.4, longitude=126.6)
+        for _ in range(10):
+            assert random_eating_place_list(morning, afternoon, index, set()).id == 1  # type: ignore
+        # 경로 근처 식당을 이미 골랐으면 반경 검색으로 넘어감
+        assert random_eating_place_list(morning, afternoon, index, {1}).id == 2  # type: ignore
@@ -0,0 +1,94 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.travel.models.place import Place
+from src.travel.services.shortest_path_sort import (
+    create_distance_matrix,
+    haversine,
+    haversine_matrix,
+    haversine_one_to_many,
+    route_distance,
+    select_tsp_solver,
+    solve_tsp,
+    solve_tsp_brute_force,
+    solve_tsp_held_karp,
+    solve_tsp_heuristic,
+    solve_tsp_ortools,
+)
+
+
+def make_distance_matrix(n: int, seed: int) -> list[list[float]]:
+    rng = random.Random(seed)
+    points = [(33.2 + rng.random() * 0.4, 126.2 + rng.random() * 0.7) for _ in range(n)]
+    return [[haversine(a[0], a[1], b[0], b[1]) for b in points] for a in points]
+
+
+class TestTspSolver:
+
+    @pytest.mark.parametrize("n", [1, 2, 3, 5, 7])
+    def test_held_karp_matches_brute_force(self, n: int) -> None:
+        for seed in range(5):
+            distance_matrix = make_distance_matrix(n, seed)
+            _, expected = solve_tsp_brute_force(distance_matrix)
+            route, distance = solve_tsp_held_karp(distance_matrix)
+            assert sorted(route) == list(range(n))
+            assert distance == pytest.approx(expected)
+            assert route_distance(distance_matrix, route) == pytest.approx(expected)
+
+    def test_heuristics_close_to_optimal(self) -> None:
+        for seed in range(5):
+            distance_matrix = make_distance_matrix(7, seed)
+            _, expected = solve_tsp_brute_force(distance_matrix)
+            for solver in (solve_tsp_heuristic, solve_tsp_ortools):
+                route, distance = solver(distance_matrix, 0.05)
+                assert sorted(route) == list(range(7))
+                assert distance == pytest.approx(route_distance(distance_matrix, route))
+                assert distance <= expected * 1.1
+
+    def test_heuristic_large(self) -> None:
+        distance_matrix = make_distance_matrix(40, 0)
+        route, distance = solve_tsp(distance_matrix, time_budget=0.2)
+        assert sorted(route) == list(range(40))
+        assert distance == pytest.approx(route_distance(distance_matrix, route))
+
+    def test_select_solver(self) -> None:
+        assert select_tsp_solver(7) == "brute_force"
+        assert select_tsp_solver(12) == "held_karp"
+        assert select_tsp_solver(16) == "heuristic"
+        with pytest.raises(ValueError):
+            solve_tsp(make_distance_matrix(3, 0), solver="unknown")
+
+
+class TestHaversine:
+
+    def test_matrix_matches_scalar(self) -> None:
+        rng = np.random.default_rng(0)
+        lats = 33.2 + rng.random(30) * 0.4
+        lons = 126.2 + rng.random(30) * 0.7
+        matrix = haversine_matrix(lats, lons)
+        assert matrix.shape == (30, 30)
+        assert np.allclose(matrix, matrix.T)
+        assert np.all(np.diag(matrix) == 0)
+        for i in range(30):
+            for j in range(30):
+                assert matrix[i, j] == pytest.approx(haversine(lats[i], lons[i], lats[j], lons[j]), abs=1e-9)
+        assert np.allclose(haversine_one_to_many(lats[3], lons[3], lats, lons), matrix[3])
+
+    def test_create_distance_matrix(self) -> None:
+        place_list = [
+            Place(id=1, name="군산오름", theme="자연", region="안덕면", latitude=33.253217, longitude=126.370693),
+            Place(
+                id=2,
+                name="서귀포 자연휴양림",
+                theme="자연",
+                region="서귀포시",
+                latitude=33.311453,
+                longitude=126.458861,
+            ),
+        ]
+        distance_matrix = create_distance_matrix(place_list)
+        assert isinstance(distance_matrix, list) and isinstance(distance_matrix[0], list)
+        assert distance_matrix[0][0] == 0
+        assert distance_matrix[0][1] == pytest.approx(haversine(33.253217, 126.370693, 33.311453, 126.458861))
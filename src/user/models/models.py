@@ -53,14 +53,15 @@ class User(SQLModel, table=True):
     )
 
     travel_routes: list["TravelRoute"] = Relationship(back_populates="user", sa_relationship_kwargs={"cascade": "all, delete-orphan"})  # type: ignore
+    # 사용자 조회마다 리뷰/좋아요/댓글을 함께 읽지 않도록 기본은 읽지 않음 (필요하면 로더를 명시)
     likes: list["Like"] = Relationship(
-        back_populates="user", sa_relationship_kwargs={"lazy": "joined", "cascade": "all, delete-orphan"}
+        back_populates="user", sa_relationship_kwargs={"lazy": "raise", "cascade": "all, delete-orphan"}
     )
     comments: list["Comment"] = Relationship(
-        back_populates="user", sa_relationship_kwargs={"lazy": "joined", "cascade": "all, delete-orphan"}
+        back_populates="user", sa_relationship_kwargs={"lazy": "raise", "cascade": "all, delete-orphan"}
     )
     review: Optional["Review"] = Relationship(
-        back_populates="user", sa_relationship_kwargs={"lazy": "joined", "cascade": "all, delete-orphan"}
+        back_populates="user", sa_relationship_kwargs={"lazy": "raise", "cascade": "all, delete-orphan"}
     )
 
     @staticmethod
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Body, Cookie, Depends, HTTPException, Response, s
 from fastapi.responses import RedirectResponse
 
 from src.config import settings
+from src.reviews.repo.review_repo import ReviewRepo
 from src.user.dtos.request import (
     RefreshTokenRequest,
     SignUpRequestBody,
@@ -190,6 +191,7 @@ async def update_user_handler(
 
     if update_data.new_password:
         user.update_password(password=update_data.new_password)
+    nickname_changed = bool(update_data.new_nickname) and update_data.new_nickname != user.nickname
     if update_data.new_nickname:
         user.nickname = update_data.new_nickname
     if update_data.new_birthday:
@@ -203,6 +205,9 @@ async def update_user_handler(
             user.gender = update_data.new_gender  # type:ignore
 
     await user_repo.save(user=user)
+    if nickname_changed:
+        # 캐시한 리뷰 상세에 이전 닉네임이 남지 않도록 이 사용자의 리뷰를 캐시에서 지움
+        await ReviewRepo(user_repo.session).invalidate_user_reviews(user_id)
     return UserMeResponse.model_validate(obj=user)
 
 